@@ -168,6 +168,9 @@ setup(
             "tqdm>=4.62.3, <5.0.0",
             "pandas>=1.1.3, <1.4.0",
         ],
+        "async": [
+            "httpx>=0.23.0, <1.0.0",
+        ],
         "docs": [
             "sphinx==4.4.0",
             "jinja2==3.0.3",
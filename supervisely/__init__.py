@@ -1,10 +1,34 @@
 # coding: utf-8
-import pkg_resources
-
-try:
-    __version__ = pkg_resources.require("supervisely")[0].version
-except TypeError as e:
-    __version__ = "development"
+"""
+Supervisely SDK. Public names are imported on first access (e.g. ``sly.Api`` imports
+:mod:`supervisely.api.api`), so ``import supervisely`` does not load web frameworks,
+medical imaging libraries and other heavy subsystems which are not used by the program.
+"""
+import importlib
+import os
+import pkgutil
+import sys
+import types
+
+
+def _get_version() -> str:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        # python 3.7
+        import pkg_resources
+
+        try:
+            return pkg_resources.require("supervisely")[0].version
+        except (TypeError, pkg_resources.DistributionNotFound):
+            return "development"
+    try:
+        return version("supervisely")
+    except PackageNotFoundError:
+        return "development"
+
+
+__version__ = _get_version()
 
 from supervisely.sly_logger import (
     logger,
@@ -17,28 +41,15 @@ from supervisely.sly_logger import (
     LOGGING_LEVELS,
 )
 
-from supervisely.function_wrapper import (
-    main_wrapper,
-    function_wrapper,
-    catch_silently,
-    function_wrapper_nofail,
-    function_wrapper_external_logger,
-)
-
+# light modules used by most of the SDK, their import order resolves circular imports between them
 from supervisely.io import fs
 from supervisely.io import env
 from supervisely.io import json
 from supervisely.io import network_exceptions
-from supervisely.io.fs_cache import FileCache
-
+from supervisely.io.fs_cache import FileCache, FileHashCache
 from supervisely.imaging import image
-
-# legacy
-# import supervisely.imaging.video as imagevideo
 from supervisely.imaging import color
-
 from supervisely.task.paths import TaskPaths
-
 from supervisely.task.progress import (
     epoch_float,
     Progress,
@@ -50,186 +61,284 @@ from supervisely.task.progress import (
     report_inference_finished,
 )
 
-
-import supervisely.project as project
-from supervisely.project.download import download
-from supervisely.project.project import (
-    Project,
-    OpenMode,
-    download_project,
-    read_single_project,
-    upload_project,
-    Dataset,
-)
-from supervisely.project.project_meta import ProjectMeta
-
-from supervisely.annotation.annotation import ANN_EXT, Annotation
-from supervisely.annotation.label import Label
-from supervisely.annotation.obj_class import ObjClass, ObjClassJsonFields
-from supervisely.annotation.obj_class_collection import ObjClassCollection
-from supervisely.annotation.tag_meta import TagMeta, TagValueType, TagApplicableTo
-from supervisely.annotation.tag import Tag
-from supervisely.annotation.tag_collection import TagCollection
-from supervisely.annotation.tag_meta_collection import TagMetaCollection
-
-from supervisely.geometry.bitmap import Bitmap
-from supervisely.geometry.cuboid import Cuboid
-from supervisely.geometry.point import Point
-from supervisely.geometry.point_location import PointLocation
-from supervisely.geometry.polygon import Polygon
-from supervisely.geometry.polyline import Polyline
-from supervisely.geometry.rectangle import Rectangle
-from supervisely.geometry.mask_3d import Mask3D
-from supervisely.geometry.any_geometry import AnyGeometry
-from supervisely.geometry.graph import GraphNodes, Node
-from supervisely.geometry.multichannel_bitmap import MultichannelBitmap
-
-from supervisely.geometry.helpers import geometry_to_bitmap
-from supervisely.geometry.helpers import deserialize_geometry
-
-from supervisely.export.pascal_voc import save_project_as_pascal_voc_detection
-
-from supervisely.metric.metric_base import MetricsBase
-from supervisely.metric.projects_applier import MetricProjectsApplier
-
-
-from supervisely.metric.iou_metric import IoUMetric
-from supervisely.metric.confusion_matrix_metric import ConfusionMatrixMetric
-from supervisely.metric.precision_recall_metric import PrecisionRecallMetric
-from supervisely.metric.classification_metrics import ClassificationMetrics
-from supervisely.metric.map_metric import MAPMetric
-
-from supervisely.worker_api.agent_api import AgentAPI
-from supervisely.worker_api.chunking import (
-    ChunkSplitter,
-    ChunkedFileWriter,
-    ChunkedFileReader,
-)
-import supervisely.worker_proto.worker_api_pb2 as api_proto
-
-from supervisely.api.api import Api
-from supervisely.api import api
-from supervisely.api.task_api import WaitingTimeExceeded, TaskFinishedWithError
-from supervisely.project.project_type import ProjectType
-from supervisely.api.report_api import NotificationType
-from supervisely.api.image_api import ImageInfo
-from supervisely.api.dataset_api import DatasetInfo
-from supervisely.api.project_api import ProjectInfo
-from supervisely.api.workspace_api import WorkspaceInfo
-from supervisely.api.team_api import TeamInfo
-
-from supervisely._utils import (
-    rand_str,
-    batched,
-    get_bytes_hash,
-    generate_names,
-    ENTERPRISE,
-    COMMUNITY,
-    _dprint,
-    take_with_default,
-    get_string_hash,
-    is_development,
-    is_production,
-    is_debug_with_sly_net,
-    compress_image_url,
-    get_datetime,
-    get_readable_datetime,
-    generate_free_name,
-)
-import supervisely._utils as utils
-from supervisely.tiny_timer import TinyTimer
-
-from supervisely.aug import aug
-from supervisely.video_annotation.key_id_map import KeyIdMap
-
-from supervisely.video_annotation.video_annotation import VideoAnnotation
-from supervisely.video_annotation.video_object import VideoObject
-from supervisely.video_annotation.video_object_collection import VideoObjectCollection
-from supervisely.video_annotation.video_figure import VideoFigure
-from supervisely.video_annotation.frame import Frame
-from supervisely.video_annotation.frame_collection import FrameCollection
-from supervisely.video_annotation.video_tag import VideoTag
-from supervisely.video_annotation.video_tag_collection import VideoTagCollection
-from supervisely.project.video_project import (
-    VideoDataset,
-    VideoProject,
-    download_video_project,
-    upload_video_project,
-)
-from supervisely.video import video
-
-import supervisely.labeling_jobs.utils as lj
-
-from supervisely.pointcloud import pointcloud
-from supervisely.pointcloud_episodes import pointcloud_episodes
-from supervisely.pointcloud_annotation.pointcloud_annotation import PointcloudAnnotation
-from supervisely.pointcloud_annotation.pointcloud_episode_annotation import (
-    PointcloudEpisodeAnnotation,
-)
-from supervisely.pointcloud_annotation.pointcloud_episode_frame import PointcloudEpisodeFrame
-from supervisely.pointcloud_annotation.pointcloud_episode_frame_collection import (
-    PointcloudEpisodeFrameCollection,
-)
-from supervisely.pointcloud_annotation.pointcloud_episode_tag import PointcloudEpisodeTag
-from supervisely.pointcloud_annotation.pointcloud_episode_tag_collection import (
-    PointcloudEpisodeTagCollection,
-)
-from supervisely.pointcloud_annotation.pointcloud_object import PointcloudObject
-from supervisely.pointcloud_annotation.pointcloud_figure import PointcloudFigure
-from supervisely.pointcloud_annotation.pointcloud_tag import PointcloudTag
-from supervisely.pointcloud_annotation.pointcloud_tag_collection import PointcloudTagCollection
-from supervisely.project.pointcloud_project import (
-    PointcloudDataset,
-    PointcloudProject,
-    download_pointcloud_project,
-)
-from supervisely.project.pointcloud_episode_project import (
-    PointcloudEpisodeDataset,
-    PointcloudEpisodeProject,
-    download_pointcloud_episode_project,
-)
-
-from supervisely.pyscripts_utils import utils as ps
-from supervisely.io import docker_utils
-
-import supervisely.app as app
-from supervisely.app.fastapi import Application
-from supervisely.app.v1.app_service import AppService
-import supervisely.nn as nn
-
-from supervisely.decorators.profile import timeit
-from supervisely.decorators.profile import update_fields
-from supervisely.decorators.inference import (
-    process_image_roi,
-    process_image_sliding_window,
-)
-
-import supervisely.script as script
-from supervisely.user.user import UserRoleName
-from supervisely.io import github_utils as git
-
-from supervisely.aug import imgaug_utils
-
-import supervisely.volume as volume
-from supervisely.volume_annotation.volume_annotation import VolumeAnnotation
-from supervisely.volume_annotation.volume_object import VolumeObject
-from supervisely.volume_annotation.volume_object_collection import (
-    VolumeObjectCollection,
-)
-from supervisely.volume_annotation.volume_figure import VolumeFigure
-from supervisely.volume_annotation.slice import Slice
-from supervisely.volume_annotation.plane import Plane
-from supervisely.project.volume_project import (
-    VolumeDataset,
-    VolumeProject,
-    download_volume_project,
-    upload_volume_project,
-)
-
-from supervisely.geometry.bitmap import SkeletonizeMethod
-
-import supervisely.team_files as team_files
-import supervisely.output as output
+# names of modules: {public name: module}
+_LAZY_MODULES = {
+    "project": "supervisely.project",
+    "api_proto": "supervisely.worker_proto.worker_api_pb2",
+    "api": "supervisely.api.api",
+    "utils": "supervisely._utils",
+    "aug": "supervisely.aug.aug",
+    "video": "supervisely.video.video",
+    "lj": "supervisely.labeling_jobs.utils",
+    "pointcloud": "supervisely.pointcloud.pointcloud",
+    "pointcloud_episodes": "supervisely.pointcloud_episodes.pointcloud_episodes",
+    "ps": "supervisely.pyscripts_utils.utils",
+    "docker_utils": "supervisely.io.docker_utils",
+    "app": "supervisely.app",
+    "nn": "supervisely.nn",
+    "script": "supervisely.script",
+    "git": "supervisely.io.github_utils",
+    "imgaug_utils": "supervisely.aug.imgaug_utils",
+    "volume": "supervisely.volume",
+    "team_files": "supervisely.team_files",
+    "output": "supervisely.output",
+}
+
+# names of classes and functions: {module: [public names]}
+_LAZY_ATTRIBUTES = {
+    "supervisely.function_wrapper": [
+        "main_wrapper",
+        "function_wrapper",
+        "catch_silently",
+        "function_wrapper_nofail",
+        "function_wrapper_external_logger",
+    ],
+    "supervisely.project.download": ["download"],
+    "supervisely.project.project": [
+        "Project",
+        "OpenMode",
+        "download_project",
+        "read_single_project",
+        "upload_project",
+        "sync_project",
+        "Dataset",
+    ],
+    "supervisely.project.project_meta": ["ProjectMeta"],
+    "supervisely.annotation.annotation": ["ANN_EXT", "Annotation"],
+    "supervisely.annotation.annotation_builder": ["AnnotationBuilder"],
+    "supervisely.annotation.label": ["Label"],
+    "supervisely.annotation.obj_class": ["ObjClass", "ObjClassJsonFields"],
+    "supervisely.annotation.obj_class_collection": ["ObjClassCollection"],
+    "supervisely.annotation.tag_meta": ["TagMeta", "TagValueType", "TagApplicableTo"],
+    "supervisely.annotation.tag": ["Tag"],
+    "supervisely.annotation.tag_collection": ["TagCollection"],
+    "supervisely.annotation.tag_meta_collection": ["TagMetaCollection"],
+    "supervisely.geometry.bitmap": ["Bitmap", "SkeletonizeMethod"],
+    "supervisely.geometry.cuboid": ["Cuboid"],
+    "supervisely.geometry.point": ["Point"],
+    "supervisely.geometry.point_location": ["PointLocation"],
+    "supervisely.geometry.polygon": ["Polygon"],
+    "supervisely.geometry.polyline": ["Polyline"],
+    "supervisely.geometry.rectangle": ["Rectangle"],
+    "supervisely.geometry.mask_3d": ["Mask3D"],
+    "supervisely.geometry.any_geometry": ["AnyGeometry"],
+    "supervisely.geometry.graph": ["GraphNodes", "Node"],
+    "supervisely.geometry.multichannel_bitmap": ["MultichannelBitmap"],
+    "supervisely.geometry.helpers": ["geometry_to_bitmap", "deserialize_geometry"],
+    "supervisely.export.pascal_voc": ["save_project_as_pascal_voc_detection"],
+    "supervisely.metric.metric_base": ["MetricsBase"],
+    "supervisely.metric.projects_applier": ["MetricProjectsApplier"],
+    "supervisely.metric.iou_metric": ["IoUMetric"],
+    "supervisely.metric.confusion_matrix_metric": ["ConfusionMatrixMetric"],
+    "supervisely.metric.precision_recall_metric": ["PrecisionRecallMetric"],
+    "supervisely.metric.classification_metrics": ["ClassificationMetrics"],
+    "supervisely.metric.map_metric": ["MAPMetric"],
+    "supervisely.worker_api.agent_api": ["AgentAPI"],
+    "supervisely.worker_api.chunking": [
+        "ChunkSplitter",
+        "ChunkedFileWriter",
+        "ChunkedFileReader",
+    ],
+    "supervisely.api.api": ["Api"],
+    "supervisely.api.async_api": ["AsyncApi"],
+    "supervisely.api.task_api": ["WaitingTimeExceeded", "TaskFinishedWithError"],
+    "supervisely.project.project_type": ["ProjectType"],
+    "supervisely.api.report_api": ["NotificationType"],
+    "supervisely.api.image_api": ["ImageInfo"],
+    "supervisely.api.dataset_api": ["DatasetInfo"],
+    "supervisely.api.project_api": ["ProjectInfo"],
+    "supervisely.api.workspace_api": ["WorkspaceInfo"],
+    "supervisely.api.team_api": ["TeamInfo"],
+    "supervisely._utils": [
+        "rand_str",
+        "batched",
+        "get_bytes_hash",
+        "generate_names",
+        "ENTERPRISE",
+        "COMMUNITY",
+        "_dprint",
+        "take_with_default",
+        "get_string_hash",
+        "is_development",
+        "is_production",
+        "is_debug_with_sly_net",
+        "compress_image_url",
+        "get_datetime",
+        "get_readable_datetime",
+        "generate_free_name",
+    ],
+    "supervisely.tiny_timer": ["TinyTimer"],
+    "supervisely.video_annotation.key_id_map": ["KeyIdMap"],
+    "supervisely.video_annotation.video_annotation": ["VideoAnnotation"],
+    "supervisely.video_annotation.video_object": ["VideoObject"],
+    "supervisely.video_annotation.video_object_collection": ["VideoObjectCollection"],
+    "supervisely.video_annotation.video_figure": ["VideoFigure"],
+    "supervisely.video_annotation.frame": ["Frame"],
+    "supervisely.video_annotation.frame_collection": ["FrameCollection"],
+    "supervisely.video_annotation.video_tag": ["VideoTag"],
+    "supervisely.video_annotation.video_tag_collection": ["VideoTagCollection"],
+    "supervisely.project.video_project": [
+        "VideoDataset",
+        "VideoProject",
+        "download_video_project",
+        "upload_video_project",
+    ],
+    "supervisely.pointcloud_annotation.pointcloud_annotation": ["PointcloudAnnotation"],
+    "supervisely.pointcloud_annotation.pointcloud_episode_annotation": [
+        "PointcloudEpisodeAnnotation"
+    ],
+    "supervisely.pointcloud_annotation.pointcloud_episode_frame": ["PointcloudEpisodeFrame"],
+    "supervisely.pointcloud_annotation.pointcloud_episode_frame_collection": [
+        "PointcloudEpisodeFrameCollection"
+    ],
+    "supervisely.pointcloud_annotation.pointcloud_episode_tag": ["PointcloudEpisodeTag"],
+    "supervisely.pointcloud_annotation.pointcloud_episode_tag_collection": [
+        "PointcloudEpisodeTagCollection"
+    ],
+    "supervisely.pointcloud_annotation.pointcloud_object": ["PointcloudObject"],
+    "supervisely.pointcloud_annotation.pointcloud_figure": ["PointcloudFigure"],
+    "supervisely.pointcloud_annotation.pointcloud_tag": ["PointcloudTag"],
+    "supervisely.pointcloud_annotation.pointcloud_tag_collection": ["PointcloudTagCollection"],
+    "supervisely.project.pointcloud_project": [
+        "PointcloudDataset",
+        "PointcloudProject",
+        "download_pointcloud_project",
+    ],
+    "supervisely.project.pointcloud_episode_project": [
+        "PointcloudEpisodeDataset",
+        "PointcloudEpisodeProject",
+        "download_pointcloud_episode_project",
+    ],
+    "supervisely.app.fastapi": ["Application"],
+    "supervisely.app.v1.app_service": ["AppService"],
+    "supervisely.decorators.profile": ["timeit", "update_fields"],
+    "supervisely.decorators.inference": [
+        "process_image_roi",
+        "process_image_sliding_window",
+    ],
+    "supervisely.user.user": ["UserRoleName"],
+    "supervisely.volume_annotation.volume_annotation": ["VolumeAnnotation"],
+    "supervisely.volume_annotation.volume_object": ["VolumeObject"],
+    "supervisely.volume_annotation.volume_object_collection": ["VolumeObjectCollection"],
+    "supervisely.volume_annotation.volume_figure": ["VolumeFigure"],
+    "supervisely.volume_annotation.slice": ["Slice"],
+    "supervisely.volume_annotation.plane": ["Plane"],
+    "supervisely.project.volume_project": [
+        "VolumeDataset",
+        "VolumeProject",
+        "download_volume_project",
+        "upload_volume_project",
+    ],
+}
+
+_LAZY_NAMES = {
+    **{name: (module, None) for name, module in _LAZY_MODULES.items()},
+    **{
+        name: (module, name)
+        for module, names in _LAZY_ATTRIBUTES.items()
+        for name in names
+    },
+}
+
+__all__ = [
+    "__version__",
+    "logger",
+    "ServiceType",
+    "EventType",
+    "add_logger_handler",
+    "add_default_logging_into_file",
+    "get_task_logger",
+    "change_formatters_default_values",
+    "LOGGING_LEVELS",
+    "fs",
+    "env",
+    "json",
+    "network_exceptions",
+    "FileCache",
+    "FileHashCache",
+    "image",
+    "color",
+    "TaskPaths",
+    "epoch_float",
+    "Progress",
+    "report_import_finished",
+    "report_dtl_finished",
+    "report_dtl_verification_finished",
+    "report_metrics_training",
+    "report_metrics_validation",
+    "report_inference_finished",
+    *_LAZY_NAMES,
+]
+
+
+def _import_lazy_name(name: str):
+    module_name, attr_name = _LAZY_NAMES[name]
+    module = importlib.import_module(module_name)
+    return module if attr_name is None else getattr(module, attr_name)
+
+
+# subpackages and submodules, e.g. sly.collection or sly.annotation, are imported on first access too
+_SUBMODULES = {module.name for module in pkgutil.iter_modules(__path__)}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        value = _import_lazy_name(name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    public_submodules = {name for name in _SUBMODULES if not name.startswith("_")}
+    return sorted(set(globals()) | set(_LAZY_NAMES) | public_submodules)
+
+
+def _is_initializing(module: types.ModuleType) -> bool:
+    # importlib sets this flag while the code of the module is being executed
+    return getattr(getattr(module, "__spec__", None), "_initializing", False)
+
+
+class _SubmoduleAlias:
+    """
+    Some public names have the same names as submodules, but point to other objects:
+    ``sly.video`` is ``supervisely.video.video`` module and ``sly.function_wrapper`` is a function
+    from ``supervisely.function_wrapper``. Importing the submodule sets it as the attribute
+    of this package, so the public name has priority over it, except while the aliased
+    module is being imported, so ``import supervisely.video.x as x`` statements in it work.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, package, owner=None):
+        if package is None:
+            return self
+        module = sys.modules.get(_LAZY_NAMES[self.name][0])
+        if module is not None and _is_initializing(module):
+            return package.__dict__.get(self.name, module)
+        return _import_lazy_name(self.name)
+
+    def __set__(self, package, value):
+        package.__dict__[self.name] = value
+
+
+class _LazyPackage(types.ModuleType):
+    pass
+
+
+for _name, (_module_name, _attr_name) in _LAZY_NAMES.items():
+    _submodule_path = os.path.join(os.path.dirname(__file__), _name)
+    if (_module_name, _attr_name) != (f"{__name__}.{_name}", None) and (
+        os.path.isdir(_submodule_path) or os.path.isfile(_submodule_path + ".py")
+    ):
+        setattr(_LazyPackage, _name, _SubmoduleAlias(_name))
+del _name, _module_name, _attr_name, _submodule_path
+
+sys.modules[__name__].__class__ = _LazyPackage
 
 # monkey patching
 import tqdm
@@ -13,8 +13,16 @@ from datetime import datetime
 import time
 
 import copy
-from typing import Optional
-from supervisely.io import fs as sly_fs
+import importlib
+import itertools
+import pkgutil
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, Optional
 from supervisely.sly_logger import logger
 
 random.seed(time.time())
@@ -26,6 +34,9 @@ def rand_str(length):
 
 
 def generate_free_name(used_names, possible_name, with_ext=False, extend_used_names=False):
+    # io.fs imports this module, so it is imported here to avoid circular import
+    from supervisely.io import fs as sly_fs
+
     res_name = possible_name
     new_suffix = 1
     while res_name in set(used_names):
@@ -44,6 +55,8 @@ def generate_free_name(used_names, possible_name, with_ext=False, extend_used_na
 
 
 def generate_names(base_name, count):
+    from supervisely.io import fs as sly_fs
+
     name = sly_fs.get_file_name(base_name)
     ext = sly_fs.get_file_ext(base_name)
 
@@ -68,6 +81,110 @@ def batched(seq, batch_size=50):
         yield seq[i : i + batch_size]
 
 
+def batched_iter(iterable: Iterable, batch_size: Optional[int] = 50) -> Iterator[list]:
+    """
+    Same as :func:`batched`, but lazily takes elements from any iterable (e.g. generator),
+    so the first batches can be processed before the rest of elements are produced.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if len(batch) == 0:
+            return
+        yield batch
+
+
+def concurrent_map(
+    func: Callable, items: Iterable, num_workers: Optional[int] = 1
+) -> Iterator:
+    """
+    Lazily apply ``func`` to every element of ``items`` in a thread pool and yield
+    results in the order of ``items``. At most ``num_workers`` calls are in flight,
+    so results are produced while the next ones are still being computed.
+    With ``num_workers`` <= 1 calls are made sequentially in the calling thread.
+    """
+    if num_workers is None or num_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    items = iter(items)
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= num_workers:
+                break
+        while len(pending) > 0:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+_PREFETCH_END = object()
+
+
+def prefetch_iterator(items: Iterable, buffer_size: Optional[int] = 1) -> Iterator:
+    """
+    Iterate over ``items`` in a background thread keeping at most ``buffer_size``
+    produced elements ahead of the consumer, e.g. to decode or download the next
+    elements while the current one is processed. Exceptions raised while producing
+    elements are re-raised in the consumer. With ``buffer_size`` < 1 items are iterated
+    in the calling thread.
+    """
+    if buffer_size is None or buffer_size < 1:
+        yield from items
+        return
+
+    buffer = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def _put(value):
+        while not stop.is_set():
+            try:
+                buffer.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not _put((item, None)):
+                    return
+            _put((_PREFETCH_END, None))
+        except Exception as e:
+            _put((_PREFETCH_END, e))
+        finally:
+            # generators are closed in the thread that iterates them
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if item is _PREFETCH_END:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 def get_bytes_hash(bytes):
     return base64.b64encode(hashlib.sha256(bytes).digest()).decode("utf-8")
 
@@ -209,3 +326,29 @@ def get_readable_datetime(value: str) -> str:
     if dt is None:
         return None
     return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def lazy_submodules(package_name: str) -> Callable[[str], ModuleType]:
+    """
+    Make module ``__getattr__`` for a package, which imports its submodules on first access,
+    so ``sly.geometry.bitmap`` works without ``import supervisely.geometry.bitmap``.
+    Usage in ``__init__.py`` of the package: ``__getattr__ = lazy_submodules(__name__)``.
+    """
+    package_path = sys.modules[package_name].__path__
+    submodules = {module.name for module in pkgutil.iter_modules(package_path)}
+
+    def __getattr__(name: str) -> ModuleType:
+        if name not in submodules:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        return importlib.import_module(f"{package_name}.{name}")
+
+    return __getattr__
+
+
+def __getattr__(name: str):
+    # supervisely.io.fs imports this module, so "sly_fs" alias is imported on first access
+    if name == "sly_fs":
+        from supervisely.io import fs as sly_fs
+
+        return sly_fs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -523,7 +523,16 @@ class Annotation:
             ann_clone_2 = ann.clone(labels=[label_kiwi], img_tags=tags, img_description='Juicy')
 
         """
-        return Annotation(
+        # labels of the current annotation are already cropped to the image size,
+        # they are validated again only if the image size is changed
+        same_size = img_size is None or tuple(img_size) == self.img_size
+        reuse_labels = same_size and labels is None
+        reuse_scores = same_size and pixelwise_scores_labels is None
+        if reuse_labels:
+            labels = []
+        if reuse_scores:
+            pixelwise_scores_labels = []
+        res = Annotation(
             img_size=take_with_default(img_size, self.img_size),
             labels=take_with_default(labels, self.labels),
             img_tags=take_with_default(img_tags, self.img_tags),
@@ -534,6 +543,27 @@ class Annotation:
             custom_data=take_with_default(custom_data, self.custom_data),
             image_id=take_with_default(image_id, self.image_id),
         )
+        if reuse_labels:
+            res._labels = self._labels.copy()
+        if reuse_scores:
+            res._pixelwise_scores_labels = self._pixelwise_scores_labels.copy()
+        return res
+
+    def _clone_with_valid_labels(
+        self,
+        labels: Optional[List[Label]] = None,
+        pixelwise_scores_labels: Optional[List[Label]] = None,
+    ) -> Annotation:
+        """
+        Clones Annotation with given labels that are already cropped to the image size
+        (e.g. by :meth:`_add_labels_impl`), so they are not cropped again.
+        """
+        res = self.clone()
+        if labels is not None:
+            res._labels = labels
+        if pixelwise_scores_labels is not None:
+            res._pixelwise_scores_labels = pixelwise_scores_labels
+        return res
 
     def _add_labels_impl(self, dest, labels):
         """
@@ -542,15 +572,15 @@ class Annotation:
         :param labels: list of the Label class objects to be added to the destination list
         :return: list of the Label class objects
         """
-        for label in labels:
-            if self.img_size.count(None) == 0:
-                # image has resolution in DB
-                canvas_rect = Rectangle.from_size(self.img_size)
+        if self.img_size.count(None) == 0:
+            # image has resolution in DB
+            canvas_rect = Rectangle.from_size(self.img_size)
+            for label in labels:
                 dest.extend(label.crop(canvas_rect))
-            else:
-                # image was uploaded by link and does not have resolution in DB
-                # add label without normalization and validation
-                dest.append(label)
+        else:
+            # image was uploaded by link and does not have resolution in DB
+            # add label without normalization and validation
+            dest.extend(labels)
 
     def add_label(self, label: Label) -> Annotation:
         """
@@ -605,9 +635,9 @@ class Annotation:
             # Remember that Annotation object is immutable, and we need to assign new instance of Annotation to a new variable
             new_ann = ann.add_labels([label_kiwi, label_lemon])
         """
-        new_labels = []
+        new_labels = self._labels.copy()
         self._add_labels_impl(new_labels, labels)
-        return self.clone(labels=[*self._labels, *new_labels])
+        return self._clone_with_valid_labels(labels=new_labels)
 
     def delete_label(self, label: Label) -> Annotation:
         """
@@ -652,7 +682,7 @@ class Annotation:
             raise KeyError(
                 "Trying to delete a non-existing label of class: {}".format(label.obj_class.name)
             )
-        return self.clone(labels=retained_labels)
+        return self._clone_with_valid_labels(labels=retained_labels)
 
     def add_pixelwise_score_label(self, label: Label) -> Annotation:
         """
@@ -669,9 +699,9 @@ class Annotation:
         :param labels: list of the Label class objects to be added
         :return: Annotation class object with the new list of the pixelwise_scores_labels
         """
-        new_labels = []
+        new_labels = self._pixelwise_scores_labels.copy()
         self._add_labels_impl(new_labels, labels)
-        return self.clone(pixelwise_scores_labels=[*self._pixelwise_scores_labels, *new_labels])
+        return self._clone_with_valid_labels(pixelwise_scores_labels=new_labels)
 
     def add_tag(self, tag: Tag) -> Annotation:
         """
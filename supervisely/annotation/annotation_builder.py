@@ -0,0 +1,176 @@
+# coding: utf-8
+"""mutable builder of annotation for a single image"""
+
+# docs
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from supervisely.annotation.annotation import Annotation
+from supervisely.annotation.label import Label
+from supervisely.annotation.tag import Tag
+from supervisely.annotation.tag_collection import TagCollection
+
+
+class AnnotationBuilder:
+    """
+    Mutable builder of :class:`Annotation<supervisely.annotation.annotation.Annotation>`.
+    :class:`Annotation` is immutable and every :meth:`Annotation.add_label` call creates a new
+    object, so adding many labels one by one is slow. Builder collects labels in place,
+    every label is cropped to the image bounds only once when it is added,
+    and :meth:`build` creates :class:`Annotation` without validating labels again.
+
+    :param img_size: Size of the image (height, width).
+    :type img_size: Tuple[int, int] or List[int, int]
+    :param img_tags: TagCollection object or list of Tag objects.
+    :type img_tags: TagCollection or List[Tag], optional
+    :param img_description: Image description.
+    :type img_description: str, optional
+    :param custom_data: Custom data.
+    :type custom_data: dict, optional
+    :param image_id: Id of the image.
+    :type image_id: int, optional
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+
+        class_kiwi = sly.ObjClass('kiwi', sly.Rectangle)
+
+        builder = sly.AnnotationBuilder((300, 400))
+        for i in range(1000):
+            builder.add_label(sly.Label(sly.Rectangle(i % 300, 0, 300, 500), class_kiwi))
+
+        ann = builder.build()
+        print(len(ann.labels))
+        # Output: 1000
+    """
+
+    def __init__(
+        self,
+        img_size: Union[Tuple[int, int], Tuple[None, None]],
+        img_tags: Optional[Union[TagCollection, List[Tag]]] = None,
+        img_description: Optional[str] = "",
+        custom_data: Optional[Dict] = None,
+        image_id: Optional[int] = None,
+    ):
+        # annotation without labels holds all the other fields and validates them
+        self._ann = Annotation(
+            img_size,
+            img_tags=img_tags,
+            img_description=img_description,
+            custom_data=custom_data,
+            image_id=image_id,
+        )
+        self._labels = []
+        self._pixelwise_scores_labels = []
+
+    @classmethod
+    def from_annotation(cls, ann: Annotation) -> AnnotationBuilder:
+        """
+        Creates builder with all fields and labels of the given Annotation.
+
+        :param ann: Annotation object.
+        :type ann: Annotation
+        :return: AnnotationBuilder object
+        :rtype: :class:`AnnotationBuilder`
+        :Usage example:
+
+         .. code-block:: python
+
+            builder = sly.AnnotationBuilder.from_annotation(ann)
+            builder.add_labels(new_labels)
+            new_ann = builder.build()
+        """
+        builder = cls(ann.img_size)
+        builder._ann = ann.clone(labels=[], pixelwise_scores_labels=[])
+        # labels of the annotation are already cropped to the image size
+        builder._labels = ann.labels
+        builder._pixelwise_scores_labels = ann.pixelwise_scores_labels
+        return builder
+
+    @property
+    def img_size(self) -> Tuple[int, int]:
+        """Size of the image (height, width)."""
+        return self._ann.img_size
+
+    @property
+    def labels(self) -> List[Label]:
+        """Copy of list with added labels."""
+        return self._labels.copy()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add_label(self, label: Label) -> AnnotationBuilder:
+        """
+        Crops Label to the image bounds and adds it to the builder.
+
+        :param label: Label to be added.
+        :type label: Label
+        :return: The same builder
+        :rtype: :class:`AnnotationBuilder`
+        """
+        return self.add_labels([label])
+
+    def add_labels(self, labels: List[Label]) -> AnnotationBuilder:
+        """
+        Crops Labels to the image bounds and adds them to the builder.
+
+        :param labels: List of Label objects to be added.
+        :type labels: List[Label]
+        :return: The same builder
+        :rtype: :class:`AnnotationBuilder`
+        """
+        self._ann._add_labels_impl(self._labels, labels)
+        return self
+
+    def add_pixelwise_score_labels(self, labels: List[Label]) -> AnnotationBuilder:
+        """
+        Crops Labels to the image bounds and adds them to the pixelwise scores labels.
+
+        :param labels: List of Label objects to be added.
+        :type labels: List[Label]
+        :return: The same builder
+        :rtype: :class:`AnnotationBuilder`
+        """
+        self._ann._add_labels_impl(self._pixelwise_scores_labels, labels)
+        return self
+
+    def add_tag(self, tag: Tag) -> AnnotationBuilder:
+        """
+        Adds image Tag.
+
+        :param tag: Tag object.
+        :type tag: Tag
+        :return: The same builder
+        :rtype: :class:`AnnotationBuilder`
+        """
+        self._ann = self._ann.add_tag(tag)
+        return self
+
+    def add_tags(self, tags: List[Tag]) -> AnnotationBuilder:
+        """
+        Adds image Tags.
+
+        :param tags: List of Tag objects.
+        :type tags: List[Tag]
+        :return: The same builder
+        :rtype: :class:`AnnotationBuilder`
+        """
+        self._ann = self._ann.add_tags(tags)
+        return self
+
+    def build(self) -> Annotation:
+        """
+        Creates Annotation with all added labels and tags. Builder can be used further,
+        already built annotations are not affected.
+
+        :return: New instance of Annotation
+        :rtype: :class:`Annotation<supervisely.annotation.annotation.Annotation>`
+        """
+        return self._ann._clone_with_valid_labels(
+            labels=self._labels.copy(),
+            pixelwise_scores_labels=self._pixelwise_scores_labels.copy(),
+        )
@@ -474,7 +474,7 @@ class LabelBase:
                 result_geometries[0]._copy_creation_info_inplace(self.geometry)
                 return [self.clone(geometry=result_geometries[0])]
             else:
-                return [self.clone(geometry=g) for g in self.geometry.crop(rect)]
+                return [self.clone(geometry=g) for g in result_geometries]
 
     def relative_crop(self, rect: Rectangle) -> List[LabelBase]:
         """
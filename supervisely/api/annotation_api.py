@@ -4,15 +4,90 @@
 # docs
 from __future__ import annotations
 import json
-from typing import List, Optional, NamedTuple, Dict, Callable, Union
+import threading
+import time
+from typing import Any, Iterable, Iterator, List, Optional, NamedTuple, Dict, Callable, Tuple, Union
+
+import requests
 from supervisely.task.progress import Progress
 from supervisely.annotation.label import Label
 
 from supervisely.annotation.annotation import Annotation
 from supervisely.api.module_api import ApiField, ModuleApi
-from supervisely._utils import batched
+from supervisely._utils import batched, concurrent_map
+from supervisely.sly_logger import logger
 from tqdm import tqdm
 
+# serialized size of annotations sent or received in one bulk request,
+# it is tuned between min and max values to keep requests close to the target latency
+DEFAULT_BATCH_SIZE_BYTES = 8 * 1024 * 1024
+MIN_BATCH_SIZE_BYTES = 256 * 1024
+MAX_BATCH_SIZE_BYTES = 64 * 1024 * 1024
+MAX_BATCH_SIZE = 200
+TARGET_BATCH_LATENCY_SEC = 5.0
+
+
+class _PayloadBatcher:
+    """
+    Groups items into batches limited by their serialized size in bytes. The limit grows while
+    requests are faster than the target latency and shrinks when they are slower or fail.
+    If size of items is not known in advance (e.g. for downloads), it is estimated
+    by the size of previous responses.
+    """
+
+    def __init__(
+        self,
+        batch_size_bytes: int = DEFAULT_BATCH_SIZE_BYTES,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        target_latency: float = TARGET_BATCH_LATENCY_SEC,
+    ):
+        self.batch_size_bytes = batch_size_bytes
+        self.max_batch_size = max_batch_size
+        self.target_latency = target_latency
+        # first batch of downloads contains 50 items, as it was before adaptive batching
+        self.item_size = batch_size_bytes // 50
+        self._lock = threading.Lock()
+
+    def batches(
+        self, items: Iterable, get_size: Optional[Callable[[Any], int]] = None
+    ) -> Iterator[List]:
+        batch, batch_bytes = [], 0
+        for item in items:
+            size = self.item_size if get_size is None else get_size(item)
+            if len(batch) > 0 and (
+                batch_bytes + size > self.batch_size_bytes or len(batch) >= self.max_batch_size
+            ):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(item)
+            batch_bytes += size
+        if len(batch) > 0:
+            yield batch
+
+    def update(self, num_items: int, payload_bytes: int, elapsed: float) -> None:
+        with self._lock:
+            self.item_size = max(1, payload_bytes / num_items)
+            ratio = min(2.0, max(0.5, self.target_latency / max(elapsed, 1e-3)))
+            # small batches (e.g. the last one) are not representative to grow the limit
+            if ratio < 1 or payload_bytes >= self.batch_size_bytes / 2:
+                self.batch_size_bytes = int(
+                    min(MAX_BATCH_SIZE_BYTES, max(MIN_BATCH_SIZE_BYTES, self.batch_size_bytes * ratio))
+                )
+
+    def shrink(self, payload_bytes: int) -> None:
+        with self._lock:
+            self.batch_size_bytes = int(
+                max(MIN_BATCH_SIZE_BYTES, min(self.batch_size_bytes, payload_bytes) / 2)
+            )
+
+
+def _is_payload_error(exc: Exception) -> bool:
+    """Whether request may succeed with smaller payload: 413 Payload Too Large or retries exceeded (e.g. timeouts)."""
+    if isinstance(exc, requests.exceptions.RetryError):
+        return True
+    response = getattr(exc, "response", None)
+    return isinstance(exc, requests.exceptions.HTTPError) and response is not None and response.status_code == 413
+
 
 class AnnotationInfo(NamedTuple):
     """
@@ -348,9 +423,11 @@ class AnnotationApi(ModuleApi):
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         with_custom_data: Optional[bool] = False,
         force_metadata_for_links: Optional[bool] = True,
+        num_workers: Optional[int] = 4,
     ) -> List[AnnotationInfo]:
         """
         Get list of AnnotationInfos for given dataset ID from API.
+        Number of annotations in one request is adjusted by the size of received annotations.
 
         :param dataset_id: Dataset ID in Supervisely.
         :type dataset_id: int
@@ -358,6 +435,8 @@ class AnnotationApi(ModuleApi):
         :type image_ids: List[int]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm
+        :param num_workers: Max number of requests sent concurrently.
+        :type num_workers: int, optional
         :return: Information about Annotations. See :class:`info_sequence<info_sequence>`
         :rtype: :class:`List[AnnotationInfo]`
 
@@ -380,20 +459,29 @@ class AnnotationApi(ModuleApi):
             # {"message": "progress", "event_type": "EventType.PROGRESS", "subtask": "Annotations downloaded: ", "current": 0, "total": 2, "timestamp": "2021-03-16T15:20:06.168Z", "level": "info"}
             # {"message": "progress", "event_type": "EventType.PROGRESS", "subtask": "Annotations downloaded: ", "current": 2, "total": 2, "timestamp": "2021-03-16T15:20:06.510Z", "level": "info"}
         """
-        id_to_ann = {}
-        for batch in batched(image_ids):
-            post_data = {
+        def _get_post_data(batch):
+            return {
                 ApiField.DATASET_ID: dataset_id,
                 ApiField.IMAGE_IDS: batch,
                 ApiField.WITH_CUSTOM_DATA: with_custom_data,
                 ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
             }
-            results = self._api.post("annotations.bulk.info", data=post_data).json()
-            for ann_dict in results:
-                ann_info = self._convert_json_info(ann_dict)
-                id_to_ann[ann_info.image_id] = ann_info
-            if progress_cb is not None:
-                progress_cb(len(batch))
+
+        batcher = _PayloadBatcher()
+        id_to_ann = {}
+        for responses in concurrent_map(
+            lambda batch: self._post_adaptive_batch(
+                "annotations.bulk.info", batch, _get_post_data, batcher
+            ),
+            batcher.batches(image_ids),
+            num_workers=num_workers,
+        ):
+            for batch, response in responses:
+                for ann_dict in response.json():
+                    ann_info = self._convert_json_info(ann_dict)
+                    id_to_ann[ann_info.image_id] = ann_info
+                if progress_cb is not None:
+                    progress_cb(len(batch))
         ordered_results = [id_to_ann[image_id] for image_id in image_ids]
         return ordered_results
 
@@ -403,6 +491,7 @@ class AnnotationApi(ModuleApi):
         image_ids: List[int],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         force_metadata_for_links: Optional[bool] = True,
+        num_workers: Optional[int] = 4,
     ) -> List[Dict]:
         """
         Get list of AnnotationInfos for given dataset ID from API.
@@ -413,6 +502,8 @@ class AnnotationApi(ModuleApi):
         :type image_ids: List[int]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm
+        :param num_workers: Max number of requests sent concurrently.
+        :type num_workers: int, optional
         :return: Information about Annotations. See :class:`info_sequence<info_sequence>`
         :rtype: :class:`List[Dict]`
 
@@ -440,6 +531,7 @@ class AnnotationApi(ModuleApi):
             image_ids=image_ids,
             progress_cb=progress_cb,
             force_metadata_for_links=force_metadata_for_links,
+            num_workers=num_workers,
         )
         return [ann_info.annotation for ann_info in results]
 
@@ -481,6 +573,8 @@ class AnnotationApi(ModuleApi):
         ann_paths: List[str],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         skip_bounds_validation: Optional[bool] = False,
+        dataset_id: Optional[int] = None,
+        num_workers: Optional[int] = 4,
     ) -> None:
         """
         Loads an annotations from a given paths to a given images IDs in the API. Images IDs must be from one dataset.
@@ -491,6 +585,10 @@ class AnnotationApi(ModuleApi):
         :type ann_paths: List[str]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param dataset_id: ID of the dataset with the images. If not given, it is requested from the server.
+        :type dataset_id: int, optional
+        :param num_workers: Max number of requests sent concurrently.
+        :type num_workers: int, optional
         :return: None
         :rtype: :class:`NoneType`
 
@@ -519,6 +617,8 @@ class AnnotationApi(ModuleApi):
             ann_paths,
             progress_cb,
             skip_bounds_validation=skip_bounds_validation,
+            dataset_id=dataset_id,
+            num_workers=num_workers,
         )
 
     def upload_json(
@@ -558,6 +658,8 @@ class AnnotationApi(ModuleApi):
         ann_jsons: List[Dict],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         skip_bounds_validation: Optional[bool] = False,
+        dataset_id: Optional[int] = None,
+        num_workers: Optional[int] = 4,
     ) -> None:
         """
         Loads an annotations from dicts to a given images IDs in the API. Images IDs must be from one dataset.
@@ -568,6 +670,10 @@ class AnnotationApi(ModuleApi):
         :type ann_jsons: List[dict]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param dataset_id: ID of the dataset with the images. If not given, it is requested from the server.
+        :type dataset_id: int, optional
+        :param num_workers: Max number of requests sent concurrently.
+        :type num_workers: int, optional
         :return: None
         :rtype: :class:`NoneType`
 
@@ -590,6 +696,8 @@ class AnnotationApi(ModuleApi):
             ann_jsons,
             progress_cb,
             skip_bounds_validation=skip_bounds_validation,
+            dataset_id=dataset_id,
+            num_workers=num_workers,
         )
 
     def upload_ann(
@@ -629,6 +737,8 @@ class AnnotationApi(ModuleApi):
         anns: List[Annotation],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         skip_bounds_validation: Optional[bool] = False,
+        dataset_id: Optional[int] = None,
+        num_workers: Optional[int] = 4,
     ) -> None:
         """
         Loads an :class:`Annotations<supervisely.annotation.annotation.Annotation>` to a given images IDs in the API. Images IDs must be from one dataset.
@@ -639,6 +749,10 @@ class AnnotationApi(ModuleApi):
         :type anns: List[Annotation]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param dataset_id: ID of the dataset with the images. If not given, it is requested from the server.
+        :type dataset_id: int, optional
+        :param num_workers: Max number of requests sent concurrently.
+        :type num_workers: int, optional
         :return: None
         :rtype: :class:`NoneType`
 
@@ -662,6 +776,8 @@ class AnnotationApi(ModuleApi):
             anns,
             progress_cb,
             skip_bounds_validation=skip_bounds_validation,
+            dataset_id=dataset_id,
+            num_workers=num_workers,
         )
 
     def _upload_batch(
@@ -671,6 +787,8 @@ class AnnotationApi(ModuleApi):
         anns,
         progress_cb=None,
         skip_bounds_validation: Optional[bool] = False,
+        dataset_id: Optional[int] = None,
+        num_workers: Optional[int] = 4,
     ):
         """
         _upload_batch
@@ -683,24 +801,91 @@ class AnnotationApi(ModuleApi):
                 'Can not match "img_ids" and "anns" lists, len(img_ids) != len(anns)'
             )
 
-        dataset_id = self._api.image.get_info_by_id(
-            img_ids[0], force_metadata_for_links=False
-        ).dataset_id
-        for batch in batched(list(zip(img_ids, anns))):
-            data = [
-                {ApiField.IMAGE_ID: img_id, ApiField.ANNOTATION: func_ann_to_json(ann)}
-                for img_id, ann in batch
-            ]
-            self._api.post(
+        if dataset_id is None:
+            dataset_id = self._api.image.get_info_by_id(
+                img_ids[0], force_metadata_for_links=False
+            ).dataset_id
+
+        def _to_sized_json(img_id, ann):
+            ann_json = func_ann_to_json(ann)
+            return img_id, ann_json, len(json.dumps(ann_json))
+
+        def _get_post_data(batch):
+            return {
+                ApiField.DATASET_ID: dataset_id,
+                ApiField.ANNOTATIONS: [
+                    {ApiField.IMAGE_ID: img_id, ApiField.ANNOTATION: ann_json}
+                    for img_id, ann_json, _ in batch
+                ],
+                ApiField.SKIP_BOUNDS_VALIDATION: skip_bounds_validation,
+            }
+
+        def _get_size(item):
+            return item[2]
+
+        # annotations are converted lazily, so only batches in flight are kept in memory
+        batcher = _PayloadBatcher()
+        items = (_to_sized_json(img_id, ann) for img_id, ann in zip(img_ids, anns))
+        for responses in concurrent_map(
+            lambda batch: self._post_adaptive_batch(
                 "annotations.bulk.add",
-                data={
-                    ApiField.DATASET_ID: dataset_id,
-                    ApiField.ANNOTATIONS: data,
-                    ApiField.SKIP_BOUNDS_VALIDATION: skip_bounds_validation,
-                },
+                batch,
+                _get_post_data,
+                batcher,
+                get_size=_get_size,
+            ),
+            batcher.batches(items, get_size=_get_size),
+            num_workers=num_workers,
+        ):
+            for batch, _ in responses:
+                if progress_cb is not None:
+                    progress_cb(len(batch))
+
+    def _post_adaptive_batch(
+        self,
+        method: str,
+        batch: List,
+        get_post_data: Callable[[List], Dict],
+        batcher: _PayloadBatcher,
+        get_size: Optional[Callable[[Any], int]] = None,
+    ) -> List[Tuple[List, requests.Response]]:
+        """
+        Sends batch in one request. If the payload is too large for the server or the request
+        keeps failing (e.g. by timeout), the batch is split in halves which are sent separately.
+        Payload size is measured by sizes of items if get_size is given or by size of response.
+        Returns list of sent parts of the batch with their responses.
+        """
+        # the batch is split after a few failed attempts, single items use all retries
+        retries = None if len(batch) == 1 else min(2, self._api.retry_count)
+        start = time.monotonic()
+        try:
+            response = self._api.post(method, get_post_data(batch), retries=retries)
+        except requests.exceptions.RequestException as e:
+            if len(batch) == 1 or not _is_payload_error(e):
+                raise
+            if get_size is None:
+                batcher.shrink(batcher.item_size * len(batch))
+            else:
+                batcher.shrink(sum(get_size(item) for item in batch))
+            logger.warn(
+                f"Request {method!r} with {len(batch)} items failed, it will be split in halves",
+                extra={"error": repr(e)},
             )
-            if progress_cb is not None:
-                progress_cb(len(batch))
+            half = len(batch) // 2
+            return [
+                result
+                for part in (batch[:half], batch[half:])
+                for result in self._post_adaptive_batch(
+                    method, part, get_post_data, batcher, get_size
+                )
+            ]
+        elapsed = time.monotonic() - start
+        if get_size is None:
+            payload_bytes = len(response.content)
+        else:
+            payload_bytes = sum(get_size(item) for item in batch)
+        batcher.update(len(batch), payload_bytes, elapsed)
+        return [(batch, response)]
 
     def get_info_by_id(self, id):
         """
@@ -782,6 +967,9 @@ class AnnotationApi(ModuleApi):
             return
 
         src_dataset_id = self._api.image.get_info_by_id(src_image_ids[0]).dataset_id
+        dst_dataset_id = self._api.image.get_info_by_id(
+            dst_image_ids[0], force_metadata_for_links=False
+        ).dataset_id
         for cur_batch in batched(list(zip(src_image_ids, dst_image_ids))):
             src_ids_batch, dst_ids_batch = zip(*cur_batch)
             ann_infos = self.download_batch(
@@ -789,7 +977,10 @@ class AnnotationApi(ModuleApi):
             )
             ann_jsons = [ann_info.annotation for ann_info in ann_infos]
             self.upload_jsons(
-                dst_ids_batch, ann_jsons, skip_bounds_validation=skip_bounds_validation
+                dst_ids_batch,
+                ann_jsons,
+                skip_bounds_validation=skip_bounds_validation,
+                dataset_id=dst_dataset_id,
             )
             if progress_cb is not None:
                 progress_cb(len(src_ids_batch))
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 import os
+import gzip
 import requests
 import json
+from http.cookiejar import DefaultCookiePolicy
 from typing import List, Optional, NamedTuple, Dict
+from requests.adapters import HTTPAdapter
 from requests_toolbelt import MultipartEncoderMonitor, MultipartEncoder
 from dotenv import load_dotenv
 
@@ -49,9 +52,11 @@ from supervisely.io.network_exceptions import (
 SUPERVISELY_TASK_ID = "SUPERVISELY_TASK_ID"
 SUPERVISELY_PUBLIC_API_RETRIES = "SUPERVISELY_PUBLIC_API_RETRIES"
 SUPERVISELY_PUBLIC_API_RETRY_SLEEP_SEC = "SUPERVISELY_PUBLIC_API_RETRY_SLEEP_SEC"
+SUPERVISELY_PUBLIC_API_POOL_SIZE = "SUPERVISELY_PUBLIC_API_POOL_SIZE"
 SERVER_ADDRESS = "SERVER_ADDRESS"
 API_TOKEN = "API_TOKEN"
 TASK_ID = "TASK_ID"
+COMPRESS_MIN_SIZE = 1024
 
 
 class Api:
@@ -70,6 +75,10 @@ class Api:
     :type external_logger: logger, optional
     :param ignore_task_id:
     :type ignore_task_id: bool, optional
+    :param pool_size: Max number of keep-alive connections to the server kept in the pool. Should be not less than the number of threads using the API object at the same time.
+    :type pool_size: int, optional
+    :param compress_requests: If True, JSON request bodies bigger than 1 KB are sent gzip-compressed.
+    :type compress_requests: bool, optional
     :raises: :class:`ValueError`, if token is None or it length != 128
     :Usage example:
 
@@ -98,6 +107,8 @@ class Api:
         retry_sleep_sec: Optional[int] = None,
         external_logger: Optional[logger] = None,
         ignore_task_id: Optional[bool] = False,
+        pool_size: Optional[int] = None,
+        compress_requests: Optional[bool] = False,
     ):
         if server_address is None and token is None:
             server_address = os.environ.get(SERVER_ADDRESS, None)
@@ -117,6 +128,8 @@ class Api:
             retry_count = int(os.getenv(SUPERVISELY_PUBLIC_API_RETRIES, "10"))
         if retry_sleep_sec is None:
             retry_sleep_sec = int(os.getenv(SUPERVISELY_PUBLIC_API_RETRY_SLEEP_SEC, "1"))
+        if pool_size is None:
+            pool_size = int(os.getenv(SUPERVISELY_PUBLIC_API_POOL_SIZE, "10"))
 
         if len(token) != 128:
             raise ValueError("Invalid token {!r}: length != 128".format(token))
@@ -128,6 +141,8 @@ class Api:
             self.headers["x-task-id"] = self.task_id
         self.context = {}
         self.additional_fields = {}
+        self.compress_requests = compress_requests
+        self._session = Api._create_session(pool_size)
 
         self.team = team_api.TeamApi(self)
         self.workspace = workspace_api.WorkspaceApi(self)
@@ -162,6 +177,54 @@ class Api:
 
         self.logger = external_logger or logger
 
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        Create session with keep-alive connection pool shared by all threads using the API object.
+        Cookies are not persisted, every request is sent the same way as without session.
+        """
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Statistics of the connection pool: total number of sent requests,
+        number of requests served by reused keep-alive connections (hits)
+        and number of opened connections (misses).
+
+        :return: Dictionary with "requests", "hits" and "misses" counters
+        :rtype: :class:`dict`
+        :Usage example:
+
+         .. code-block:: python
+
+            import supervisely as sly
+
+            api = sly.Api.from_env()
+            api.project.get_info_by_id(17732)
+            print(api.get_pool_stats())
+            # Output: {'requests': 1, 'hits': 0, 'misses': 1}
+        """
+        requests_cnt, connections_cnt = 0, 0
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_cnt += pool.num_requests
+                connections_cnt += pool.num_connections
+        return {
+            "requests": requests_cnt,
+            "hits": max(requests_cnt - connections_cnt, 0),
+            "misses": connections_cnt,
+        }
+
     @classmethod
     def normalize_server_address(cls, server_address):
         """ """
@@ -302,9 +365,11 @@ class Api:
             response = None
             try:
                 if type(data) is bytes:
-                    response = requests.post(url, data=data, headers=self.headers, stream=stream)
+                    response = self._session.post(
+                        url, data=data, headers=self.headers, stream=stream
+                    )
                 elif type(data) is MultipartEncoderMonitor or type(data) is MultipartEncoder:
-                    response = requests.post(
+                    response = self._session.post(
                         url,
                         data=data,
                         headers={**self.headers, "Content-Type": data.content_type},
@@ -314,9 +379,22 @@ class Api:
                     json_body = data
                     if type(data) is dict:
                         json_body = {**data, **self.additional_fields}
-                    response = requests.post(
-                        url, json=json_body, headers=self.headers, stream=stream
-                    )
+                    compressed_body = self._compress_json(json_body)
+                    if compressed_body is not None:
+                        response = self._session.post(
+                            url,
+                            data=compressed_body,
+                            headers={
+                                **self.headers,
+                                "Content-Type": "application/json",
+                                "Content-Encoding": "gzip",
+                            },
+                            stream=stream,
+                        )
+                    else:
+                        response = self._session.post(
+                            url, json=json_body, headers=self.headers, stream=stream
+                        )
 
                 if response.status_code != requests.codes.ok:
                     Api._raise_for_status(response)
@@ -375,7 +453,9 @@ class Api:
                 json_body = params
                 if type(params) is dict:
                     json_body = {**params, **self.additional_fields}
-                response = requests.get(url, params=json_body, headers=self.headers, stream=stream)
+                response = self._session.get(
+                    url, params=json_body, headers=self.headers, stream=stream
+                )
 
                 if response.status_code != requests.codes.ok:
                     Api._raise_for_status(response)
@@ -395,6 +475,18 @@ class Api:
             except Exception as exc:
                 process_unhandled_request(self.logger, exc)
 
+    def _compress_json(self, json_body) -> Optional[bytes]:
+        """
+        Gzip JSON body if compression is enabled and body is big enough to benefit from it.
+        :return: compressed body or None
+        """
+        if self.compress_requests is False:
+            return None
+        body = json.dumps(json_body).encode("utf-8")
+        if len(body) < COMPRESS_MIN_SIZE:
+            return None
+        return gzip.compress(body, compresslevel=1)
+
     @staticmethod
     def _raise_for_status(response):
         """
@@ -0,0 +1,1145 @@
+# coding: utf-8
+"""Asynchronous client for the Supervisely public API based on asyncio."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+import numpy as np
+import requests
+from tqdm import tqdm
+
+import supervisely.imaging.image as sly_image
+from supervisely._utils import batched
+from supervisely.annotation.annotation import Annotation
+from supervisely.api.annotation_api import AnnotationApi, AnnotationInfo
+from supervisely.api.api import (
+    API_TOKEN,
+    SERVER_ADDRESS,
+    SUPERVISELY_PUBLIC_API_RETRIES,
+    SUPERVISELY_PUBLIC_API_RETRY_SLEEP_SEC,
+    SUPERVISELY_TASK_ID,
+    Api,
+)
+from supervisely.api.dataset_api import DatasetApi, DatasetInfo
+from supervisely.api.file_api import FileApi, FileInfo
+from supervisely.api.image_api import ImageApi, ImageInfo
+from supervisely.api.module_api import ApiField
+from supervisely.api.project_api import ProjectApi, ProjectInfo
+from supervisely.io.fs import ensure_base_path
+from supervisely.io.network_exceptions import (
+    process_requests_exception,
+    process_unhandled_request,
+)
+from supervisely.sly_logger import logger
+
+if TYPE_CHECKING:
+    import httpx
+
+SUPERVISELY_PUBLIC_API_MAX_CONCURRENCY = "SUPERVISELY_PUBLIC_API_MAX_CONCURRENCY"
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ModuleNotFoundError as e:
+        logger.error(f'{e}. Try to install extra dependencies. Run "pip install supervisely[async]"')
+        raise e
+    return httpx
+
+
+class _AsyncModuleApi:
+    """
+    Base class for asynchronous API modules. Converts server responses with the
+    corresponding synchronous module, so returned objects are the same as in :class:`Api`.
+    """
+
+    _sync_module_cls = None
+
+    def __init__(self, api: "AsyncApi"):
+        self._api = api
+        self._module = self._sync_module_cls(api)
+
+    def _convert_json_info(self, info: dict):
+        return self._module._convert_json_info(info)
+
+    async def _get_response_by_id(self, id, method, id_field, fields=None):
+        try:
+            data = {id_field: id}
+            if fields is not None:
+                data.update(fields)
+            return await self._api.post(method, data)
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                return None
+            else:
+                raise error
+
+    async def _get_info_by_id(self, id, method, fields=None):
+        response = await self._get_response_by_id(id, method, id_field=ApiField.ID, fields=fields)
+        return self._convert_json_info(response.json()) if (response is not None) else None
+
+    async def get_list_all_pages(
+        self,
+        method: str,
+        data: Dict,
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        convert_json_info_cb: Optional[Callable] = None,
+        limit: Optional[int] = None,
+    ) -> List:
+        """
+        Get list of all or limited quantity entities from the Supervisely server.
+        Pages after the first one are requested concurrently.
+
+        :param method: Request method name
+        :type method: str
+        :param data: Dictionary with request body info
+        :type data: dict
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :param convert_json_info_cb: Function for convert json info
+        :type convert_json_info_cb: Callable, optional
+        :param limit: Number of entity to retrieve
+        :type limit: int, optional
+        :return: List of entities
+        :rtype: :class:`list`
+        """
+        convert_func = convert_json_info_cb or self._convert_json_info
+        if ApiField.SORT not in data:
+            data = {**data, ApiField.SORT: ApiField.ID, ApiField.SORT_ORDER: "asc"}
+        first_response = (await self._api.post(method, data)).json()
+        total = first_response["total"]
+        per_page = first_response["perPage"]
+        pages_count = first_response["pagesCount"]
+
+        results = first_response["entities"]
+        if progress_cb is not None:
+            progress_cb(len(results))
+        if pages_count > 1 and len(results) != total:
+            if limit is not None:
+                pages_count = min(pages_count, -(-limit // per_page))
+
+            async def _get_page(page_idx):
+                response = await self._api.post(
+                    method, {**data, "page": page_idx, "per_page": per_page}
+                )
+                entities = response.json()["entities"]
+                if progress_cb is not None:
+                    progress_cb(len(entities))
+                return entities
+
+            pages = await asyncio.gather(*[_get_page(idx) for idx in range(2, pages_count + 1)])
+            for entities in pages:
+                results.extend(entities)
+            if len(results) != total and limit is None:
+                raise RuntimeError(
+                    "Method {!r}: error during pagination, some items are missed".format(method)
+                )
+
+        if limit is not None:
+            results = results[:limit]
+        return [convert_func(item) for item in results]
+
+    async def get_list_all_pages_generator(
+        self,
+        method: str,
+        data: Dict,
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        convert_json_info_cb: Optional[Callable] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[List]:
+        """
+        Asynchronous generator that retrieves all or a limited quantity of entities from
+        the Supervisely server, yielding batches of entities as they are retrieved.
+
+        :param method: Request method name
+        :type method: str
+        :param data: Dictionary with request body info
+        :type data: dict
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :param convert_json_info_cb: Function for convert json info
+        :type convert_json_info_cb: Callable, optional
+        :param limit: Number of entity to retrieve
+        :type limit: int, optional
+        :return: Asynchronous generator of entities batches
+        :rtype: :class:`AsyncIterator[list]`
+        """
+        convert_func = convert_json_info_cb or self._convert_json_info
+        if ApiField.SORT not in data:
+            data = {**data, ApiField.SORT: ApiField.ID, ApiField.SORT_ORDER: "asc"}
+        response = (await self._api.post(method, data)).json()
+        total = response["total"]
+        processed = 0
+        while True:
+            results = response["entities"]
+            if progress_cb is not None:
+                progress_cb(len(results))
+            processed += len(results)
+            yield [convert_func(item) for item in results]
+            after = response.get("after")
+            if processed >= total or after is None:
+                break
+            if limit is not None and processed > limit:
+                return
+            response = (await self._api.post(method, {**data, "after": after})).json()
+
+        if processed != total and limit is None:
+            raise RuntimeError(
+                "Method {!r}: error during pagination, some items are missed".format(method)
+            )
+
+
+class AsyncImageApi(_AsyncModuleApi):
+    """Asynchronous counterpart of :class:`ImageApi<supervisely.api.image_api.ImageApi>`."""
+
+    _sync_module_cls = ImageApi
+
+    async def get_list(
+        self,
+        dataset_id: int,
+        filters: Optional[List[Dict[str, str]]] = None,
+        sort: Optional[str] = "id",
+        sort_order: Optional[str] = "asc",
+        limit: Optional[int] = None,
+        force_metadata_for_links: Optional[bool] = True,
+    ) -> List[ImageInfo]:
+        """
+        List of Images in the given Dataset.
+
+        :param dataset_id: Dataset ID in which the Images are located.
+        :type dataset_id: int
+        :param filters: List of params to sort output Images.
+        :type filters: List[dict], optional
+        :param sort: Attribute to sort the list by.
+        :type sort: str, optional
+        :param sort_order: Order in which to sort the list, "asc" or "desc".
+        :type sort_order: str, optional
+        :param limit: Max number of list elements.
+        :type limit: int, optional
+        :param force_metadata_for_links: Calculate metadata for links.
+        :type force_metadata_for_links: bool, optional
+        :return: Objects with image information from Supervisely.
+        :rtype: :class:`List[ImageInfo]`
+        """
+        data = {
+            ApiField.DATASET_ID: dataset_id,
+            ApiField.FILTER: filters or [],
+            ApiField.SORT: sort,
+            ApiField.SORT_ORDER: sort_order,
+            ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
+        }
+        return await self.get_list_all_pages("images.list", data, limit=limit)
+
+    async def get_list_generator(
+        self,
+        dataset_id: int,
+        filters: Optional[List[Dict[str, str]]] = None,
+        sort: Optional[str] = "id",
+        sort_order: Optional[str] = "asc",
+        limit: Optional[int] = None,
+        force_metadata_for_links: Optional[bool] = True,
+    ) -> AsyncIterator[List[ImageInfo]]:
+        """
+        Same as :meth:`get_list`, but yields batches of Images as they are retrieved.
+
+        :Usage example:
+
+         .. code-block:: python
+
+            async for batch in api.image.get_list_generator(dataset_id):
+                print(len(batch))
+        """
+        data = {
+            ApiField.DATASET_ID: dataset_id,
+            ApiField.FILTER: filters or [],
+            ApiField.SORT: sort,
+            ApiField.SORT_ORDER: sort_order,
+            ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
+        }
+        async for batch in self.get_list_all_pages_generator("images.list", data, limit=limit):
+            yield batch
+
+    async def get_info_by_id(self, id: int, force_metadata_for_links=True) -> ImageInfo:
+        """
+        Get Image information by ID.
+
+        :param id: Image ID in Supervisely.
+        :type id: int
+        :param force_metadata_for_links: Calculate metadata for links.
+        :type force_metadata_for_links: bool, optional
+        :return: Object with image information from Supervisely, None if image does not exist.
+        :rtype: :class:`ImageInfo`
+        """
+        return await self._get_info_by_id(
+            id,
+            "images.info",
+            fields={ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links},
+        )
+
+    async def download_bytes(self, id: int) -> bytes:
+        """
+        Download Image with given ID in binary format.
+
+        :param id: Image ID in Supervisely.
+        :type id: int
+        :return: Image bytes
+        :rtype: :class:`bytes`
+        """
+        response = await self._api.post("images.download", {ApiField.ID: id})
+        return response.content
+
+    async def download_np(self, id: int, keep_alpha: Optional[bool] = False) -> np.ndarray:
+        """
+        Download Image with given ID in numpy format.
+
+        :param id: Image ID in Supervisely.
+        :type id: int
+        :param keep_alpha: If True keeps alpha mask for image, otherwise don't.
+        :type keep_alpha: bool, optional
+        :return: Image in RGB numpy matrix format
+        :rtype: :class:`np.ndarray`
+        """
+        img_bytes = await self.download_bytes(id)
+        return sly_image.read_bytes(img_bytes, keep_alpha)
+
+    async def download_path(self, id: int, path: str) -> None:
+        """
+        Download Image with given ID to local path. Content is written chunk by chunk.
+
+        :param id: Image ID in Supervisely.
+        :type id: int
+        :param path: Local save path for Image.
+        :type path: str
+        :return: None
+        :rtype: :class:`NoneType`
+        """
+        ensure_base_path(path)
+        async with self._api.stream("images.download", {ApiField.ID: id}) as response:
+            with open(path, "wb") as fd:
+                async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                    fd.write(chunk)
+
+    async def download_paths(
+        self,
+        ids: List[int],
+        paths: List[str],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+    ) -> None:
+        """
+        Download Images with given IDs to local paths concurrently.
+        Number of simultaneous requests is limited by :attr:`AsyncApi.max_concurrency`.
+
+        :param ids: List of Image IDs in Supervisely.
+        :type ids: List[int]
+        :param paths: Local save paths for Images.
+        :type paths: List[str]
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :raises: :class:`ValueError` if len(ids) != len(paths)
+        :return: None
+        :rtype: :class:`NoneType`
+        """
+        if len(ids) != len(paths):
+            raise ValueError('Can not match "ids" and "paths" lists, len(ids) != len(paths)')
+
+        async def _download(image_id, path):
+            await self.download_path(image_id, path)
+            if progress_cb is not None:
+                progress_cb(1)
+
+        await asyncio.gather(*[_download(image_id, path) for image_id, path in zip(ids, paths)])
+
+    async def download_nps(
+        self,
+        ids: List[int],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        keep_alpha: Optional[bool] = False,
+    ) -> List[np.ndarray]:
+        """
+        Download Images with given IDs in numpy format concurrently.
+
+        :param ids: List of Image IDs in Supervisely.
+        :type ids: List[int]
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :param keep_alpha: If True keeps alpha mask for image, otherwise don't.
+        :type keep_alpha: bool, optional
+        :return: List of Images in RGB numpy matrix format in the same order as ids
+        :rtype: :class:`List[np.ndarray]`
+        """
+
+        async def _download(image_id):
+            img = await self.download_np(image_id, keep_alpha)
+            if progress_cb is not None:
+                progress_cb(1)
+            return img
+
+        return list(await asyncio.gather(*[_download(image_id) for image_id in ids]))
+
+
+class AsyncAnnotationApi(_AsyncModuleApi):
+    """Asynchronous counterpart of :class:`AnnotationApi<supervisely.api.annotation_api.AnnotationApi>`."""
+
+    _sync_module_cls = AnnotationApi
+
+    async def get_list(
+        self,
+        dataset_id: int,
+        filters: Optional[List[Dict[str, str]]] = None,
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        force_metadata_for_links: Optional[bool] = True,
+    ) -> List[AnnotationInfo]:
+        """
+        Get list of information about all annotations for a given dataset.
+
+        :param dataset_id: Dataset ID in Supervisely.
+        :type dataset_id: int
+        :param filters: List of parameters to sort output Annotations.
+        :type filters: List[dict], optional
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :param force_metadata_for_links: Calculate metadata for links.
+        :type force_metadata_for_links: bool, optional
+        :return: Information about Annotations.
+        :rtype: :class:`List[AnnotationInfo]`
+        """
+        return await self.get_list_all_pages(
+            "annotations.list",
+            {
+                ApiField.DATASET_ID: dataset_id,
+                ApiField.FILTER: filters or [],
+                ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
+            },
+            progress_cb,
+        )
+
+    async def download(
+        self,
+        image_id: int,
+        with_custom_data: Optional[bool] = False,
+        force_metadata_for_links: Optional[bool] = True,
+    ) -> AnnotationInfo:
+        """
+        Download AnnotationInfo by image ID from API.
+
+        :param image_id: Image ID in Supervisely.
+        :type image_id: int
+        :param with_custom_data: Include custom data in the response.
+        :type with_custom_data: bool, optional
+        :param force_metadata_for_links: Calculate metadata for links.
+        :type force_metadata_for_links: bool, optional
+        :return: Information about Annotation.
+        :rtype: :class:`AnnotationInfo`
+        """
+        response = await self._api.post(
+            "annotations.info",
+            {
+                ApiField.IMAGE_ID: image_id,
+                ApiField.WITH_CUSTOM_DATA: with_custom_data,
+                ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
+            },
+        )
+        return self._convert_json_info(response.json())
+
+    async def download_batch(
+        self,
+        dataset_id: int,
+        image_ids: List[int],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        force_metadata_for_links: Optional[bool] = True,
+    ) -> List[AnnotationInfo]:
+        """
+        Get list of AnnotationInfos for given dataset ID from API.
+        Batches are requested concurrently.
+
+        :param dataset_id: Dataset ID in Supervisely.
+        :type dataset_id: int
+        :param image_ids: List of integers.
+        :type image_ids: List[int]
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :param force_metadata_for_links: Calculate metadata for links.
+        :type force_metadata_for_links: bool, optional
+        :return: Information about Annotations in the same order as image_ids.
+        :rtype: :class:`List[AnnotationInfo]`
+        """
+
+        async def _download(batch):
+            post_data = {
+                ApiField.DATASET_ID: dataset_id,
+                ApiField.IMAGE_IDS: batch,
+                ApiField.FORCE_METADATA_FOR_LINKS: force_metadata_for_links,
+            }
+            results = (await self._api.post("annotations.bulk.info", data=post_data)).json()
+            if progress_cb is not None:
+                progress_cb(len(batch))
+            return [self._convert_json_info(ann_dict) for ann_dict in results]
+
+        id_to_ann = {}
+        for ann_infos in await asyncio.gather(*[_download(b) for b in batched(image_ids)]):
+            for ann_info in ann_infos:
+                id_to_ann[ann_info.image_id] = ann_info
+        return [id_to_ann[image_id] for image_id in image_ids]
+
+    async def upload_jsons(
+        self,
+        img_ids: List[int],
+        ann_jsons: List[Dict],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        skip_bounds_validation: Optional[bool] = False,
+    ) -> None:
+        """
+        Loads annotations from dictionaries to given images in API, images
+        should be from one dataset. Batches are uploaded concurrently.
+
+        :param img_ids: Image IDs in Supervisely.
+        :type img_ids: List[int]
+        :param ann_jsons: Annotation in JSON format.
+        :type ann_jsons: List[dict]
+        :param progress_cb: Function for tracking upload progress.
+        :type progress_cb: tqdm or callable, optional
+        :param skip_bounds_validation: Skip bounds validation.
+        :type skip_bounds_validation: bool, optional
+        :return: None
+        :rtype: :class:`NoneType`
+        """
+        await self._upload_batch(
+            lambda x: x, img_ids, ann_jsons, progress_cb, skip_bounds_validation
+        )
+
+    async def upload_anns(
+        self,
+        img_ids: List[int],
+        anns: List[Annotation],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        skip_bounds_validation: Optional[bool] = False,
+    ) -> None:
+        """
+        Loads Annotations to given images in API, images should be from one dataset.
+
+        :param img_ids: Image IDs in Supervisely.
+        :type img_ids: List[int]
+        :param anns: List of Annotation objects.
+        :type anns: List[Annotation]
+        :param progress_cb: Function for tracking upload progress.
+        :type progress_cb: tqdm or callable, optional
+        :param skip_bounds_validation: Skip bounds validation.
+        :type skip_bounds_validation: bool, optional
+        :return: None
+        :rtype: :class:`NoneType`
+        """
+        await self._upload_batch(
+            Annotation.to_json, img_ids, anns, progress_cb, skip_bounds_validation
+        )
+
+    async def _upload_batch(
+        self,
+        func_ann_to_json,
+        img_ids,
+        anns,
+        progress_cb=None,
+        skip_bounds_validation: Optional[bool] = False,
+    ):
+        # img_ids from the same dataset
+        if len(img_ids) == 0:
+            return
+        if len(img_ids) != len(anns):
+            raise RuntimeError(
+                'Can not match "img_ids" and "anns" lists, len(img_ids) != len(anns)'
+            )
+
+        image_info = await self._api.image.get_info_by_id(
+            img_ids[0], force_metadata_for_links=False
+        )
+        dataset_id = image_info.dataset_id
+
+        async def _upload(batch):
+            data = [
+                {ApiField.IMAGE_ID: img_id, ApiField.ANNOTATION: func_ann_to_json(ann)}
+                for img_id, ann in batch
+            ]
+            await self._api.post(
+                "annotations.bulk.add",
+                data={
+                    ApiField.DATASET_ID: dataset_id,
+                    ApiField.ANNOTATIONS: data,
+                    ApiField.SKIP_BOUNDS_VALIDATION: skip_bounds_validation,
+                },
+            )
+            if progress_cb is not None:
+                progress_cb(len(batch))
+
+        await asyncio.gather(*[_upload(batch) for batch in batched(list(zip(img_ids, anns)))])
+
+
+class AsyncDatasetApi(_AsyncModuleApi):
+    """Asynchronous counterpart of :class:`DatasetApi<supervisely.api.dataset_api.DatasetApi>`."""
+
+    _sync_module_cls = DatasetApi
+
+    async def get_list(
+        self, project_id: int, filters: Optional[List[Dict[str, str]]] = None
+    ) -> List[DatasetInfo]:
+        """
+        List of Datasets in the given Project.
+
+        :param project_id: Project ID in which the Datasets are located.
+        :type project_id: int
+        :param filters: List of params to sort output Datasets.
+        :type filters: List[dict], optional
+        :return: List of all Datasets with information for the given Project.
+        :rtype: :class:`List[DatasetInfo]`
+        """
+        return await self.get_list_all_pages(
+            "datasets.list",
+            {ApiField.PROJECT_ID: project_id, ApiField.FILTER: filters or []},
+        )
+
+    async def get_info_by_id(self, id: int) -> DatasetInfo:
+        """
+        Get Dataset information by ID.
+
+        :param id: Dataset ID in Supervisely.
+        :type id: int
+        :return: Information about Dataset, None if dataset does not exist.
+        :rtype: :class:`DatasetInfo`
+        """
+        return await self._get_info_by_id(id, "datasets.info")
+
+    async def create(
+        self, project_id: int, name: str, description: Optional[str] = ""
+    ) -> DatasetInfo:
+        """
+        Create Dataset with given name in the given Project.
+
+        :param project_id: Project ID in Supervisely where Dataset will be created.
+        :type project_id: int
+        :param name: Dataset Name.
+        :type name: str
+        :param description: Dataset description.
+        :type description: str, optional
+        :return: Information about Dataset.
+        :rtype: :class:`DatasetInfo`
+        """
+        response = await self._api.post(
+            "datasets.add",
+            {
+                ApiField.PROJECT_ID: project_id,
+                ApiField.NAME: name,
+                ApiField.DESCRIPTION: description,
+            },
+        )
+        return self._convert_json_info(response.json())
+
+
+class AsyncProjectApi(_AsyncModuleApi):
+    """Asynchronous counterpart of :class:`ProjectApi<supervisely.api.project_api.ProjectApi>`."""
+
+    _sync_module_cls = ProjectApi
+
+    async def get_list(
+        self, workspace_id: int, filters: Optional[List[Dict[str, str]]] = None
+    ) -> List[ProjectInfo]:
+        """
+        List of Projects in the given Workspace.
+
+        :param workspace_id: Workspace ID in which the Projects are located.
+        :type workspace_id: int
+        :param filters: List of params to sort output Projects.
+        :type filters: List[dict], optional
+        :return: List of all Projects with information for the given Workspace.
+        :rtype: :class:`List[ProjectInfo]`
+        """
+        return await self.get_list_all_pages(
+            "projects.list",
+            {ApiField.WORKSPACE_ID: workspace_id, "filter": filters or []},
+        )
+
+    async def get_info_by_id(self, id: int) -> ProjectInfo:
+        """
+        Get Project information by ID.
+
+        :param id: Project ID in Supervisely.
+        :type id: int
+        :return: Information about Project, None if project does not exist.
+        :rtype: :class:`ProjectInfo`
+        """
+        return await self._get_info_by_id(id, "projects.info")
+
+    async def get_meta(self, id: int) -> Dict:
+        """
+        Get ProjectMeta by Project ID.
+
+        :param id: Project ID in Supervisely.
+        :type id: int
+        :return: ProjectMeta dict
+        :rtype: :class:`dict`
+        """
+        response = await self._api.post("projects.meta", {"id": id})
+        return response.json()
+
+
+class AsyncVideoFrameApi:
+    """Asynchronous counterpart of :class:`VideoFrameAPI<supervisely.api.video.video_frame_api.VideoFrameAPI>`."""
+
+    def __init__(self, api: "AsyncApi"):
+        self._api = api
+
+    async def download_bytes(self, video_id: int, frame_index: int) -> bytes:
+        """
+        Download frame with given index from given video ID in binary format.
+
+        :param video_id: Video ID in Supervisely.
+        :type video_id: int
+        :param frame_index: Index of frame to download.
+        :type frame_index: int
+        :return: Frame bytes
+        :rtype: :class:`bytes`
+        """
+        response = await self._api.post(
+            "videos.download-frame", {ApiField.VIDEO_ID: video_id, ApiField.FRAME: frame_index}
+        )
+        return response.content
+
+    async def download_np(self, video_id: int, frame_index: int) -> np.ndarray:
+        """
+        Download frame with given index from given video ID in numpy format (RGB).
+
+        :param video_id: Video ID in Supervisely.
+        :type video_id: int
+        :param frame_index: Index of frame to download.
+        :type frame_index: int
+        :return: Image in RGB numpy matrix format
+        :rtype: :class:`np.ndarray`
+        """
+        return sly_image.read_bytes(await self.download_bytes(video_id, frame_index))
+
+    async def download_nps(
+        self,
+        video_id: int,
+        frame_indexes: List[int],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Download frames with given indexes from given video ID in numpy format concurrently.
+
+        :param video_id: Video ID in Supervisely.
+        :type video_id: int
+        :param frame_indexes: Indexes of frames to download.
+        :type frame_indexes: List[int]
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :return: List of Images in RGB numpy matrix format in the same order as frame_indexes
+        :rtype: :class:`List[np.ndarray]`
+        """
+
+        async def _download(frame_index):
+            frame = await self.download_np(video_id, frame_index)
+            if progress_cb is not None:
+                progress_cb(1)
+            return frame
+
+        return list(await asyncio.gather(*[_download(idx) for idx in frame_indexes]))
+
+
+class AsyncVideoApi:
+    """Asynchronous counterpart of :class:`VideoApi<supervisely.api.video.video_api.VideoApi>`, only frames are supported."""
+
+    def __init__(self, api: "AsyncApi"):
+        self.frame = AsyncVideoFrameApi(api)
+
+
+class AsyncFileApi(_AsyncModuleApi):
+    """Asynchronous counterpart of :class:`FileApi<supervisely.api.file_api.FileApi>` for files in Team Files."""
+
+    _sync_module_cls = FileApi
+
+    async def list(self, team_id: int, path: str, recursive: bool = True) -> List[FileInfo]:
+        """
+        List of files in the Team Files.
+
+        :param team_id: Team ID in Supervisely.
+        :type team_id: int
+        :param path: Path to File or Directory.
+        :type path: str
+        :param recursive: If True return all files recursively.
+        :type recursive: bool
+        :return: List of all Files with information.
+        :rtype: :class:`List[FileInfo]`
+        """
+        if not path.endswith("/") and recursive is False:
+            path += "/"
+        response = await self._api.post(
+            "file-storage.list",
+            {ApiField.TEAM_ID: team_id, ApiField.PATH: path, ApiField.RECURSIVE: recursive},
+        )
+        return [self._convert_json_info(info_json) for info_json in response.json()]
+
+    async def download(
+        self,
+        team_id: int,
+        remote_path: str,
+        local_save_path: str,
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+    ) -> None:
+        """
+        Download File from Team Files. Content is written chunk by chunk.
+
+        :param team_id: Team ID in Supervisely.
+        :type team_id: int
+        :param remote_path: Path to File in Team Files.
+        :type remote_path: str
+        :param local_save_path: Local save path.
+        :type local_save_path: str
+        :param progress_cb: Function for tracking download progress in bytes.
+        :type progress_cb: tqdm or callable, optional
+        :return: None
+        :rtype: :class:`NoneType`
+        """
+        ensure_base_path(local_save_path)
+        async with self._api.stream(
+            "file-storage.download", {ApiField.TEAM_ID: team_id, ApiField.PATH: remote_path}
+        ) as response:
+            with open(local_save_path, "wb") as fd:
+                async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
+                    fd.write(chunk)
+                    if progress_cb is not None:
+                        progress_cb(len(chunk))
+
+
+class AsyncApi:
+    """
+    Asynchronous client for the Supervisely public API built on asyncio and httpx.
+    It mirrors the most used modules of :class:`Api<supervisely.api.api.Api>` and
+    returns the same info objects. Requests are retried the same way as in
+    :class:`Api<supervisely.api.api.Api>`, number of simultaneous requests is limited by ``max_concurrency``.
+
+    Requires extra dependencies: ``pip install supervisely[async]``.
+
+    :param server_address: Server address of your Supervisely instance.
+    :type server_address: str, optional
+    :param token: Unique secret token associated with your agent.
+    :type token: str, optional
+    :param retry_count: The number of attempts to connect to the server.
+    :type retry_count: int, optional
+    :param retry_sleep_sec: The number of seconds to delay between attempts to connect to the server.
+    :type retry_sleep_sec: int, optional
+    :param external_logger: Logger class object.
+    :type external_logger: logger, optional
+    :param ignore_task_id: Do not send task ID header.
+    :type ignore_task_id: bool, optional
+    :param max_concurrency: Max number of simultaneous requests. By default taken from
+        SUPERVISELY_PUBLIC_API_MAX_CONCURRENCY env variable or equal to 10.
+    :type max_concurrency: int, optional
+    :param timeout: Timeout of a single request in seconds.
+    :type timeout: float, optional
+    :raises: :class:`ValueError`, if token is None or it length != 128
+    :Usage example:
+
+     .. code-block:: python
+
+        import asyncio
+        import supervisely as sly
+
+        async def main():
+            async with sly.AsyncApi.from_env() as api:
+                images = await api.image.get_list(dataset_id)
+                nps = await api.image.download_nps([image.id for image in images])
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        server_address: str = None,
+        token: str = None,
+        retry_count: Optional[int] = None,
+        retry_sleep_sec: Optional[int] = None,
+        external_logger: Optional[logger] = None,
+        ignore_task_id: Optional[bool] = False,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = 60,
+    ):
+        if server_address is None and token is None:
+            server_address = os.environ.get(SERVER_ADDRESS, None)
+            token = os.environ.get(API_TOKEN, None)
+
+        if server_address is None:
+            raise ValueError(
+                "SERVER_ADDRESS env variable is undefined, https://developer.supervise.ly/getting-started/basics-of-authentication"
+            )
+        if token is None:
+            raise ValueError(
+                "API_TOKEN env variable is undefined, https://developer.supervise.ly/getting-started/basics-of-authentication"
+            )
+        if len(token) != 128:
+            raise ValueError("Invalid token {!r}: length != 128".format(token))
+
+        if retry_count is None:
+            retry_count = int(os.getenv(SUPERVISELY_PUBLIC_API_RETRIES, "10"))
+        if retry_sleep_sec is None:
+            retry_sleep_sec = int(os.getenv(SUPERVISELY_PUBLIC_API_RETRY_SLEEP_SEC, "1"))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv(SUPERVISELY_PUBLIC_API_MAX_CONCURRENCY, "10"))
+
+        self.server_address = Api.normalize_server_address(server_address)
+        self.token = token
+        self.headers = {"x-api-key": token}
+        self.task_id = os.getenv(SUPERVISELY_TASK_ID)
+        if self.task_id is not None and ignore_task_id is False:
+            self.headers["x-task-id"] = self.task_id
+        self.additional_fields = {}
+        self.retry_count = retry_count
+        self.retry_sleep_sec = retry_sleep_sec
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.logger = external_logger or logger
+
+        # client and semaphore are bound to the event loop, so they are created on first request
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+        self.image = AsyncImageApi(self)
+        self.annotation = AsyncAnnotationApi(self)
+        self.dataset = AsyncDatasetApi(self)
+        self.project = AsyncProjectApi(self)
+        self.video = AsyncVideoApi(self)
+        self.file = AsyncFileApi(self)
+
+    @classmethod
+    def from_env(cls, retry_count: int = None, ignore_task_id: bool = False, **kwargs) -> AsyncApi:
+        """
+        Initialize AsyncApi with SERVER_ADDRESS and API_TOKEN env variables.
+
+        :param retry_count: The number of attempts to connect to the server.
+        :type retry_count: int, optional
+        :param ignore_task_id: Do not send task ID header.
+        :type ignore_task_id: bool, optional
+        :return: AsyncApi object
+        :rtype: :class:`AsyncApi`
+        """
+        return cls(
+            os.environ.get(SERVER_ADDRESS, None),
+            os.environ.get(API_TOKEN, None),
+            retry_count=retry_count,
+            ignore_task_id=ignore_task_id,
+            **kwargs,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close connections of the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            httpx = _import_httpx()
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client
+
+    def _build_request(self, method: str, data):
+        url = self.server_address + "/public/api/v3/" + method
+        if type(data) is bytes:
+            return url, {"content": data, "headers": self.headers}
+        json_body = data
+        if type(data) is dict:
+            json_body = {**data, **self.additional_fields}
+        return url, {"json": json_body, "headers": self.headers}
+
+    @staticmethod
+    def _raise_for_status(response: "httpx.Response"):
+        """
+        Raise :class:`requests.exceptions.HTTPError` with the same message as :class:`Api` does,
+        so errors can be handled the same way for both clients.
+        """
+        http_error_msg = ""
+        if 400 <= response.status_code < 500:
+            http_error_msg = "%s Client Error: %s for url: %s (%s)" % (
+                response.status_code,
+                response.reason_phrase,
+                response.url,
+                response.content.decode("utf-8"),
+            )
+        elif 500 <= response.status_code < 600:
+            http_error_msg = "%s Server Error: %s for url: %s (%s)" % (
+                response.status_code,
+                response.reason_phrase,
+                response.url,
+                response.content.decode("utf-8"),
+            )
+        if http_error_msg:
+            raise requests.exceptions.HTTPError(http_error_msg, response=response)
+
+    async def _process_exception(self, exc, method, url, response, retry_idx, retries):
+        """Same processing as in :meth:`Api.post`, but sleeps without blocking the event loop."""
+        httpx = _import_httpx()
+        if isinstance(exc, httpx.TimeoutException):
+            exc = requests.exceptions.Timeout(str(exc))
+        elif isinstance(exc, httpx.TransportError):
+            exc = requests.exceptions.ConnectionError(str(exc))
+        elif not isinstance(exc, requests.RequestException):
+            process_unhandled_request(self.logger, exc)
+        process_requests_exception(
+            self.logger,
+            exc,
+            method,
+            url,
+            verbose=True,
+            swallow_exc=True,
+            response=response,
+            retry_info={"retry_idx": retry_idx + 1, "retry_limit": retries},
+        )
+        await asyncio.sleep(min(self.retry_sleep_sec * (2**retry_idx), 60))
+
+    async def post(
+        self, method: str, data: Union[Dict, bytes], retries: Optional[int] = None
+    ) -> "httpx.Response":
+        """
+        Performs POST request to server with given parameters.
+
+        :param method: Method name.
+        :type method: str
+        :param data: Dictionary or bytes to send in the body of the request.
+        :type data: dict or bytes
+        :param retries: The number of attempts to connect to the server.
+        :type retries: int, optional
+        :return: Response object
+        :rtype: :class:`httpx.Response`
+        """
+        if retries is None:
+            retries = self.retry_count
+        client = self._get_client()
+        url, kwargs = self._build_request(method, data)
+        logger.trace(f"POST {url}")
+
+        for retry_idx in range(retries):
+            response = None
+            try:
+                async with self._semaphore:
+                    response = await client.post(url, **kwargs)
+                if response.status_code != requests.codes.ok:
+                    self._raise_for_status(response)
+                return response
+            except Exception as exc:
+                await self._process_exception(exc, method, url, response, retry_idx, retries)
+        raise requests.exceptions.RetryError("Retry limit exceeded ({!r})".format(url))
+
+    async def get(
+        self, method: str, params: Dict, retries: Optional[int] = None
+    ) -> "httpx.Response":
+        """
+        Performs GET request to server with given parameters.
+
+        :param method: Method name.
+        :type method: str
+        :param params: Dictionary to send in the query string.
+        :type params: dict
+        :param retries: The number of attempts to connect to the server.
+        :type retries: int, optional
+        :return: Response object
+        :rtype: :class:`httpx.Response`
+        """
+        if retries is None:
+            retries = self.retry_count
+        client = self._get_client()
+        url = self.server_address + "/public/api/v3/" + method
+        logger.trace(f"GET {url}")
+
+        json_body = params
+        if type(params) is dict:
+            json_body = {**params, **self.additional_fields}
+
+        for retry_idx in range(retries):
+            response = None
+            try:
+                async with self._semaphore:
+                    response = await client.get(url, params=json_body, headers=self.headers)
+                if response.status_code != requests.codes.ok:
+                    self._raise_for_status(response)
+                return response
+            except Exception as exc:
+                await self._process_exception(exc, method, url, response, retry_idx, retries)
+        raise requests.exceptions.RetryError("Retry limit exceeded ({!r})".format(url))
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, data: Union[Dict, bytes], retries: Optional[int] = None
+    ) -> AsyncIterator["httpx.Response"]:
+        """
+        Performs POST request and returns response with not yet read body.
+        Request is retried until response headers are received, the connection
+        is held (and counted in ``max_concurrency``) until the context is exited.
+        Waiting between attempts doesn't take a ``max_concurrency`` slot.
+
+        :param method: Method name.
+        :type method: str
+        :param data: Dictionary or bytes to send in the body of the request.
+        :type data: dict or bytes
+        :param retries: The number of attempts to connect to the server.
+        :type retries: int, optional
+        :return: Response object
+        :rtype: :class:`httpx.Response`
+        :Usage example:
+
+         .. code-block:: python
+
+            async with api.stream("images.download", {"id": image_id}) as response:
+                async for chunk in response.aiter_bytes():
+                    ...
+        """
+        if retries is None:
+            retries = self.retry_count
+        client = self._get_client()
+        url, kwargs = self._build_request(method, data)
+        logger.trace(f"POST {url}")
+
+        for retry_idx in range(retries):
+            response = None
+            async with self._semaphore:
+                try:
+                    request = client.build_request("POST", url, **kwargs)
+                    response = await client.send(request, stream=True)
+                    if response.status_code != requests.codes.ok:
+                        await response.aread()
+                        await response.aclose()
+                        self._raise_for_status(response)
+                except Exception as exc:
+                    error = exc
+                else:
+                    try:
+                        yield response
+                    finally:
+                        await response.aclose()
+                    return
+            # slot is released while waiting for the next attempt
+            await self._process_exception(error, method, url, response, retry_idx, retries)
+        raise requests.exceptions.RetryError("Retry limit exceeded ({!r})".format(url))
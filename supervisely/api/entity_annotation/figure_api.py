@@ -130,6 +130,55 @@ class FigureApi(RemoveableBulkModuleApi):
         response = self._api.post("figures.bulk.add", body)
         return response.json()[0][ApiField.ID]
 
+    def create_bulk(
+        self,
+        entity_id: int,
+        figures_json: List[Dict],
+        batch_size: Optional[int] = 100,
+    ) -> List[int]:
+        """
+        Create Figures for given entity ID with one request per batch of figures.
+
+        :param entity_id: Entity ID in Supervisely.
+        :type entity_id: int
+        :param figures_json: Figures in json format, every figure contains "meta", "objectId",
+            "geometryType", "geometry" and optionally "trackId" fields.
+        :type figures_json: List[dict]
+        :param batch_size: Number of figures created in one request.
+        :type batch_size: int, optional
+        :return: IDs of created figures in the same order
+        :rtype: :class:`List[int]`
+        :Usage example:
+
+         .. code-block:: python
+
+            import supervisely as sly
+
+            os.environ['SERVER_ADDRESS'] = 'https://app.supervise.ly'
+            os.environ['API_TOKEN'] = 'Your Supervisely API Token'
+            api = sly.Api.from_env()
+
+            video_id = 198703211
+            figures_json = [
+                {
+                    "meta": {"frame": frame_idx},
+                    "objectId": 152118,
+                    "geometryType": "rectangle",
+                    "geometry": {"points": {"exterior": [[500, 500], [1555, 1500]], "interior": []}},
+                }
+                for frame_idx in range(10)
+            ]
+            figure_ids = api.video.figure.create_bulk(video_id, figures_json)
+        """
+        figure_ids = []
+        for batch_jsons in batched(figures_json, batch_size=batch_size):
+            resp = self._api.post(
+                "figures.bulk.add",
+                {ApiField.ENTITY_ID: entity_id, ApiField.FIGURES: batch_jsons},
+            )
+            figure_ids.extend(resp_obj[ApiField.ID] for resp_obj in resp.json())
+        return figure_ids
+
     def get_by_ids(self, dataset_id: int, ids: List[int]) -> List[NamedTuple]:
         """
         Get Figures information by IDs from given dataset ID.
@@ -9,18 +9,22 @@ from typing_extensions import Literal
 import os
 import shutil
 import tarfile
+import threading
+import time
 from pathlib import Path
 import urllib
 import re
 
-from supervisely._utils import batched, rand_str
+import requests
+
+from supervisely._utils import batched, concurrent_map, rand_str
 from supervisely.api.module_api import ModuleApiBase, ApiField
 import supervisely.io.fs as sly_fs
 from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 import mimetypes
 from supervisely.imaging.image import write_bytes, get_hash
 from supervisely.task.progress import Progress
-from supervisely.io.fs_cache import FileCache
+from supervisely.io.fs_cache import FileCache, _JsonLinesLog
 from supervisely.io.fs import (
     get_file_hash,
     get_file_name,
@@ -36,6 +40,85 @@ import supervisely.io.env as env
 from tqdm import tqdm
 
 
+class _ResponseStream:
+    """Read-only file-like object over the body of streamed response."""
+
+    def __init__(self, response, progress_cb=None, chunk_size=1024 * 1024):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._chunk = b""
+        self._pos = 0
+        self._progress_cb = progress_cb
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._pos >= len(self._chunk):
+                self._chunk = next(self._chunks, None)
+                self._pos = 0
+                if self._chunk is None:
+                    self._chunk = b""
+                    break
+                if self._progress_cb is not None:
+                    self._progress_cb(len(self._chunk))
+                continue
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._pos + size)
+            parts.append(self._chunk[self._pos : end])
+            if size > 0:
+                size -= end - self._pos
+            self._pos = end
+        return b"".join(parts)
+
+
+class _UploadJournal:
+    """
+    Log of files already uploaded to Team Files, one JSON line per file, so every finished request
+    appends only its files. Local file is considered uploaded if its path, size and modification
+    time are not changed. Log is compacted on load if it has too many outdated lines.
+    """
+
+    def __init__(self, path: Optional[str], team_id: int):
+        self.team_id = team_id
+        self._files = {}  # dst -> record
+        self._log = None
+        if path is None:
+            return
+        self._log = _JsonLinesLog(path)
+        records = self._log.read()
+        # journal can be shared by teams, compaction keeps the latest record of every team file
+        latest = {}
+        for record in records:
+            latest[(record.get("team_id"), record.get("dst"))] = record
+        self._files = {
+            dst: record for (rec_team_id, dst), record in latest.items() if rec_team_id == team_id
+        }
+        if len(records) > 2 * len(latest):
+            self._log.rewrite(list(latest.values()))
+
+    @staticmethod
+    def _file_state(src: str) -> Dict:
+        stat = os.stat(src)
+        return {"src": os.path.abspath(src), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def get_uploaded_info(self, src: str, dst: str) -> Optional[Dict]:
+        record = self._files.get(dst)
+        if record is None or {k: record.get(k) for k in ("src", "size", "mtime")} != self._file_state(src):
+            return None
+        return record["info"]
+
+    def add(self, srcs: List[str], dsts: List[str], infos: List[Dict]) -> None:
+        if self._log is None:
+            return
+        records = [
+            {"team_id": self.team_id, "dst": dst, **self._file_state(src), "info": info}
+            for src, dst, info in zip(srcs, dsts, infos)
+        ]
+        self._log.append(records)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+
+
 class FileInfo(NamedTuple):
     """ """
 
@@ -517,6 +600,8 @@ class FileApi(ModuleApiBase):
         remote_path: str,
         local_save_path: str,
         progress_cb: Optional[Union[tqdm, Callable]] = None,
+        stream_extract: Optional[bool] = True,
+        file_filter: Optional[Callable[[str], bool]] = None,
     ) -> None:
         """
         Download Directory from Team Files.
@@ -529,6 +614,12 @@ class FileApi(ModuleApiBase):
         :type local_save_path: str
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param stream_extract: Extract files from the archive while it is downloading, without saving the archive to disk.
+            If False, the whole archive is downloaded first and then extracted.
+        :type stream_extract: bool, optional
+        :param file_filter: Function which gets file path relative to the directory (e.g. "checkpoints/best.pth")
+            and returns True if the file has to be saved. Works only with stream_extract.
+        :type file_filter: Callable[[str], bool], optional
         :return: None
         :rtype: :class:`NoneType`
         :Usage example:
@@ -545,9 +636,16 @@ class FileApi(ModuleApiBase):
             local_save_path = "/home/admin/Downloads/My_local_test"
 
             api.file.download_directory(9, path_to_dir, local_save_path)
+
+            # download only .pth files
+            api.file.download_directory(
+                9, path_to_dir, local_save_path, file_filter=lambda path: path.endswith(".pth")
+            )
         """
         if not remote_path.endswith("/"):
             remote_path += "/"
+        if file_filter is not None and not stream_extract:
+            raise ValueError("file_filter can be used only with stream_extract=True")
 
         if self.is_on_agent(remote_path) is True:
             agent_id, path_in_agent_folder = self.parse_agent_id_and_path(remote_path)
@@ -557,9 +655,23 @@ class FileApi(ModuleApiBase):
             ):
                 dir_on_agent = os.path.normpath(env.agent_storage() + path_in_agent_folder)
                 logger.info(f"Optimized download from agent: {dir_on_agent}")
-                sly_fs.copy_dir_recursively(dir_on_agent, local_save_path)
+                if file_filter is None:
+                    sly_fs.copy_dir_recursively(dir_on_agent, local_save_path)
+                    return
+                for src_path in sly_fs.list_files_recursively(dir_on_agent):
+                    rel_path = os.path.relpath(src_path, dir_on_agent).replace(os.sep, "/")
+                    if file_filter(rel_path):
+                        dst_path = os.path.join(local_save_path, rel_path)
+                        ensure_base_path(dst_path)
+                        sly_fs.copy_file(src_path, dst_path)
                 return
 
+        if stream_extract:
+            self._download_directory_stream(
+                team_id, remote_path, local_save_path, progress_cb, file_filter
+            )
+            return
+
         local_temp_archive = os.path.join(local_save_path, "temp.tar")
         self.download(team_id, remote_path, local_temp_archive, cache=None, progress_cb=progress_cb)
         tr = tarfile.open(local_temp_archive)
@@ -573,6 +685,52 @@ class FileApi(ModuleApiBase):
             shutil.move(os.path.join(temp_dir, file_name), local_save_path)
         shutil.rmtree(temp_dir)
 
+    def _download_directory_stream(
+        self, team_id, remote_path, local_save_path, progress_cb=None, file_filter=None
+    ):
+        """
+        Private method. Extracts tar archive of the directory while it is downloading.
+        Archive contains directory itself, its content is saved to local_save_path.
+        """
+        response = self._api.post(
+            "file-storage.download",
+            {ApiField.TEAM_ID: team_id, ApiField.PATH: remote_path},
+            stream=True,
+        )
+        root_name = os.path.basename(os.path.normpath(remote_path))
+        local_root = os.path.realpath(local_save_path)
+        sly_fs.mkdir(local_root)
+
+        stream = _ResponseStream(response, progress_cb)
+        try:
+            # "r|" mode reads archive sequentially, members can not be accessed in random order
+            with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                for member in tar:
+                    parts = [part for part in member.name.split("/") if part not in ("", ".")]
+                    if len(parts) > 0 and parts[0] == root_name:
+                        parts = parts[1:]
+                    if len(parts) == 0:
+                        continue
+                    rel_path = "/".join(parts)
+                    dst_path = os.path.realpath(os.path.join(local_root, *parts))
+                    if os.path.commonpath([local_root, dst_path]) != local_root:
+                        logger.warn(f"Skipped archive member outside of the directory: {member.name}")
+                        continue
+                    if member.isdir():
+                        if file_filter is None:
+                            sly_fs.mkdir(dst_path)
+                        continue
+                    if not member.isfile():
+                        # links and special files are not created
+                        continue
+                    if file_filter is not None and not file_filter(rel_path):
+                        continue
+                    ensure_base_path(dst_path)
+                    with tar.extractfile(member) as src, open(dst_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=1024 * 1024)
+        finally:
+            response.close()
+
     def _upload_legacy(self, team_id, src, dst):
         """ """
 
@@ -714,6 +872,160 @@ class FileApi(ModuleApiBase):
         results = [self._convert_json_info(info_json) for info_json in resp.json()]
         return results
 
+    def upload_files(
+        self,
+        team_id: int,
+        src_paths: List[str],
+        dst_paths: List[str],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 4,
+        journal_path: Optional[str] = None,
+        batch_size: Optional[int] = 50,
+        batch_size_bytes: Optional[int] = 64 * 1024 * 1024,
+    ) -> List[FileInfo]:
+        """
+        Upload Files to Team Files with several parallel requests. Small files are grouped into requests
+        of at most batch_size files and batch_size_bytes bytes, large files are uploaded one per request.
+        Every request is retried separately, so an error does not restart the whole upload.
+        If journal_path is given, uploaded files are recorded to this local file
+        and are skipped when upload is started again, e.g. after interruption.
+
+        :param team_id: Team ID in Supervisely.
+        :type team_id: int
+        :param src_paths: Local source file paths.
+        :type src_paths: List[str]
+        :param dst_paths: Destination paths for Files to Team Files.
+        :type dst_paths: List[str]
+        :param progress_cb: Function for tracking upload progress, gets number of uploaded bytes.
+        :type progress_cb: tqdm or callable, optional
+        :param num_workers: Number of parallel requests.
+        :type num_workers: int, optional
+        :param journal_path: Local path to the journal of uploaded files.
+        :type journal_path: str, optional
+        :param batch_size: Max number of files in one request.
+        :type batch_size: int, optional
+        :param batch_size_bytes: Max size of files in one request, larger files are uploaded alone.
+        :type batch_size_bytes: int, optional
+        :return: Information about Files. See :class:`info_sequence<info_sequence>`
+        :rtype: :class:`List[FileInfo]`
+        :Usage example:
+
+         .. code-block:: python
+
+            import supervisely as sly
+
+            os.environ['SERVER_ADDRESS'] = 'https://app.supervise.ly'
+            os.environ['API_TOKEN'] = 'Your Supervisely API Token'
+            api = sly.Api.from_env()
+
+            local_files = sly.fs.list_files_recursively("/home/admin/checkpoints")
+            remote_files = [path.replace("/home/admin", "/my_app") for path in local_files]
+
+            # run it again with the same journal to continue interrupted upload
+            api.file.upload_files(
+                8, local_files, remote_files, journal_path="/home/admin/upload_journal.jsonl"
+            )
+        """
+        if len(src_paths) != len(dst_paths):
+            raise ValueError(
+                'Can not match "src_paths" and "dst_paths" lists, len(src_paths) != len(dst_paths)'
+            )
+        journal = _UploadJournal(journal_path, team_id)
+        results = [None] * len(src_paths)
+        progress_lock = threading.Lock()
+
+        def _report(size):
+            if progress_cb is not None and size > 0:
+                with progress_lock:
+                    progress_cb(size)
+
+        # files uploaded before are skipped, other files are grouped into requests
+        batches, batch, batch_bytes = [], [], 0
+        for idx, (src, dst) in enumerate(zip(src_paths, dst_paths)):
+            uploaded_info = journal.get_uploaded_info(src, dst)
+            if uploaded_info is not None:
+                results[idx] = self._convert_json_info(uploaded_info)
+                _report(get_file_size(src))
+                continue
+            size = get_file_size(src)
+            if len(batch) > 0 and (
+                len(batch) >= batch_size or batch_bytes + size > batch_size_bytes
+            ):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(idx)
+            batch_bytes += size
+        if len(batch) > 0:
+            batches.append(batch)
+
+        def _upload_batch(indices):
+            srcs = [src_paths[idx] for idx in indices]
+            dsts = [dst_paths[idx] for idx in indices]
+            total_size = sum(get_file_size(src) for src in srcs)
+            reported = [0]
+
+            def _monitor_cb(monitor):
+                # bytes are reported only once even if request is retried
+                done = min(monitor.bytes_read, total_size)
+                if done > reported[0]:
+                    _report(done - reported[0])
+                    reported[0] = done
+
+            infos_json = self._upload_bulk_with_retries(team_id, srcs, dsts, _monitor_cb)
+            _report(total_size - reported[0])
+            journal.add(srcs, dsts, infos_json)
+            for idx, info_json in zip(indices, infos_json):
+                results[idx] = self._convert_json_info(info_json)
+
+        try:
+            for _ in concurrent_map(_upload_batch, batches, num_workers):
+                pass
+        finally:
+            journal.close()
+        return results
+
+    def _upload_bulk_with_retries(self, team_id, src_paths, dst_paths, monitor_cb=None):
+        """
+        Private method. Uploads files with one request. Multipart body is a stream
+        which can be read once, so new body is created for every attempt.
+        """
+        retries = self._api.retry_count
+        for retry_idx in range(retries):
+            content_dict = []
+            files = []
+            try:
+                for src, dst in zip(src_paths, dst_paths):
+                    name = get_file_name_with_ext(dst)
+                    dst_dir = os.path.dirname(dst)
+                    if not dst_dir.endswith("/"):
+                        dst_dir += "/"
+                    file = open(src, "rb")
+                    files.append(file)
+                    content_dict.append((ApiField.NAME, name))
+                    content_dict.append((ApiField.PATH, dst_dir))
+                    content_dict.append(
+                        ("file", (name, file, mimetypes.MimeTypes().guess_type(src)[0]))
+                    )
+                encoder = MultipartEncoder(fields=content_dict)
+                data = encoder if monitor_cb is None else MultipartEncoderMonitor(encoder, monitor_cb)
+                resp = self._api.post(
+                    "file-storage.bulk.upload?teamId={}".format(team_id), data, retries=1
+                )
+                return resp.json()
+            except requests.exceptions.RetryError:
+                if retry_idx + 1 == retries:
+                    raise
+                logger.warn(
+                    f"Upload of {len(src_paths)} files failed, retrying ({retry_idx + 1}/{retries})"
+                )
+                # Api.post with single attempt waits only retry_sleep_sec before raising,
+                # the rest of exponential backoff (as in Api.post retries) is waited here
+                sleep_sec = min(self._api.retry_sleep_sec * (2**retry_idx), 60)
+                time.sleep(max(sleep_sec - self._api.retry_sleep_sec, 0))
+            finally:
+                for file in files:
+                    file.close()
+
     def rename(self, old_name: str, new_name: str) -> None:
         """
         Renames file in Team Files
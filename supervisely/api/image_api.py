@@ -6,20 +6,22 @@ from __future__ import annotations
 
 import io
 import json
-import re
 import urllib.parse
 from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Union
 
 import numpy as np
-from requests_toolbelt import MultipartDecoder, MultipartEncoder
+from requests_toolbelt import MultipartEncoder
 from tqdm import tqdm
 
 from supervisely._utils import (
     abs_url,
     batched,
+    batched_iter,
     compress_image_url,
+    concurrent_map,
     generate_free_name,
     is_development,
+    prefetch_iterator,
 )
 from supervisely.annotation.tag_meta import TagMeta
 from supervisely.api.module_api import (
@@ -31,9 +33,11 @@ from supervisely.imaging import image as sly_image
 from supervisely.io.fs import (
     ensure_base_path,
     get_file_ext,
-    get_file_hash,
+    get_file_hashes,
     get_file_name,
 )
+from supervisely.io.fs_cache import FileHashCache
+from supervisely.io.multipart_stream_decoder import MultipartStreamDecoder
 from supervisely.sly_logger import logger
 
 
@@ -586,26 +590,33 @@ class ImageApi(RemoveableBulkModuleApi):
         self.download_path(id=id, path=path)
 
     def _download_batch(
-        self, dataset_id: int, ids: List[int], progress_cb: Optional[Union[tqdm, Callable]] = None
+        self,
+        dataset_id: int,
+        ids: List[int],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ):
         """
         Get image id and it content from given dataset and list of images ids.
+        Parts are yielded as :class:`StreamPart` objects while the response is still
+        downloading, each part must be consumed before the next one is requested.
+        If num_workers > 1, up to num_workers batch requests are kept in flight,
+        parts are still yielded batch by batch in the order of given ids batches.
         """
-        for batch_ids in batched(ids):
-            response = self._api.post(
+
+        def _request_batch(batch_ids):
+            return self._api.post(
                 "images.bulk.download",
                 {ApiField.DATASET_ID: dataset_id, ApiField.IMAGE_IDS: batch_ids},
+                stream=True,
             )
-            decoder = MultipartDecoder.from_response(response)
-            for part in decoder.parts:
-                content_utf8 = part.headers[b"Content-Disposition"].decode("utf-8")
-                # Find name="1245" preceded by a whitespace, semicolon or beginning of line.
-                # The regex has 2 capture group: one for the prefix and one for the actual name value.
-                img_id = int(re.findall(r'(^|[\s;])name="(\d*)"', content_utf8)[0][1])
 
-                if progress_cb is not None:
-                    progress_cb(1)
-                yield img_id, part
+        for response in concurrent_map(_request_batch, batched(ids), num_workers):
+            with MultipartStreamDecoder.from_response(response) as decoder:
+                for part in decoder:
+                    yield int(part.name), part
+                    if progress_cb is not None:
+                        progress_cb(1)
 
     def download_paths(
         self,
@@ -613,6 +624,7 @@ class ImageApi(RemoveableBulkModuleApi):
         ids: List[int],
         paths: List[str],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ) -> None:
         """
         Download Images with given ids and saves them for the given paths.
@@ -625,6 +637,8 @@ class ImageApi(RemoveableBulkModuleApi):
         :type paths: :class:`List[str]`
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param num_workers: Number of batch requests kept in flight at the same time. Images are written to disk while next batches are downloading.
+        :type num_workers: int, optional
         :raises: :class:`ValueError` if len(ids) != len(paths)
         :return: None
         :rtype: :class:`NoneType`
@@ -664,12 +678,15 @@ class ImageApi(RemoveableBulkModuleApi):
             raise ValueError('Can not match "ids" and "paths" lists, len(ids) != len(paths)')
 
         id_to_path = {id: path for id, path in zip(ids, paths)}
-        for img_id, resp_part in self._download_batch(dataset_id, ids, progress_cb):
-            with open(id_to_path[img_id], "wb") as w:
-                w.write(resp_part.content)
+        for img_id, resp_part in self._download_batch(dataset_id, ids, progress_cb, num_workers):
+            resp_part.save(id_to_path[img_id])
 
     def download_bytes(
-        self, dataset_id: int, ids: List[int], progress_cb: Optional[Union[tqdm, Callable]] = None
+        self,
+        dataset_id: int,
+        ids: List[int],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ) -> List[bytes]:
         """
         Download Images with given IDs from Dataset in Binary format.
@@ -680,6 +697,8 @@ class ImageApi(RemoveableBulkModuleApi):
         :type ids: List[int]
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param num_workers: Number of batch requests kept in flight at the same time.
+        :type num_workers: int, optional
         :return: List of Images in binary format
         :rtype: :class:`List[bytes]`
         :Usage example:
@@ -700,7 +719,7 @@ class ImageApi(RemoveableBulkModuleApi):
             return []
 
         id_to_img = {}
-        for img_id, resp_part in self._download_batch(dataset_id, ids, progress_cb):
+        for img_id, resp_part in self._download_batch(dataset_id, ids, progress_cb, num_workers):
             id_to_img[img_id] = resp_part.content
 
         return [id_to_img[id] for id in ids]
@@ -711,6 +730,7 @@ class ImageApi(RemoveableBulkModuleApi):
         ids: List[int],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         keep_alpha: Optional[bool] = False,
+        num_workers: Optional[int] = 1,
     ) -> List[np.ndarray]:
         """
         Download Images with given IDs in numpy format.
@@ -723,6 +743,8 @@ class ImageApi(RemoveableBulkModuleApi):
         :type progress_cb: tqdm or callable, optional
         :param keep_alpha: If True keeps alpha mask for Image, otherwise don't.
         :type keep_alpha: bool, optional
+        :param num_workers: Number of batch requests kept in flight at the same time.
+        :type num_workers: int, optional
         :return: List of Images in RGB numpy matrix format
         :rtype: :class:`List[np.ndarray]`
         :Usage example:
@@ -741,7 +763,7 @@ class ImageApi(RemoveableBulkModuleApi):
         return [
             sly_image.read_bytes(img_bytes, keep_alpha)
             for img_bytes in self.download_bytes(
-                dataset_id=dataset_id, ids=ids, progress_cb=progress_cb
+                dataset_id=dataset_id, ids=ids, progress_cb=progress_cb, num_workers=num_workers
             )
         ]
 
@@ -874,36 +896,57 @@ class ImageApi(RemoveableBulkModuleApi):
         :param func_item_to_byte_stream: converter for "item" to byte stream
         :param items_hashes: iterable of pairs (item, hash) where "item" is a some descriptor (e.g. image file path)
          for image data, and "hash" is a hash for the image binary data
-        :param retry_cnt: int, number of retries to send the whole set of items
+        :param retry_cnt: int, number of attempts to send every batch of items
         :param progress_cb: callback or tqdm object to account progress (in number of items)
         """
-        hash_to_items = {i_hash: item for item, i_hash in items_hashes}
+        # hashes are checked on server by chunks while the next items are still being hashed
+        hash_to_items = {}
+        remote_hashes = set()
+        for chunk in batched_iter(items_hashes, batch_size=900):
+            new_hashes = []
+            for item, i_hash in chunk:
+                if i_hash not in hash_to_items:
+                    new_hashes.append(i_hash)
+                hash_to_items[i_hash] = item
+            existing_hashes = self.check_existing_hashes(new_hashes)  # existing -- from server
+            remote_hashes.update(existing_hashes)
+            if progress_cb:
+                progress_cb(len(existing_hashes))
+        pending_hashes_items = [
+            (i_hash, item) for i_hash, item in hash_to_items.items() if i_hash not in remote_hashes
+        ]
+        for hashes_items in batched(pending_hashes_items):
+            self._upload_uniq_images_with_retries(
+                func_item_to_byte_stream, hashes_items, retry_cnt=retry_cnt
+            )
+            if progress_cb:
+                progress_cb(len(hashes_items))
 
-        unique_hashes = set(hash_to_items.keys())
-        remote_hashes = set(
-            self.check_existing_hashes(list(unique_hashes))
-        )  # existing -- from server
-        if progress_cb:
-            progress_cb(len(remote_hashes))
-        pending_hashes = unique_hashes - remote_hashes
+    def _upload_uniq_images_with_retries(
+        self, func_item_to_byte_stream, hashes_items_to_upload, retry_cnt=3
+    ):
+        """
+        Upload images (binary data) to server, retrying the items which were not uploaded.
+        :param func_item_to_byte_stream: converter for "item" to byte stream
+        :param hashes_items_to_upload: list of pairs (hash, item) of unique images that aren't exist at server
+        :param retry_cnt: int, number of attempts to send the items
+        :raises: :class:`ValueError` if some items are not uploaded after all attempts
+        """
+        hash_to_items = dict(hashes_items_to_upload)
+        pending_hashes = set(hash_to_items.keys())
 
         # @TODO: some correlation with sly.io.network_exceptions. Should we perform retries here?
         for retry_idx in range(retry_cnt):
-            # single attempt to upload all data which is not uploaded yet
-
-            for hashes in batched(list(pending_hashes)):
-                pending_hashes_items = [(h, hash_to_items[h]) for h in hashes]
-                hashes_rcv = self._upload_uniq_images_single_req(
-                    func_item_to_byte_stream, pending_hashes_items
+            hashes = [h for h, _ in hashes_items_to_upload if h in pending_hashes]
+            hashes_rcv = self._upload_uniq_images_single_req(
+                func_item_to_byte_stream, [(h, hash_to_items[h]) for h in hashes]
+            )
+            pending_hashes -= set(hashes_rcv)
+            if set(hashes_rcv) - set(hashes):
+                logger.warn(
+                    "Hash inconsistency in images bulk upload.",
+                    extra={"sent": hashes, "received": hashes_rcv},
                 )
-                pending_hashes -= set(hashes_rcv)
-                if set(hashes_rcv) - set(hashes):
-                    logger.warn(
-                        "Hash inconsistency in images bulk upload.",
-                        extra={"sent": hashes, "received": hashes_rcv},
-                    )
-                if progress_cb:
-                    progress_cb(len(hashes_rcv))
 
             if not pending_hashes:
                 return
@@ -929,6 +972,98 @@ class ImageApi(RemoveableBulkModuleApi):
             "Please check if images are in supported format and if ones aren't corrupted."
         )
 
+    def _upload_data_pipeline(
+        self,
+        dataset_id,
+        func_item_to_byte_stream,
+        names,
+        items_hashes,
+        metas=None,
+        progress_cb=None,
+        batch_size=50,
+        prefetch_batches=2,
+        check_workers=2,
+        upload_workers=4,
+        add_workers=2,
+        retry_cnt=3,
+    ):
+        """
+        Upload images to dataset as a stream of batches. Every batch goes through the stages
+        independently: hashes check, upload of missing binary data and adding to dataset, so the first
+        images appear in dataset while the next ones are still being hashed and uploaded.
+        Number of batches in flight is limited at every stage, so a slow stage holds the previous ones.
+        :param dataset_id: int, destination dataset ID
+        :param func_item_to_byte_stream: converter for "item" to byte stream
+        :param names: list of images names
+        :param items_hashes: iterable of pairs (item, hash) in the order of names, may be lazy (e.g. generator
+         which hashes files), hashes are taken from it in a background thread
+        :param metas: list of images metadata
+        :param progress_cb: callback or tqdm object to account progress (in number of images added to dataset)
+        :param batch_size: int, number of images in batch
+        :param prefetch_batches: int, number of hashed batches which are ready ahead of hashes check
+        :param check_workers: int, number of concurrent hashes check requests
+        :param upload_workers: int, number of concurrent binary data upload requests
+        :param add_workers: int, number of concurrent requests which add images to dataset
+        :param retry_cnt: int, number of attempts to upload binary data of every batch
+        :return: list of images infos in the order of names
+        """
+        if metas is None:
+            metas = [{}] * len(names)
+
+        def _hashed_batches():
+            # each new hash is uploaded by the first batch which contains it, the batches are added
+            # to dataset in order, so the data of the next batches is always uploaded before adding
+            known_hashes = set()
+            for batch in batched_iter(zip(names, items_hashes, metas), batch_size=batch_size):
+                new_hashes_items = {}
+                for _, (item, i_hash), _ in batch:
+                    if i_hash not in known_hashes:
+                        known_hashes.add(i_hash)
+                        new_hashes_items[i_hash] = item
+                yield batch, new_hashes_items
+
+        def _check(task):
+            batch, new_hashes_items = task
+            existing_hashes = set(self.check_existing_hashes(list(new_hashes_items.keys())))
+            hashes_items = [
+                (i_hash, item)
+                for i_hash, item in new_hashes_items.items()
+                if i_hash not in existing_hashes
+            ]
+            return batch, hashes_items
+
+        def _upload(task):
+            batch, hashes_items = task
+            if len(hashes_items) > 0:
+                self._upload_uniq_images_with_retries(
+                    func_item_to_byte_stream, hashes_items, retry_cnt=retry_cnt
+                )
+            return batch
+
+        def _add(batch):
+            batch_names = [name for name, _, _ in batch]
+            batch_hashes = [i_hash for _, (_, i_hash), _ in batch]
+            batch_metas = [meta for _, _, meta in batch]
+            return self._upload_bulk_add(
+                lambda item: (ApiField.HASH, item),
+                dataset_id,
+                batch_names,
+                batch_hashes,
+                metas=batch_metas,
+                batch_size=len(batch),
+            )
+
+        hashed = prefetch_iterator(_hashed_batches(), buffer_size=prefetch_batches)
+        checked = concurrent_map(_check, hashed, num_workers=check_workers)
+        uploaded = concurrent_map(_upload, checked, num_workers=upload_workers)
+
+        results = []
+        for infos in concurrent_map(_add, uploaded, num_workers=add_workers):
+            results.extend(infos)
+            if progress_cb is not None:
+                progress_cb(len(infos))
+        return results
+
     def upload_path(
         self, dataset_id: int, name: str, path: str, meta: Optional[Dict] = None
     ) -> ImageInfo:
@@ -967,6 +1102,11 @@ class ImageApi(RemoveableBulkModuleApi):
         paths: List[str],
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         metas: Optional[List[Dict]] = None,
+        num_workers: Optional[int] = 4,
+        hash_cache: Optional[FileHashCache] = None,
+        upload_workers: Optional[int] = 4,
+        add_workers: Optional[int] = 2,
+        batch_size: Optional[int] = 50,
     ) -> List[ImageInfo]:
         """
         Uploads Images with given names from given local path to Dataset.
@@ -977,10 +1117,20 @@ class ImageApi(RemoveableBulkModuleApi):
         :type names: List[str]
         :param paths: List of local Images pathes.
         :type paths: List[str]
-        :param progress_cb: Function for tracking the progress of uploading.
+        :param progress_cb: Function for tracking the progress of uploading, gets number of images added to Dataset (not the number of uploaded images data, which may be already on server).
         :type progress_cb: tqdm or callable, optional
         :param metas: Images metadata.
         :type metas: List[dict], optional
+        :param num_workers: Number of images hashed concurrently.
+        :type num_workers: int, optional
+        :param hash_cache: Persistent cache of files hashes, unchanged files are not hashed again.
+        :type hash_cache: FileHashCache, optional
+        :param upload_workers: Number of concurrent requests uploading images data.
+        :type upload_workers: int, optional
+        :param add_workers: Number of concurrent requests adding uploaded images to Dataset.
+        :type add_workers: int, optional
+        :param batch_size: Number of images in each upload request. Batches are hashed, uploaded and added to Dataset independently, so the first images appear in Dataset before the rest are hashed.
+        :type batch_size: int, optional
         :raises: :class:`ValueError` if len(names) != len(paths)
         :return: List with information about Images. See :class:`info_sequence<info_sequence>`
         :rtype: :class:`List[ImageInfo]`
@@ -1001,10 +1151,25 @@ class ImageApi(RemoveableBulkModuleApi):
         def path_to_bytes_stream(path):
             return open(path, "rb")
 
-        hashes = [get_file_hash(x) for x in paths]
+        if len(names) != len(paths):
+            raise ValueError('Can not match "names" and "paths" lists, len(names) != len(paths)')
+        if metas is not None and len(names) != len(metas):
+            raise ValueError('Can not match "names" and "metas" len(names) != len(metas)')
 
-        self._upload_data_bulk(path_to_bytes_stream, zip(paths, hashes), progress_cb=progress_cb)
-        return self.upload_hashes(dataset_id, names, hashes, metas=metas)
+        paths_hashes = zip(
+            paths, get_file_hashes(paths, num_workers=num_workers, cache=hash_cache)
+        )
+        return self._upload_data_pipeline(
+            dataset_id,
+            path_to_bytes_stream,
+            names,
+            paths_hashes,
+            metas=metas,
+            progress_cb=progress_cb,
+            batch_size=batch_size,
+            upload_workers=upload_workers,
+            add_workers=add_workers,
+        )
 
     def upload_np(
         self, dataset_id: int, name: str, img: np.ndarray, meta: Optional[Dict] = None
@@ -2041,15 +2206,11 @@ class ImageApi(RemoveableBulkModuleApi):
         """ """
         for batch_hashes in batched(hashes):
             response = self._api.post(
-                "images.bulk.download-by-hash", {ApiField.HASHES: batch_hashes}
+                "images.bulk.download-by-hash", {ApiField.HASHES: batch_hashes}, stream=True
             )
-            decoder = MultipartDecoder.from_response(response)
-            for part in decoder.parts:
-                content_utf8 = part.headers[b"Content-Disposition"].decode("utf-8")
-                # Find name="1245" preceded by a whitespace, semicolon or beginning of line.
-                # The regex has 2 capture group: one for the prefix and one for the actual name value.
-                h = content_utf8.replace('form-data; name="', "")[:-1]
-                yield h, part
+            with MultipartStreamDecoder.from_response(response) as decoder:
+                for part in decoder:
+                    yield part.name, part
 
     def download_paths_by_hashes(
         self,
@@ -2098,8 +2259,7 @@ class ImageApi(RemoveableBulkModuleApi):
         h_to_path = {h: path for h, path in zip(hashes, paths)}
         for h, resp_part in self._download_batch_by_hashes(list(set(hashes))):
             ensure_base_path(h_to_path[h])
-            with open(h_to_path[h], "wb") as w:
-                w.write(resp_part.content)
+            resp_part.save(h_to_path[h])
             if progress_cb is not None:
                 progress_cb(1)
 
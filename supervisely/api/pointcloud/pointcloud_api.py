@@ -400,6 +400,45 @@ class PointcloudApi(RemoveableBulkModuleApi):
             convert_json_info_cb=lambda x: x,
         )
 
+    def get_list_related_images_batch(self, dataset_id: int, ids: List[int]) -> List[List]:
+        """
+        Get information about related context images of several point clouds from one dataset
+        with one request per batch of point clouds.
+
+        :param dataset_id: Dataset ID in Supervisely.
+        :type dataset_id: int
+        :param ids: Point clouds IDs in Supervisely.
+        :type ids: List[int]
+        :return: Lists of dictionaries with informations about related images, in the order of given IDs
+        :rtype: List[List]
+        :Usage example:
+
+         .. code-block:: python
+
+            import supervisely as sly
+
+            os.environ['SERVER_ADDRESS'] = 'https://app.supervise.ly'
+            os.environ['API_TOKEN'] = 'Your Supervisely API Token'
+            api = sly.Api.from_env()
+
+            dataset_id = 62664
+            pcd_ids = [19373403, 19373404]
+            img_infos = api.pointcloud.get_list_related_images_batch(dataset_id, pcd_ids)
+            print(len(img_infos[0]))
+            # Output: 6
+        """
+        id_to_images = defaultdict(list)
+        for batch_ids in batched(ids):
+            filters = [{"field": ApiField.ENTITY_ID, "operator": "in", "value": batch_ids}]
+            infos = self.get_list_all_pages(
+                "point-clouds.images.list",
+                {ApiField.DATASET_ID: dataset_id, ApiField.FILTER: filters},
+                convert_json_info_cb=lambda x: x,
+            )
+            for info in infos:
+                id_to_images[info[ApiField.ENTITY_ID]].append(info)
+        return [id_to_images[id] for id in ids]
+
     def download_related_image(self, id: int, path: str) -> Response:
         """
         Download a related context image from Supervisely to local directory by image id.
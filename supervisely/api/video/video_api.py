@@ -18,11 +18,12 @@ from supervisely.api.video.video_figure_api import VideoFigureApi
 from supervisely.api.video.video_frame_api import VideoFrameAPI
 from supervisely.api.video.video_tag_api import VideoTagApi
 from supervisely.sly_logger import logger
-from supervisely.io.fs import get_file_ext, get_file_hash, get_file_size
+from supervisely.io.fs import get_file_ext, get_file_hash, get_file_hashes, get_file_size
+from supervisely.io.fs_cache import FileHashCache
 import supervisely.io.fs as sly_fs
 
 from supervisely.io.fs import ensure_base_path
-from supervisely._utils import batched, is_development, abs_url, rand_str
+from supervisely._utils import batched, batched_iter, is_development, abs_url, rand_str
 from supervisely.video.video import (
     get_info,
     get_video_streams,
@@ -997,6 +998,8 @@ class VideoApi(RemoveableBulkModuleApi):
         metas: Optional[List[Dict]] = None,
         infos=None,
         item_progress=None,
+        num_workers: Optional[int] = 4,
+        hash_cache: Optional[FileHashCache] = None,
     ) -> List[VideoInfo]:
         """
         Uploads Videos with given names from given local paths to Dataset.
@@ -1015,6 +1018,10 @@ class VideoApi(RemoveableBulkModuleApi):
         :type infos:
         :param item_progress:
         :type item_progress:
+        :param num_workers: Number of videos hashed concurrently.
+        :type num_workers: int, optional
+        :param hash_cache: Persistent cache of files hashes, unchanged files are not hashed again.
+        :type hash_cache: FileHashCache, optional
         :return: List with information about Videos. See :class:`info_sequence<info_sequence>`
         :rtype: :class:`List[VideoInfo]`
         :Usage example:
@@ -1051,11 +1058,18 @@ class VideoApi(RemoveableBulkModuleApi):
             self._api.add_header("x-skip-processing", "true")
 
         video_info_results = []
-        hashes = [get_file_hash(x) for x in paths]
+        hashes = []
+
+        def _paths_hashes():
+            for path, path_hash in zip(
+                paths, get_file_hashes(paths, num_workers=num_workers, cache=hash_cache)
+            ):
+                hashes.append(path_hash)
+                yield path, path_hash
 
         self._upload_data_bulk(
             path_to_bytes_stream,
-            zip(paths, hashes),
+            _paths_hashes(),
             progress_cb=progress_cb,
             item_progress=item_progress,
         )
@@ -1219,16 +1233,21 @@ class VideoApi(RemoveableBulkModuleApi):
     ):
         """Private method. Used for batch uploading of multiple unique videos."""
 
-        hash_to_items = {i_hash: item for item, i_hash in items_hashes}
-
-        unique_hashes = set(hash_to_items.keys())
-        remote_hashes = set(
-            self.check_existing_hashes(list(unique_hashes))
-        )  # existing -- from server
-        if progress_cb:
-            progress_cb(len(remote_hashes))
+        # hashes are checked on server by chunks while the next items are still being hashed
+        hash_to_items = {}
+        remote_hashes = set()
+        for chunk in batched_iter(items_hashes, batch_size=900):
+            new_hashes = []
+            for item, i_hash in chunk:
+                if i_hash not in hash_to_items:
+                    new_hashes.append(i_hash)
+                hash_to_items[i_hash] = item
+            existing_hashes = self.check_existing_hashes(new_hashes)  # existing -- from server
+            remote_hashes.update(existing_hashes)
+            if progress_cb:
+                progress_cb(len(existing_hashes))
         # pending_hashes = unique_hashes #- remote_hashes #@TODO: only fo debug!
-        pending_hashes = unique_hashes - remote_hashes
+        pending_hashes = set(hash_to_items.keys()) - remote_hashes
 
         for retry_idx in range(retry_cnt):
             # single attempt to upload all data which is not uploaded yet
@@ -1,4 +1,10 @@
-from typing import List, NamedTuple, Optional, Union, Callable
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union, Callable
+
+import numpy as np
 from tqdm import tqdm
 
 from supervisely.api.module_api import ApiField, RemoveableBulkModuleApi
@@ -18,7 +24,7 @@ from supervisely.io.fs import (
 )
 from supervisely import volume
 import supervisely.volume.nrrd_encoder as nrrd_encoder
-from supervisely._utils import batched
+from supervisely._utils import batched, concurrent_map
 from supervisely import logger
 from supervisely.task.progress import Progress, tqdm_sly
 from supervisely.imaging.image import read_bytes
@@ -29,6 +35,46 @@ try:
 except ImportError:
     from typing_extensions import Literal
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # python < 3.8, slices are sent to encoding processes by value
+    shared_memory = None
+
+
+def _get_slice(np_data: np.ndarray, plane: str, index: int) -> np.ndarray:
+    if plane == Plane.SAGITTAL:
+        return np_data[index, :, :]
+    elif plane == Plane.CORONAL:
+        return np_data[:, index, :]
+    elif plane == Plane.AXIAL:
+        return np_data[:, :, index]
+    else:
+        raise ValueError(f"Unknown plane {plane}")
+
+
+def _encode_slices(slices: List[np.ndarray]) -> List[Tuple[bytes, str]]:
+    results = []
+    for pixel_data in slices:
+        img_bytes = nrrd_encoder.encode(pixel_data, header={"encoding": "gzip"}, compression_level=1)
+        results.append((img_bytes, get_bytes_hash(img_bytes)))
+    return results
+
+
+# volume in shared memory attached by every encoding process once
+_shared_volume = None
+
+
+def _attach_shared_volume(shm_name: str, shape: Tuple[int, ...], dtype: str):
+    global _shared_volume
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _shared_volume = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _encode_shared_slices(plane: str, indexes: List[int]) -> List[Tuple[bytes, str]]:
+    np_data = _shared_volume[1]
+    return _encode_slices([_get_slice(np_data, plane, i) for i in indexes])
+
 
 class VolumeInfo(NamedTuple):
     """
@@ -192,6 +238,9 @@ class VolumeApi(RemoveableBulkModuleApi):
         # self.frame = VideoFrameAPI(api)
         self.figure = VolumeFigureApi(api)
         self.tag = VolumeTagApi(api)
+        # volume meta is read for every downloaded slice, so it is cached for a short time
+        self._meta_cache: Dict[int, Tuple[float, dict]] = {}
+        self._meta_cache_lock = threading.Lock()
 
     @staticmethod
     def info_sequence():
@@ -581,9 +630,11 @@ class VolumeApi(RemoveableBulkModuleApi):
         meta: dict,
         progress_cb: Optional[Union[tqdm, Callable]] = None,
         batch_size: int = 30,
+        num_workers: Optional[int] = None,
     ):
         """
         Upload given Volume in numpy format with given name to Dataset.
+        Slices are encoded in parallel processes while previous batches of slices are uploaded.
 
         :param dataset_id: Dataset ID in Supervisely.
         :type dataset_id: int
@@ -595,6 +646,10 @@ class VolumeApi(RemoveableBulkModuleApi):
         :type meta: dict, optional
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param batch_size: Number of slices encoded and uploaded together.
+        :type batch_size: int, optional
+        :param num_workers: Number of processes encoding slices. Defaults to the number of CPUs.
+        :type num_workers: int, optional
         :return: Information about Volume. See :class:`info_sequence<info_sequence>`
         :rtype: :class:`VolumeInfo`
         :Usage example:
@@ -646,57 +701,100 @@ class VolumeApi(RemoveableBulkModuleApi):
         # z = 1 - axial
         planes = [Plane.SAGITTAL, Plane.CORONAL, Plane.AXIAL]
 
-        for plane, dimension in zip(planes, np_data.shape):
-            for batch in batched(list(range(dimension))):
-                slices = []
-                slices_bytes = []
-                slices_hashes = []
-                try:
-                    for i in batch:
-                        normal = Plane.get_normal(plane)
-
-                        if plane == Plane.SAGITTAL:
-                            pixel_data = np_data[i, :, :]
-                        elif plane == Plane.CORONAL:
-                            pixel_data = np_data[:, i, :]
-                        elif plane == Plane.AXIAL:
-                            pixel_data = np_data[:, :, i]
-                        else:
-                            raise ValueError(f"Unknown plane {plane}")
-
-                        img_bytes = nrrd_encoder.encode(
-                            pixel_data, header={"encoding": "gzip"}, compression_level=1
-                        )
-
-                        img_hash = get_bytes_hash(img_bytes)
-                        slices_bytes.append(img_bytes)
-                        slices_hashes.append(img_hash)
-                        slices.append(
-                            {
-                                "hash": img_hash,
-                                "sliceIndex": i,
-                                "normal": normal,
-                            }
-                        )
-
-                    if len(slices) > 0:
-                        self._api.image._upload_data_bulk(
-                            lambda v: v,
-                            zip(slices_bytes, slices_hashes),
-                        )
-                        self._upload_slices_bulk(volume_info.id, slices, progress_cb)
+        tasks = [
+            (plane, batch)
+            for plane, dimension in zip(planes, np_data.shape)
+            for batch in batched(list(range(dimension)), batch_size)
+        ]
+        self._upload_slices_np(volume_info.id, name, np_data, tasks, progress_cb, num_workers)
+        return volume_info
 
+    def _upload_slices_np(
+        self,
+        volume_id: int,
+        name: str,
+        np_data: np.ndarray,
+        tasks: List[Tuple[str, List[int]]],
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = None,
+    ):
+        """
+        Private method. Encodes batches of slices in process pool and uploads encoded batches
+        in background threads. At most num_workers batches are encoded and
+        at most 2 batches are uploaded at the same time, so memory usage is bounded.
+        Volume is passed to processes once through shared memory.
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, len(tasks)))
+
+        def _upload(task_and_slices):
+            (plane, batch), encoded = task_and_slices
+            if isinstance(encoded, Exception):
+                raise encoded
+            slices = [
+                {"hash": img_hash, "sliceIndex": i, "normal": Plane.get_normal(plane)}
+                for i, (_, img_hash) in zip(batch, encoded)
+            ]
+            if len(slices) > 0:
+                self._api.image._upload_data_bulk(lambda v: v, encoded)
+                self._upload_slices_bulk(volume_id, slices, progress_cb)
+
+        def _safe_upload(task_and_slices):
+            try:
+                _upload(task_and_slices)
+            except Exception as e:
+                exc_str = str(e)
+                logger.warn(
+                    "File skipped due to error: {}".format(exc_str),
+                    exc_info=True,
+                    extra={
+                        "exc_str": exc_str,
+                        "file_path": name,
+                    },
+                )
+
+        def _run(encode_task):
+            def _encode(task):
+                try:
+                    return task, encode_task(task)
                 except Exception as e:
-                    exc_str = str(e)
-                    logger.warn(
-                        "File skipped due to error: {}".format(exc_str),
-                        exc_info=True,
-                        extra={
-                            "exc_str": exc_str,
-                            "file_path": name,
-                        },
-                    )
-        return volume_info
+                    return task, e
+
+            encoded = concurrent_map(_encode, tasks, num_workers=num_workers)
+            for _ in concurrent_map(_safe_upload, encoded, num_workers=2):
+                pass
+
+        if num_workers == 1:
+            _run(lambda task: _encode_slices([_get_slice(np_data, task[0], i) for i in task[1]]))
+            return
+
+        shm, shared_np = None, None
+        if shared_memory is not None:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, np_data.nbytes))
+        try:
+            if shm is not None:
+                # the only copy of the volume, encoding processes read slices from it directly
+                shared_np = np.ndarray(np_data.shape, dtype=np_data.dtype, buffer=shm.buf)
+                shared_np[...] = np_data
+                executor = ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=_attach_shared_volume,
+                    initargs=(shm.name, np_data.shape, np_data.dtype.str),
+                )
+                encode_task = lambda task: executor.submit(_encode_shared_slices, *task).result()
+            else:
+                executor = ProcessPoolExecutor(max_workers=num_workers)
+                encode_task = lambda task: executor.submit(
+                    _encode_slices, [_get_slice(np_data, task[0], i) for i in task[1]]
+                ).result()
+            with executor:
+                _run(encode_task)
+        finally:
+            if shm is not None:
+                del shared_np
+                shm.close()
+                shm.unlink()
 
     def upload_dicom_serie_paths(
         self,
@@ -1005,8 +1103,123 @@ class VolumeApi(RemoveableBulkModuleApi):
             # Image downloaded as NumPy array. Image shape: (256, 256, 3)
         """
 
+        window_center, window_width = self._get_window(volume_id, window_center, window_width)
+        image_bytes = self._download_slice_bytes(
+            volume_id, slice_index, Plane.get_normal(plane), window_center, window_width
+        )
+        return read_bytes(image_bytes)
+
+    def download_slices_np(
+        self,
+        volume_id: int,
+        plane: Literal["sagittal", "coronal", "axial"],
+        indices: List[int],
+        window_center: float = None,
+        window_width: int = None,
+        num_workers: int = 8,
+        memmap_path: Optional[str] = None,
+        progress_cb: Optional[Union[tqdm, Callable]] = None,
+    ) -> np.ndarray:
+        """
+        Download slices with given indices of the plane as one NumPy array. Volume meta is requested
+        once, slices are downloaded concurrently.
+
+        :param volume_id: Volume ID in Supervisely.
+        :type volume_id: int
+        :param plane: :py:class:`Plane<supervisely.volume_annotation.plane.Plane>` of the slices in volume.
+        :type plane: str
+        :param indices: :py:class:`Slice<supervisely.volume_annotation.slice.Slice>` indices.
+        :type indices: List[int]
+        :param window_center: Window center.
+        :type window_center: float
+        :param window_width: Window width.
+        :type window_width: int
+        :param num_workers: Number of slices downloaded at the same time.
+        :type num_workers: int, optional
+        :param memmap_path: If given, slices are written to memory-mapped .npy file at this path
+            instead of memory.
+        :type memmap_path: str, optional
+        :param progress_cb: Function for tracking download progress.
+        :type progress_cb: tqdm or callable, optional
+        :return: Slices stacked along the first axis, shape is (len(indices), height, width, channels)
+        :rtype: :class:`np.ndarray`
+        :Usage example:
+
+         .. code-block:: python
+
+            import supervisely as sly
+
+            os.environ['SERVER_ADDRESS'] = 'https://app.supervise.ly'
+            os.environ['API_TOKEN'] = 'Your Supervisely API Token'
+            api = sly.Api.from_env()
+
+            slices_np = api.volume.download_slices_np(
+                volume_id=volume_id,
+                plane=sly.Plane.AXIAL,
+                indices=list(range(0, 100)),
+            )
+
+            print(f"Slices downloaded as NumPy array. Shape: {slices_np.shape}")
+
+            # Output:
+            # Slices downloaded as NumPy array. Shape: (100, 256, 256, 3)
+        """
         normal = Plane.get_normal(plane)
+        window_center, window_width = self._get_window(volume_id, window_center, window_width)
+
+        def _download(slice_index):
+            return read_bytes(
+                self._download_slice_bytes(
+                    volume_id, slice_index, normal, window_center, window_width
+                )
+            )
+
+        result = None
+        for i, slice_np in enumerate(concurrent_map(_download, indices, num_workers=num_workers)):
+            if result is None:
+                shape = (len(indices),) + slice_np.shape
+                if memmap_path is not None:
+                    ensure_base_path(memmap_path)
+                    result = np.lib.format.open_memmap(
+                        memmap_path, mode="w+", dtype=slice_np.dtype, shape=shape
+                    )
+                else:
+                    result = np.empty(shape, dtype=slice_np.dtype)
+            result[i] = slice_np
+            if progress_cb is not None:
+                progress_cb(1)
+
+        if result is None:
+            return np.empty((0,), dtype=np.uint8)
+        if memmap_path is not None:
+            result.flush()
+        return result
+
+    def _get_meta_cached(self, volume_id: int, ttl: float = 60) -> dict:
+        """
+        Private method. Returns volume meta requested at most ttl seconds ago.
+        """
+        now = time.monotonic()
+        with self._meta_cache_lock:
+            cached = self._meta_cache.get(volume_id)
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
         meta = self.get_info_by_id(volume_id).meta
+        with self._meta_cache_lock:
+            # expired entries are dropped not to grow the cache with every new volume
+            self._meta_cache = {
+                k: v for k, v in self._meta_cache.items() if now - v[0] < ttl
+            }
+            self._meta_cache[volume_id] = (now, meta)
+        return meta
+
+    def _get_window(self, volume_id: int, window_center: float = None, window_width: int = None):
+        """
+        Private method. Fills missing window center and width from volume meta.
+        """
+        if window_center is not None and window_width is not None:
+            return window_center, window_width
+        meta = self._get_meta_cached(volume_id)
 
         if window_center is None:
             if "windowCenter" in meta:
@@ -1019,7 +1232,14 @@ class VolumeApi(RemoveableBulkModuleApi):
                 window_width = meta["windowWidth"]
             else:
                 window_width = meta["intensity"]["max"] - meta["intensity"]["min"]
+        return window_center, window_width
 
+    def _download_slice_bytes(
+        self, volume_id: int, slice_index: int, normal: dict, window_center, window_width
+    ) -> bytes:
+        """
+        Private method. Downloads image of one slice.
+        """
         data = {
             "volumeId": volume_id,
             "sliceIndex": slice_index,
@@ -1027,8 +1247,6 @@ class VolumeApi(RemoveableBulkModuleApi):
             "windowCenter": window_center,
             "windowWidth": window_width,
         }
-        image_bytes = self._api.post(
+        return self._api.post(
             method="volumes.slices.images.download", data=data, stream=True
         ).content
-
-        return read_bytes(image_bytes)
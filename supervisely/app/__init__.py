@@ -14,3 +14,7 @@ from supervisely.app.exceptions import (
 
 from supervisely.app.import_template import Import
 from supervisely.app.export_template import Export
+
+from supervisely._utils import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
@@ -2,7 +2,6 @@ from typing import Optional
 
 import supervisely.io.env as env
 from supervisely.api.api import Api
-from supervisely.output import set_download
 from supervisely.sly_logger import logger
 
 
@@ -74,4 +73,7 @@ class Export:
         if type(local_path) is not str:
             raise ValueError("Path must be a 'string'")
 
+        # supervisely.output imports supervisely.app, so it is imported here to avoid circular import
+        from supervisely.output import set_download
+
         set_download(local_path)
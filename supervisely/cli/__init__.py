@@ -1 +1,5 @@
-from supervisely.cli.cli import cli
\ No newline at end of file
+from supervisely.cli.cli import cli
+
+from supervisely._utils import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
@@ -0,0 +1,3 @@
+from supervisely._utils import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
@@ -11,7 +11,6 @@ import zlib
 import io
 import cv2
 import numpy as np
-from distutils.version import StrictVersion
 
 from PIL import Image
 
@@ -26,6 +25,8 @@ from supervisely.imaging.image import read
 if not hasattr(np, "bool"):
     np.bool = np.bool_
 
+_CV2_MAJOR_VERSION = int(cv2.__version__.split(".")[0])
+
 
 class SkeletonizeMethod(Enum):
     """
@@ -271,7 +272,7 @@ class Bitmap(BitmapBase):
 
     def _draw_contour_impl(self, bitmap, color, thickness=1, config=None):
         """_draw_contour_impl"""
-        if StrictVersion(cv2.__version__) >= StrictVersion("4.0.0"):
+        if _CV2_MAJOR_VERSION >= 4:
             contours, _ = cv2.findContours(
                 self.data.astype(np.uint8), cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE
             )
@@ -423,7 +424,7 @@ class Bitmap(BitmapBase):
             figure_contours = figure.to_contours()
         """
         origin, mask = self.origin, self.data
-        if StrictVersion(cv2.__version__) >= StrictVersion("4.0.0"):
+        if _CV2_MAJOR_VERSION >= 4:
             contours, hier = cv2.findContours(
                 mask.astype(np.uint8),
                 mode=cv2.RETR_CCOMP,  # two-level hierarchy, to get polygons with holes
@@ -143,6 +143,29 @@ class ImageRotator:
         # Unwrap numpy types so that round() produces integer results.
         return PointLocation(row=round(transformed_np[0].item()), col=round(transformed_np[1].item()))
 
+    def transform_points_np(self, points: np.ndarray) -> np.ndarray:
+        """
+        Calculates new coordinates of points after rotation.
+
+        :param points: Array of (row, col) coordinates with shape (N, 2).
+        :type points: np.ndarray
+        :return: Array of rotated (row, col) coordinates with shape (N, 2), rounded to integers
+        :rtype: :class:`np.ndarray`
+        :Usage example:
+
+         .. code-block:: python
+
+            height, width = 300, 400
+            rotator = ImageRotator((height, width), 25)
+
+            rotated = rotator.transform_points_np(np.array([[100, 200]]))
+            print(rotated)
+            # Output: [[175 224]]
+        """
+        points_np_uniform = np.hstack([points, np.ones((len(points), 1))])
+        transformed_np = points_np_uniform.dot(self.affine_matrix.T)
+        return np.rint(transformed_np[:, :2]).astype(np.int64)
+
     def rotate_img(self, img: np.ndarray, use_inter_nearest: bool) -> np.ndarray:
         """
         Calculates new parameters of image after rotation.
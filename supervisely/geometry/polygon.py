@@ -12,11 +12,8 @@ from supervisely.geometry.rectangle import Rectangle
 from shapely.geometry import mapping, Polygon as ShapelyPolygon
 
 from supervisely.geometry.conversions import shapely_figure_to_coords_list
-from supervisely.geometry.point_location import (
-    row_col_list_to_points,
-    points_to_row_col_list,
-)
-from supervisely.geometry.vector_geometry import VectorGeometry
+from supervisely.geometry.point_location import points_to_row_col_list
+from supervisely.geometry.vector_geometry import VectorGeometry, json_coords_to_np
 from supervisely.geometry.constants import (
     EXTERIOR,
     INTERIOR,
@@ -87,13 +84,17 @@ class Polygon(VectorGeometry):
             created_at: Optional[str] = None,
     ):
         if len(exterior) < 3:
-            exterior.extend([exterior[-1]] * (3 - len(exterior)))
+            exterior = [*exterior, *[exterior[-1]] * (3 - len(exterior))]
             logger.warn(f'"{EXTERIOR}" field must contain at least 3 points to create "Polygon" object.')
             # raise ValueError('"{}" field must contain at least 3 points to create "Polygon" object.'.format(EXTERIOR))
-        for element in interior:
-            if len(element) < 3:
-                logger.warn(f'"{element}" interior field must contain at least 3 points to create "Polygon" object.')
-                element.extend([element[-1]] * (3 - len(element)))
+        if any(len(element) < 3 for element in interior):
+            padded_interior = []
+            for element in interior:
+                if len(element) < 3:
+                    logger.warn(f'"{element}" interior field must contain at least 3 points to create "Polygon" object.')
+                    element = [*element, *[element[-1]] * (3 - len(element))]
+                padded_interior.append(element)
+            interior = padded_interior
         # if any(len(element) < 3 for element in interior):
         #    raise ValueError('"{}" element must contain at least 3 points.'.format(INTERIOR))
 
@@ -148,13 +149,8 @@ class Polygon(VectorGeometry):
         sly_id = data.get(ID, None)
         class_id = data.get(CLASS_ID, None)
         return cls(
-            exterior=row_col_list_to_points(
-                data[POINTS][EXTERIOR], flip_row_col_order=True
-            ),
-            interior=[
-                row_col_list_to_points(i, flip_row_col_order=True)
-                for i in data[POINTS][INTERIOR]
-            ],
+            exterior=json_coords_to_np(data[POINTS][EXTERIOR]),
+            interior=[json_coords_to_np(i) for i in data[POINTS][INTERIOR]],
             sly_id=sly_id,
             class_id=class_id,
             labeler_login=labeler_login,
@@ -216,13 +212,11 @@ class Polygon(VectorGeometry):
                     and len(intersection) > 0
                     and len(intersection[0]) >= 3
             ):
-                exterior = row_col_list_to_points(intersection[0], do_round=True)
+                exterior = np.array(intersection[0])
                 interiors = []
                 for interior_contour in intersection[1:]:
                     if len(interior_contour) > 2:
-                        interiors.append(
-                            row_col_list_to_points(interior_contour, do_round=True)
-                        )
+                        interiors.append(np.array(interior_contour))
                 out_polygons.append(Polygon(exterior, interiors))
         return out_polygons
 
@@ -292,15 +286,10 @@ class Polygon(VectorGeometry):
             # Remember that Polygon class object is immutable, and we need to assign new instance of Polygon to a new variable
             approx_figure = figure.approx_dp(0.75)
         """
-        exterior_np = self._approx_ring_dp(
-            self.exterior_np, epsilon, closed=True
-        ).tolist()
-        interior_np = [
-            self._approx_ring_dp(x, epsilon, closed=True).tolist()
-            for x in self.interior_np
+        exterior = self._approx_ring_dp(self.exterior_np, epsilon, closed=True)
+        interior = [
+            self._approx_ring_dp(x, epsilon, closed=True) for x in self.interior_np
         ]
-        exterior = row_col_list_to_points(exterior_np, do_round=True)
-        interior = [row_col_list_to_points(x, do_round=True) for x in interior_np]
         return Polygon(exterior, interior)
 
     @classmethod
@@ -12,8 +12,7 @@ from supervisely.geometry.rectangle import Rectangle
 
 from shapely.geometry import mapping, LineString, Polygon as ShapelyPolygon
 from supervisely.geometry.conversions import shapely_figure_to_coords_list
-from supervisely.geometry.point_location import row_col_list_to_points
-from supervisely.geometry.vector_geometry import VectorGeometry
+from supervisely.geometry.vector_geometry import VectorGeometry, json_coords_to_np
 from supervisely.geometry.constants import (
     EXTERIOR,
     POINTS,
@@ -121,9 +120,7 @@ class Polyline(VectorGeometry):
         sly_id = data.get(ID, None)
         class_id = data.get(CLASS_ID, None)
         return cls(
-            exterior=row_col_list_to_points(
-                data[POINTS][EXTERIOR], flip_row_col_order=True
-            ),
+            exterior=json_coords_to_np(data[POINTS][EXTERIOR]),
             sly_id=sly_id,
             class_id=class_id,
             labeler_login=labeler_login,
@@ -179,7 +176,7 @@ class Polyline(VectorGeometry):
                         continue
                 lines_combined.append(simple_l)
 
-        return [Polyline(row_col_list_to_points(line)) for line in lines_combined]
+        return [Polyline(np.array(line)) for line in lines_combined]
 
     def _draw_impl(self, bitmap: np.ndarray, color, thickness=1, config=None):
         """
@@ -227,10 +224,7 @@ class Polyline(VectorGeometry):
             # Remember that Polyline class object is immutable, and we need to assign new instance of Polyline to a new variable
             approx_figure = figure.approx_dp(0.75)
         """
-        exterior_np = self._approx_ring_dp(
-            self.exterior_np, epsilon, closed=True
-        ).tolist()
-        exterior = row_col_list_to_points(exterior_np, do_round=True)
+        exterior = self._approx_ring_dp(self.exterior_np, epsilon, closed=True)
         return Polyline(exterior)
 
     @classmethod
@@ -2,7 +2,7 @@
 
 # docs
 from __future__ import annotations
-from copy import deepcopy
+from copy import copy
 import cv2
 import numpy as np
 from typing import List, Tuple, Dict, Optional, Union, Iterable
@@ -16,18 +16,73 @@ from supervisely.geometry.constants import (
     GEOMETRY_TYPE,
 )
 from supervisely.geometry.geometry import Geometry
-from supervisely.geometry.point_location import PointLocation, points_to_row_col_list
+from supervisely.geometry.point_location import PointLocation, row_col_list_to_points
 from supervisely.geometry.rectangle import Rectangle
+from supervisely.imaging import image as sly_image
+
+
+def _coords_to_np(coords, field_name: str) -> np.ndarray:
+    """
+    Converts list of PointLocation objects or (row, col) pairs or (N, 2) array
+    to (N, 2) int64 array of (row, col) coordinates. Coordinates are rounded the same way as in PointLocation.
+    """
+    if isinstance(coords, np.ndarray):
+        if coords.size == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise TypeError(
+                f'Array of coordinates in "{field_name}" must have shape (N, 2), got {coords.shape}'
+            )
+        points = coords
+    else:
+        if not isinstance(coords, list):
+            raise TypeError(f'"{field_name}" coords must be a list of coordinates')
+        rows_cols = []
+        for p in coords:
+            if isinstance(p, PointLocation):
+                rows_cols.append((p.row, p.col))
+            elif isinstance(p, (tuple, list, np.ndarray)) and len(p) == 2:
+                rows_cols.append(p)
+            else:
+                raise TypeError(
+                    f'Type of items (coordinates) in list "{field_name}" have to be tuple(int, int) or list[int, int] or PointLocation(row, col)'
+                )
+        if len(rows_cols) == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        points = np.array(rows_cols)
+    if points.dtype.kind != "i":
+        points = np.rint(points)
+    return points.astype(np.int64)
+
+
+def json_coords_to_np(coords: List[List[int, int]]) -> np.ndarray:
+    """
+    Converts list of coordinates in Supervisely JSON format, i.e. (col, row) pairs,
+    to (N, 2) array of (row, col) coordinates.
+
+    :param coords: List of (col, row) coordinates.
+    :type coords: List[List[int, int]]
+    :return: Array with shape (N, 2)
+    :rtype: :class:`np.ndarray`
+    """
+    if len(coords) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    points = np.array(coords)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError('Flipping row and column order values is only possible within tuples of 2 elements.')
+    return points[:, ::-1]
 
 
 class VectorGeometry(Geometry):
     """
     VectorGeometry is a base class of geometry for a single :class:`Label<supervisely.annotation.label.Label>`. :class:`VectorGeometry<VectorGeometry>` class object is immutable.
+    Coordinates are stored in (N, 2) numpy arrays of (row, col) pairs, :class:`PointLocation<supervisely.geometry.point_location.PointLocation>` objects are created only on request.
+    Passing numpy arrays to constructor is the fastest way to create VectorGeometry.
 
     :param exterior: Exterior coordinates, object contour is defined with these points (used for :class:`Polygon<supervisely.geometry.polygon.Polygon>`).
-    :type exterior: List[PointLocation], List[List[int, int]], List[Tuple[int, int]
+    :type exterior: List[PointLocation], List[List[int, int]], List[Tuple[int, int], np.ndarray
     :param interior: Interior coordinates, object holes is defined with these points (used for :class:`Polygon<supervisely.geometry.polygon.Polygon>`).
-    :type interior: List[List[PointLocation]], List[List[List[int, int]]], List[List[Tuple[int, int]]]
+    :type interior: List[List[PointLocation]], List[List[List[int, int]]], List[List[Tuple[int, int]]], List[np.ndarray]
     :param sly_id: VectorGeometry ID in Supervisely server.
     :type sly_id: int, optional
     :param class_id: ID of :class:`ObjClass<supervisely.annotation.obj_class.ObjClass>` to which VectorGeometry belongs.
@@ -49,6 +104,7 @@ class VectorGeometry(Geometry):
         exterior = [sly.PointLocation(730, 2104), sly.PointLocation(2479, 402), sly.PointLocation(3746, 1646)]
         # or exterior = [[730, 2104], [2479, 402], [3746, 1646]]
         # or exterior = [(730, 2104), (2479, 402), (3746, 1646)]
+        # or exterior = np.array([[730, 2104], [2479, 402], [3746, 1646]])
         interior = [[sly.PointLocation(1907, 1255), sly.PointLocation(2468, 875), sly.PointLocation(2679, 1577)]]
         # or interior = [[[730, 2104], [2479, 402], [3746, 1646]]]
         # or interior = [[(730, 2104), (2479, 402), (3746, 1646)]]
@@ -59,12 +115,13 @@ class VectorGeometry(Geometry):
     def __init__(
             self,
             exterior: Union[
-                List[PointLocation], List[List[int, int]], List[Tuple[int, int]]
+                List[PointLocation], List[List[int, int]], List[Tuple[int, int]], np.ndarray
             ],
             interior: Union[
                 List[List[PointLocation]],
                 List[List[List[int, int]]],
                 List[List[Tuple[int, int]]],
+                List[np.ndarray],
             ] = [],
             sly_id: Optional[int] = None,
             class_id: Optional[int] = None,
@@ -72,45 +129,14 @@ class VectorGeometry(Geometry):
             updated_at: Optional[str] = None,
             created_at: Optional[str] = None,
     ):
-        result_exterior = []
-        if not isinstance(exterior, list):
+        if not isinstance(exterior, (list, np.ndarray)):
             raise TypeError('Argument "exterior" must be a list of coordinates')
-        for p in exterior:
-            if isinstance(p, PointLocation):
-                result_exterior.append(p)
-            elif isinstance(p, tuple) and len(p) == 2:
-                result_exterior.append(PointLocation(p[0], p[1]))
-            elif isinstance(p, list) and len(p) == 2:
-                result_exterior.append(PointLocation(p[0], p[1]))
-            else:
-                raise TypeError(
-                    'Type of items (coordinates) in list "exterior" have to be tuple(int, int) or list[int, int] or PointLocation(row, col)'
-                )
-
-        result_interior = []
-        if not isinstance(interior, list):
+        if not isinstance(interior, (list, np.ndarray)):
             raise TypeError(
                 'Argument "interior" must be a list of lists with coordinates'
             )
-        for coords in interior:
-            if not isinstance(interior, list):
-                raise TypeError('"interior" coords must be a list of coordinates')
-            p_coords = []
-            for p in coords:
-                if isinstance(p, PointLocation):
-                    p_coords.append(p)
-                elif isinstance(p, tuple) and len(p) == 2:
-                    p_coords.append(PointLocation(p[0], p[1]))
-                elif isinstance(p, list) and len(p) == 2:
-                    p_coords.append(PointLocation(p[0], p[1]))
-                else:
-                    raise TypeError(
-                        'Type of items (coordinates) in list "interior" have to be tuple(int, int) or list[int, int] or PointLocation(row, col)'
-                    )
-            result_interior.append(p_coords)
-
-        self._exterior = deepcopy(result_exterior)
-        self._interior = deepcopy(result_interior)
+        self._exterior_np = _coords_to_np(exterior, EXTERIOR)
+        self._interior_np = [_coords_to_np(coords, INTERIOR) for coords in interior]
         super().__init__(
             sly_id=sly_id,
             class_id=class_id,
@@ -150,13 +176,8 @@ class VectorGeometry(Geometry):
         """
         packed_obj = {
             POINTS: {
-                EXTERIOR: points_to_row_col_list(
-                    self._exterior, flip_row_col_order=True
-                ),
-                INTERIOR: [
-                    points_to_row_col_list(i, flip_row_col_order=True)
-                    for i in self._interior
-                ],
+                EXTERIOR: self._exterior_np[:, ::-1].tolist(),
+                INTERIOR: [i[:, ::-1].tolist() for i in self._interior_np],
             },
             GEOMETRY_SHAPE: self.geometry_name(),
             GEOMETRY_TYPE: self.geometry_name(),
@@ -177,7 +198,7 @@ class VectorGeometry(Geometry):
 
             exterior = figure.exterior
         """
-        return deepcopy(self._exterior)
+        return row_col_list_to_points(self._exterior_np.tolist())
 
     @property
     def exterior_np(self) -> np.ndarray:
@@ -197,7 +218,7 @@ class VectorGeometry(Geometry):
             #  [2479  402]
             #  [3746 1646]]
         """
-        return np.array(points_to_row_col_list(self._exterior), dtype=np.int64)
+        return self._exterior_np.copy()
 
     @property
     def interior(self) -> List[List[PointLocation]]:
@@ -212,7 +233,7 @@ class VectorGeometry(Geometry):
 
             interior = figure.interior
         """
-        return deepcopy(self._interior)
+        return [row_col_list_to_points(i.tolist()) for i in self._interior_np]
 
     @property
     def interior_np(self):
@@ -232,16 +253,27 @@ class VectorGeometry(Geometry):
             #        [2468,  875],
             #        [2679, 1577]])]
         """
-        return [
-            np.array(points_to_row_col_list(i), dtype=np.int64) for i in self._interior
-        ]
+        return [i.copy() for i in self._interior_np]
 
     def _transform(self, transform_fn):
         """
         """
-        result = deepcopy(self)
-        result._exterior = [transform_fn(p) for p in self._exterior]
-        result._interior = [[transform_fn(p) for p in i] for i in self._interior]
+        result = copy(self)
+        result._exterior_np = _coords_to_np([transform_fn(p) for p in self.exterior], EXTERIOR)
+        result._interior_np = [
+            _coords_to_np([transform_fn(p) for p in i], INTERIOR) for i in self.interior
+        ]
+        return result
+
+    def _transform_np(self, transform_fn):
+        """
+        Applies vectorized transform to all coordinates.
+
+        :param transform_fn: Function that maps (N, 2) array of (row, col) coordinates to a new array.
+        """
+        result = copy(self)
+        result._exterior_np = _coords_to_np(transform_fn(self._exterior_np), EXTERIOR)
+        result._interior_np = [_coords_to_np(transform_fn(i), INTERIOR) for i in self._interior_np]
         return result
 
     def resize(
@@ -266,7 +298,9 @@ class VectorGeometry(Geometry):
             out_height, out_width = 600, 800
             resize_figure = figure.resize((in_height, in_width), (out_height, out_width))
         """
-        return self._transform(lambda p: p.resize(in_size, out_size))
+        new_size = sly_image.restore_proportional_size(in_size=in_size, out_size=out_size)
+        factors = np.array([new_size[0] / in_size[0], new_size[1] / in_size[1]])
+        return self._transform_np(lambda pts: pts * factors)
 
     def scale(self, factor: float) -> VectorGeometry:
         """
@@ -284,7 +318,7 @@ class VectorGeometry(Geometry):
             # Remember that VectorGeometry class object is immutable, and we need to assign new instance of VectorGeometry to a new variable
             scale_figure = figure.scale(0.75)
         """
-        return self._transform(lambda p: p.scale(factor))
+        return self._transform_np(lambda pts: pts * factor)
 
     def translate(self, drow: int, dcol: int) -> VectorGeometry:
         """
@@ -304,7 +338,8 @@ class VectorGeometry(Geometry):
             # Remember that VectorGeometry class object is immutable, and we need to assign new instance of VectorGeometry to a new variable
             translate_figure = figure.translate(150, 250)
         """
-        return self._transform(lambda p: p.translate(drow, dcol))
+        shift = np.array([drow, dcol])
+        return self._transform_np(lambda pts: pts + shift)
 
     def rotate(self, rotator: ImageRotator) -> VectorGeometry:
         """
@@ -327,7 +362,7 @@ class VectorGeometry(Geometry):
             rotate_figure = figure.rotate(rotator)
 
         """
-        return self._transform(lambda p: p.rotate(rotator))
+        return self._transform_np(rotator.transform_points_np)
 
     def fliplr(self, img_size: Tuple[int, int]) -> VectorGeometry:
         """
@@ -346,7 +381,7 @@ class VectorGeometry(Geometry):
             height, width = 300, 400
             fliplr_figure = figure.fliplr((height, width))
         """
-        return self._transform(lambda p: p.fliplr(img_size))
+        return self._transform_np(lambda pts: np.stack([pts[:, 0], img_size[1] - pts[:, 1]], axis=1))
 
     def flipud(self, img_size: Tuple[int, int]) -> VectorGeometry:
         """
@@ -365,7 +400,7 @@ class VectorGeometry(Geometry):
             height, width = 300, 400
             flipud_figure = figure.flipud((height, width))
         """
-        return self._transform(lambda p: p.flipud(img_size))
+        return self._transform_np(lambda pts: np.stack([img_size[0] - pts[:, 0], pts[:, 1]], axis=1))
 
     def to_bbox(self) -> Rectangle:
         """
@@ -380,14 +415,9 @@ class VectorGeometry(Geometry):
 
             rectangle = figure.to_bbox()
         """
-        exterior_np = self.exterior_np
-        rows, cols = exterior_np[:, 0], exterior_np[:, 1]
-        return Rectangle(
-            top=round(min(rows).item()),
-            left=round(min(cols).item()),
-            bottom=round(max(rows).item()),
-            right=round(max(cols).item()),
-        )
+        top, left = self._exterior_np.min(axis=0).tolist()
+        bottom, right = self._exterior_np.max(axis=0).tolist()
+        return Rectangle(top=top, left=left, bottom=bottom, right=right)
 
     def _draw_impl(self, bitmap, color, thickness=1, config=None):
         """
@@ -2,7 +2,6 @@
 
 import io
 import os.path
-from pkg_resources import parse_version
 import base64
 from typing import List, Tuple, Optional, Union
 import cv2
@@ -142,6 +141,7 @@ def validate_ext(path: str) -> None:
 def validate_format(path: str) -> None:
     """
     Validate input file format, if file extension is not supported raise ImageExtensionError.
+    Only the file header is read, image data is not decoded.
 
     :param path: Path to file.
     :type path: str
@@ -165,11 +165,18 @@ def validate_format(path: str) -> None:
     """
     ext = get_file_ext(path)
     if ext == ".nrrd":
-        data, header = nrrd.read(path, index_order='C')
+        nrrd.read_header(path)
         return
+    with _open_header(path, path):
+        pass
+
+
+def _open_header(source, path: str) -> PILImage.Image:
+    """
+    Open image with PIL and check its format. PIL reads only the header here, data is decoded lazily.
+    """
     try:
-        pil_img = PILImage.open(path)
-        pil_img.load()  # Validate image data. Because 'open' is lazy method.
+        pil_img = PILImage.open(source)
     except OSError as e:
         raise ImageReadException(
             "Error has occured trying to read image {!r}. Original exception message: {!r}".format(
@@ -177,17 +184,23 @@ def validate_format(path: str) -> None:
             )
         )
 
-    img_format = pil_img.format
-    img_ext = f".{img_format}"
-    if not is_valid_ext(f".{img_format}"):
+    img_ext = f".{pil_img.format}"
+    if not is_valid_ext(img_ext):
+        pil_img.close()
         raise UnsupportedImageFormat(
             "Unsupported image format {!r} for file {!r}. Only the following formats are supported: {}".format(
                 img_ext, path, ", ".join(SUPPORTED_IMG_EXTS)
             )
         )
+    return pil_img
 
 
-def read(path: str, remove_alpha_channel: Optional[bool] = True) -> np.ndarray:
+def read(
+    path: str,
+    remove_alpha_channel: Optional[bool] = True,
+    max_size: Optional[int] = None,
+    roi: Optional[Rectangle] = None,
+) -> np.ndarray:
     """
     Loads an image from the specified file and returns it in RGB format.
 
@@ -195,6 +208,11 @@ def read(path: str, remove_alpha_channel: Optional[bool] = True) -> np.ndarray:
     :type path: str
     :param remove_alpha_channel: Define remove alpha channel when reading file or not.
     :type remove_alpha_channel: bool, optional
+    :param max_size: Max size of the longer side of the result image. Bigger images are downscaled keeping aspect ratio, JPEG images are decoded at reduced resolution right away.
+    :type max_size: int, optional
+    :param roi: Region of the image to read. For tiled TIFF images only the tiles covering the region are decoded (requires tifffile package).
+    :type roi: Rectangle, optional
+    :raises: :class:`ValueError` if roi is out of image area
     :return: Numpy array
     :rtype: :class:`np.ndarray`
     :Usage example:
@@ -204,36 +222,37 @@ def read(path: str, remove_alpha_channel: Optional[bool] = True) -> np.ndarray:
         import supervisely as sly
 
         im = sly.image.read('/home/admin/work/docs/image.jpeg')
+
+        # preview with the longer side of 512 pixels
+        preview = sly.image.read('/home/admin/work/docs/image.jpeg', max_size=512)
+
+        # top left corner of the image
+        corner = sly.image.read('/home/admin/work/docs/image.tiff', roi=sly.Rectangle(0, 0, 1023, 1023))
     """
     ext = get_file_ext(path)
     if ext == ".nrrd":
         data, header = nrrd.read(path, index_order='C')
+        if roi is not None:
+            data = crop(data, roi)
+        if max_size is not None:
+            data = _fit_max_size(data, max_size)
         return data
 
-    validate_format(path)
-    if remove_alpha_channel is True:
-        img = cv2.imread(path, cv2.IMREAD_COLOR)
-        if img is None:
-            raise IOError("OpenCV can not open the file {!r}".format(path))
-        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    else:
-        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
-        if img is None:
-            raise IOError("OpenCV can not open the file {!r}".format(path))
-        cnt_channels = img.shape[2]
-        if cnt_channels == 4:
-            return cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-        elif cnt_channels == 3:
-            return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        elif cnt_channels == 1:
-            return cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-        else:
-            raise ValueError(
-                "image has {} channels. Please, contact support...".format(cnt_channels)
-            )
+    with open(path, "rb") as file:
+        image_bytes = file.read()
+    with _open_header(io.BytesIO(image_bytes), path) as header:
+        img = _decode(image_bytes, not remove_alpha_channel, max_size, roi, header)
+    if img is None:
+        raise IOError("OpenCV can not open the file {!r}".format(path))
+    return img
 
 
-def read_bytes(image_bytes: str, keep_alpha: Optional[bool] = False) -> np.ndarray:
+def read_bytes(
+    image_bytes: str,
+    keep_alpha: Optional[bool] = False,
+    max_size: Optional[int] = None,
+    roi: Optional[Rectangle] = None,
+) -> np.ndarray:
     """
     Loads an byte image and returns it in RGB format.
 
@@ -241,6 +260,11 @@ def read_bytes(image_bytes: str, keep_alpha: Optional[bool] = False) -> np.ndarr
     :type image_bytes: str
     :param keep_alpha: Define consider alpha channel when reading bytes or not.
     :type keep_alpha: bool, optional
+    :param max_size: Max size of the longer side of the result image. Bigger images are downscaled keeping aspect ratio, JPEG images are decoded at reduced resolution right away.
+    :type max_size: int, optional
+    :param roi: Region of the image to read. For tiled TIFF images only the tiles covering the region are decoded (requires tifffile package).
+    :type roi: Rectangle, optional
+    :raises: :class:`ValueError` if roi is out of image area
     :return: Numpy array
     :rtype: :class:`np.ndarray`
     :Usage example:
@@ -256,26 +280,179 @@ def read_bytes(image_bytes: str, keep_alpha: Optional[bool] = False) -> np.ndarr
         file_like = io.BytesIO(image_bytes)
         header = nrrd.read_header(file_like)
         data = nrrd.read_data(header, file_like, index_order='C')
+        if roi is not None:
+            data = crop(data, roi)
+        if max_size is not None:
+            data = _fit_max_size(data, max_size)
         return data
 
-    image_np_arr = np.asarray(bytearray(image_bytes), dtype="uint8")
-    if keep_alpha is True:
-        img = cv2.imdecode(image_np_arr, cv2.IMREAD_UNCHANGED)
-        if len(img.shape) == 2:
-            img = np.expand_dims(img, 2)
-        cnt_channels = img.shape[2]
-        if cnt_channels == 4:
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-        elif cnt_channels == 3:
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        elif cnt_channels == 1:
-            img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-        return img
-    else:
-        img = cv2.imdecode(
-            image_np_arr, cv2.IMREAD_COLOR
-        )  # cv2.imdecode returns BGR always
+    header = None
+    if max_size is not None or roi is not None:
+        # image size is needed to choose decoding scale, data is decoded fully if PIL can't read the header
+        try:
+            header = PILImage.open(io.BytesIO(image_bytes))
+        except OSError:
+            pass
+    img = _decode(image_bytes, keep_alpha, max_size, roi, header)
+    if img is None:
+        raise IOError("OpenCV can not decode image bytes")
+    return img
+
+
+_REDUCED_COLOR_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+_EXIF_ORIENTATION = 0x0112
+
+
+def _decode(
+    image_bytes: bytes,
+    keep_alpha: bool,
+    max_size: Optional[int] = None,
+    roi: Optional[Rectangle] = None,
+    header: Optional[PILImage.Image] = None,
+) -> Optional[np.ndarray]:
+    """
+    Decode image bytes to RGB(A) numpy array. Image header (size, format) is used to decode only
+    the required part of data: tiles of tiled TIFF images covering roi or JPEG at reduced scale.
+    """
+    img = None
+    if roi is not None and header is not None:
+        if not Rectangle.from_size(_get_header_size(header)).contains(roi):
+            raise ValueError("Rectangle for crop out of image area!")
+        if header.format == "TIFF":
+            img = _decode_tiff_region(image_bytes, roi, keep_alpha)
+
+    if img is None:
+        # IMREAD_REDUCED_* decode JPEG with DCT scaling, other formats are downscaled after decoding
+        flags = cv2.IMREAD_UNCHANGED if keep_alpha else cv2.IMREAD_COLOR
+        scale = 1
+        if max_size is not None and header is not None and not keep_alpha:
+            region_size = (roi.height, roi.width) if roi is not None else header.size
+            scale = _get_reduction_scale(region_size, max_size)
+            flags = _REDUCED_COLOR_FLAGS.get(scale, flags)
+
+        img = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), flags)
+        if img is None:
+            return None
+        img = _convert_to_rgb(img, keep_alpha)
+        if roi is not None:
+            img = _crop_scaled(img, roi, scale)
+
+    if max_size is not None:
+        img = _fit_max_size(img, max_size)
+    return img
+
+
+def _convert_to_rgb(img: np.ndarray, keep_alpha: bool) -> np.ndarray:
+    """Convert image decoded by OpenCV (BGR or BGRA) to RGB or RGBA."""
+    if keep_alpha is False:
         return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    if len(img.shape) == 2:
+        img = np.expand_dims(img, 2)
+    cnt_channels = img.shape[2]
+    if cnt_channels == 4:
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+    elif cnt_channels == 3:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    elif cnt_channels == 1:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
+    else:
+        raise ValueError("image has {} channels. Please, contact support...".format(cnt_channels))
+
+
+def _get_header_size(header: PILImage.Image) -> Tuple[int, int]:
+    """Size (height, width) of image after applying EXIF orientation, as OpenCV decodes it."""
+    width, height = header.size
+    if header.getexif().get(_EXIF_ORIENTATION) in (5, 6, 7, 8):
+        width, height = height, width
+    return height, width
+
+
+def _get_reduction_scale(size: Tuple[int, int], max_size: int) -> int:
+    """The biggest scale supported by OpenCV reduced decoding which keeps size not less than max_size."""
+    for scale in sorted(_REDUCED_COLOR_FLAGS, reverse=True):
+        if max(size) / scale >= max_size:
+            return scale
+    return 1
+
+
+def _crop_scaled(img: np.ndarray, roi: Rectangle, scale: int) -> np.ndarray:
+    """Crop region of the image which was decoded with reduced scale, roi is in original coordinates."""
+    if scale == 1:
+        return crop(img, roi)
+    top, left = roi.top // scale, roi.left // scale
+    bottom = min(-(-(roi.bottom + 1) // scale), img.shape[0])
+    right = min(-(-(roi.right + 1) // scale), img.shape[1])
+    return img[top:bottom, left:right]
+
+
+def _fit_max_size(img: np.ndarray, max_size: int) -> np.ndarray:
+    """Downscale image keeping aspect ratio, so the longer side is not bigger than max_size."""
+    height, width = img.shape[:2]
+    if max(height, width) <= max_size:
+        return img
+    factor = max_size / max(height, width)
+    out_size = (max(round(width * factor), 1), max(round(height * factor), 1))
+    return cv2.resize(img, out_size, interpolation=cv2.INTER_AREA)
+
+
+def _decode_tiff_region(
+    image_bytes: bytes, roi: Rectangle, keep_alpha: bool
+) -> Optional[np.ndarray]:
+    """
+    Decode only tiles of tiled TIFF image which cover roi. Returns None if image is not tiled
+    or has layout that is not supported here, then the whole image has to be decoded.
+    """
+    try:
+        import tifffile
+    except ImportError:
+        return None
+
+    with tifffile.TiffFile(io.BytesIO(image_bytes)) as tif:
+        page = tif.pages[0]
+        orientation = page.tags.get("Orientation")
+        if (
+            not page.is_tiled
+            or page.tiledepth != 1
+            or page.planarconfig != 1
+            or page.photometric not in (1, 2)  # MINISBLACK, RGB
+            or page.dtype not in (np.uint8, np.uint16)
+            or page.samplesperpixel not in (1, 3, 4)
+            or (orientation is not None and orientation.value != 1)
+        ):
+            return None
+
+        tile_height, tile_width = page.tilelength, page.tilewidth
+        tiles_across = -(-page.imagewidth // tile_width)
+        region = np.zeros((roi.height, roi.width, page.samplesperpixel), dtype=page.dtype)
+        for tile_row in range(roi.top // tile_height, roi.bottom // tile_height + 1):
+            for tile_col in range(roi.left // tile_width, roi.right // tile_width + 1):
+                index = tile_row * tiles_across + tile_col
+                if page.databytecounts[index] == 0:
+                    continue
+                tif.filehandle.seek(page.dataoffsets[index])
+                data = tif.filehandle.read(page.databytecounts[index])
+                tile, _, _ = page.decode(data, index, jpegtables=page.jpegtables)
+                y0, x0 = tile_row * tile_height, tile_col * tile_width
+                top, left = max(roi.top, y0), max(roi.left, x0)
+                bottom = min(roi.bottom + 1, y0 + tile_height)
+                right = min(roi.right + 1, x0 + tile_width)
+                region[top - roi.top : bottom - roi.top, left - roi.left : right - roi.left] = tile[
+                    0, top - y0 : bottom - y0, left - x0 : right - x0
+                ]
+
+    # same channels and depth as OpenCV decodes the whole image
+    if keep_alpha is False:
+        if region.dtype == np.uint16:
+            region = (region >> 8).astype(np.uint8)
+        region = region[:, :, :3]
+    if region.shape[2] == 1:
+        region = cv2.cvtColor(region, cv2.COLOR_GRAY2RGB)
+    return region
 
 
 def write(
@@ -771,6 +948,7 @@ def resize_inter_nearest(
                    After
     """
     import skimage.transform
+    from pkg_resources import parse_version
 
     target_shape = restore_proportional_size(img.shape[:2], out_size, frow, fcol)
     resize_kv_args = dict(order=0, preserve_range=True, mode="constant")
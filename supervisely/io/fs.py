@@ -2,8 +2,10 @@
 
 # docs
 from re import L
-from typing import Dict, List, Optional, Callable, Union, Literal
+from typing import Dict, Iterator, List, Optional, Callable, Union, Literal
 
+import base64
+import hashlib
 import os
 import re
 import shutil
@@ -16,11 +18,13 @@ from collections.abc import Mapping
 
 from tqdm import tqdm
 
-from supervisely._utils import get_bytes_hash, get_string_hash
-from supervisely.io.fs_cache import FileCache
+from supervisely._utils import concurrent_map, get_bytes_hash, get_string_hash
+from supervisely.io.fs_cache import FileCache, FileHashCache
 from supervisely.sly_logger import logger
 from supervisely.task.progress import Progress
 
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def get_file_name(path: str) -> str:
     """
@@ -536,7 +540,42 @@ def get_file_hash(path: str) -> str:
         from supervisely.io.fs import get_file_hash
         hash = get_file_hash('/home/admin/work/projects/examples/1.jpeg') # rKLYA/p/P64dzidaQ/G7itxIz3ZCVnyUhEE9fSMGxU4=
     """
-    return get_bytes_hash(open(path, "rb").read())
+    # file is read by chunks, so big files (e.g. videos) are not loaded into memory
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return base64.b64encode(file_hash.digest()).decode("utf-8")
+
+
+def get_file_hashes(
+    paths: List[str], num_workers: Optional[int] = 4, cache: Optional[FileHashCache] = None
+) -> Iterator[str]:
+    """
+    Lazily get hashes of target files in the order of paths. Files are hashed in parallel threads,
+    so hashes of the first files can be used (e.g. checked on the server) while the rest of files are hashed.
+
+    :param paths: Target files paths.
+    :type paths: List[str]
+    :param num_workers: Number of files hashed concurrently.
+    :type num_workers: int, optional
+    :param cache: Persistent cache of hashes, unchanged files are not hashed again.
+    :type cache: FileHashCache, optional
+    :returns: Iterator over files hashes
+    :rtype: :class:`Iterator[str]`
+    :Usage example:
+
+     .. code-block:: python
+
+        from supervisely.io.fs import get_file_hashes, list_files
+        from supervisely.io.fs_cache import FileHashCache
+
+        paths = list_files('/home/admin/work/projects/examples')
+        with FileHashCache('/home/admin/work/hashes.jsonl') as cache:
+            hashes = list(get_file_hashes(paths, num_workers=8, cache=cache))
+    """
+    func = get_file_hash if cache is None else cache.get_file_hash
+    return concurrent_map(func, paths, num_workers=num_workers)
 
 
 def tree(dir_path: str) -> str:
@@ -3,7 +3,9 @@
 import os
 import os.path as osp
 import hashlib
+import json
 import shutil
+import threading
 
 from supervisely.io import fs as sly_fs
 
@@ -182,3 +184,120 @@ class EmptyCache(FSCache):
 
     def read_objects(self, dst_paths_hashes, progress_ctr):
         return []  # overridden to speed up
+
+
+class _JsonLinesLog:
+    """
+    Append-only log of JSON records, one per line. Records appended before interruption are not lost,
+    the last line may be incomplete if process was killed while writing it, such lines are skipped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def read(self):
+        """Returns list of records from the log."""
+        records = []
+        if not osp.isfile(self.path):
+            return records
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+
+    def rewrite(self, records):
+        """Replaces the log with given records, e.g. to drop outdated ones."""
+        with self._lock:
+            self._close()
+            sly_fs.ensure_base_path(self.path)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+            os.replace(tmp_path, self.path)
+
+    def append(self, records):
+        with self._lock:
+            if self._file is None:
+                self._open()
+            for record in records:
+                self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+
+    def _open(self):
+        sly_fs.ensure_base_path(self.path)
+        ends_with_newline = True
+        if osp.isfile(self.path) and osp.getsize(self.path) > 0:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                ends_with_newline = f.read(1) == b"\n"
+        self._file = open(self.path, "a")
+        if not ends_with_newline:
+            self._file.write("\n")
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+
+class FileHashCache:
+    """
+    Persistent cache of files hashes. Hash is reused while path, size and modification time
+    of the file are not changed. Cache file is an append-only log of JSON lines, so hashes computed
+    before interruption are not lost. Log is compacted on load if it has too many outdated lines.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._hashes = {}  # abs path -> (size, mtime_ns, hash)
+        self._log = _JsonLinesLog(path)
+        self._load()
+
+    def _load(self):
+        records = self._log.read()
+        for record in records:
+            self._hashes[record["path"]] = (record["size"], record["mtime"], record["hash"])
+        if len(records) > 2 * len(self._hashes):
+            self._log.rewrite(
+                [self._to_record(path, entry) for path, entry in self._hashes.items()]
+            )
+
+    @staticmethod
+    def _to_record(path, entry):
+        size, mtime, data_hash = entry
+        return {"path": path, "size": size, "mtime": mtime, "hash": data_hash}
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def get_file_hash(self, path):
+        path = osp.abspath(path)
+        # stat is taken before hashing, so the file modified while hashing is hashed again next time
+        stat = os.stat(path)
+        cached = self._hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        data_hash = sly_fs.get_file_hash(path)
+        entry = (stat.st_size, stat.st_mtime_ns, data_hash)
+        self._hashes[path] = entry
+        self._log.append([self._to_record(path, entry)])
+        return data_hash
+
+    def close(self):
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
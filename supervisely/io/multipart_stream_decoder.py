@@ -1,396 +1,391 @@
-# # -*- coding: utf-8 -*-
-# """
-#
-# requests_toolbelt.multipart.decoder
-# ===================================
-#
-# This holds all the implementation details of the MultipartDecoder. https://github.com/requests/toolbelt/pull/222
-#
-# """
-#
-#
-# import sys
-# import email.parser
-# from requests_toolbelt.multipart.encoder import encode_with
-# from requests.structures import CaseInsensitiveDict
-#
-#
-# def _split_on_find(content, bound):
-#     point = content.find(bound)
-#     return content[:point], content[point + len(bound):]
-#
-#
-# class ImproperBodyPartContentException(Exception):
-#     pass
-#
-#
-# class NonMultipartContentTypeException(Exception):
-#     pass
-#
-#
-# def _header_parser(string, encoding):
-#     major = sys.version_info[0]
-#     if major == 3:
-#         string = string.decode(encoding)
-#     headers = email.parser.HeaderParser().parsestr(string).items()
-#     return (
-#         (encode_with(k, encoding), encode_with(v, encoding))
-#         for k, v in headers
-#     )
-#
-#
-# class BodyPart(object):
-#     """
-#
-#     The ``BodyPart`` object is a ``Response``-like interface to an individual
-#     subpart of a multipart response. It is expected that these will
-#     generally be created by objects of the ``MultipartDecoder`` class.
-#
-#     Like ``Response``, there is a ``CaseInsensitiveDict`` object named headers,
-#     ``content`` to access bytes, ``text`` to access unicode, and ``encoding``
-#     to access the unicode codec.
-#
-#     """
-#
-#     def __init__(self, content, encoding):
-#         self.encoding = encoding
-#         headers = {}
-#         # Split into header section (if any) and the content
-#         if b'\r\n\r\n' in content:
-#             first, self.content = _split_on_find(content, b'\r\n\r\n')
-#             if first != b'':
-#                 headers = _header_parser(first.lstrip(), encoding)
-#         else:
-#             raise ImproperBodyPartContentException(
-#                 'content does not contain CR-LF-CR-LF'
-#             )
-#         self.headers = CaseInsensitiveDict(headers)
-#
-#     @property
-#     def text(self):
-#         """Content of the ``BodyPart`` in unicode."""
-#         return self.content.decode(self.encoding)
-#
-#
-# class MultipartDecoder(object):
-#     """
-#
-#     The ``MultipartDecoder`` object parses the multipart payload of
-#     a bytestring into a tuple of ``Response``-like ``BodyPart`` objects.
-#
-#     The basic usage is::
-#
-#         import requests
-#         from requests_toolbelt import MultipartDecoder
-#
-#         response = request.get(url)
-#         decoder = MultipartDecoder.from_response(response)
-#         for part in decoder.parts:
-#             print(part.headers['content-type'])
-#
-#     If the multipart content is not from a response, basic usage is::
-#
-#         from requests_toolbelt import MultipartDecoder
-#
-#         decoder = MultipartDecoder(content, content_type)
-#         for part in decoder.parts:
-#             print(part.headers['content-type'])
-#
-#     For both these usages, there is an optional ``encoding`` parameter. This is
-#     a string, which is the name of the unicode codec to use (default is
-#     ``'utf-8'``).
-#
-#     """
-#     def __init__(self, content, content_type, encoding='utf-8'):
-#         #: Original Content-Type header
-#         self.content_type = content_type
-#         #: Response body encoding
-#         self.encoding = encoding
-#         #: Parsed parts of the multipart response body
-#         self.parts = tuple()
-#         self.boundary = MultipartDecoder._find_boundary(content_type, encoding)
-#         self._parse_body(content)
-#
-#     @staticmethod
-#     def _find_boundary(content_type, encoding):
-#         ct_info = tuple(x.strip() for x in content_type.split(';'))
-#         mimetype = ct_info[0]
-#         if mimetype.split('/')[0].lower() != 'multipart':
-#             raise NonMultipartContentTypeException(
-#                 "Unexpected mimetype in content-type: '{0}'".format(mimetype)
-#             )
-#         for item in ct_info[1:]:
-#             attr, value = _split_on_find(
-#                 item,
-#                 '='
-#             )
-#             if attr.lower() == 'boundary':
-#                 boundary = encode_with(value.strip('"'), encoding)
-#         return boundary
-#
-#     @staticmethod
-#     def _fix_first_part(part, boundary_marker):
-#         bm_len = len(boundary_marker)
-#         if boundary_marker == part[:bm_len]:
-#             return part[bm_len:]
-#         else:
-#             return part
-#
-#     def _parse_body(self, content):
-#         boundary = b''.join((b'--', self.boundary))
-#
-#         def body_part(part):
-#             fixed = MultipartDecoder._fix_first_part(part, boundary)
-#             return BodyPart(fixed, self.encoding)
-#
-#         def test_part(part):
-#             return (part != b'' and
-#                     part != b'\r\n' and
-#                     part[:4] != b'--\r\n' and
-#                     part != b'--')
-#
-#         parts = content.split(b''.join((b'\r\n', boundary)))
-#         self.parts = tuple(body_part(x) for x in parts if test_part(x))
-#
-#     @classmethod
-#     def from_response(cls, response, encoding='utf-8'):
-#         content = response.content
-#         content_type = response.headers.get('content-type', None)
-#         return cls(content, content_type, encoding)
-#
-#
-# # This is thrown when the object is being reiterated from another place
-# class AlreadyIteratedException(Exception):
-#     pass
-#
-#
-# # This is thrown when trying to skip to the next part without finishing to
-# # stream the previous one
-# class PreviousPartNotFinishedException(Exception):
-#     pass
-#
-#
-# class StreamPart(object):
-#     def __init__(self, headers, encoding, iterator):
-#         self.headers = headers
-#         self.encoding = encoding
-#         self._iterator = iterator
-#         self._started = False
-#         self._consumed = False
-#         self._content = None
-#         self._finished = False
-#
-#     def __iter__(self):
-#         if self._started:
-#             raise AlreadyIteratedException()
-#         self._started = True
-#         for typ, data in self._iterator():
-#             if typ == 'done' and data is False:
-#                 self._finished = True
-#                 break
-#             elif typ == 'stream':
-#                 yield data
-#             else:
-#                 raise ImproperBodyPartContentException()
-#
-#     @property
-#     def content(self):
-#         if self._consumed:
-#             return self._content
-#         if self._started:
-#             raise AlreadyIteratedException()
-#         self._content = b''.join(self)
-#         self._consumed = True
-#         return self._content
-#
-#     @property
-#     def text(self):
-#         return self.content.decode(self.encoding)
-#
-#
-# class MultipartStreamDecoder(object):
-#     @classmethod
-#     def from_response(cls, response, encoding='utf-8', chunk_size=10 * 1024,
-#                       header_size_limit=None):
-#         def content():
-#             return response.raw.read(chunk_size)
-#         content_type = response.headers.get('content-type', None)
-#         return cls(content, content_type, encoding, header_size_limit)
-#
-#     def __init__(self, stream_read_func, content_type, encoding='utf-8',
-#                  header_size_limit=None):
-#         self.content_type = content_type
-#         self.encoding = encoding
-#         self._stream_read_func = stream_read_func
-#         self._header_size_limit = header_size_limit
-#         self._boundary = MultipartDecoder._find_boundary(content_type,
-#                                                          encoding)
-#         self._splitter = StreamSplitter()
-#         self._boundary = b''.join((b'--', self._boundary))
-#         self._boundary_split = b''.join((b'\r\n', self._boundary))
-#         self._state = 0
-#         self._found = False
-#         self._started = False
-#         self._finished = False
-#
-#     # Call this to drain stream when error occured, or you decide
-#     # not to read all data
-#     def close(self):
-#         if not self._finished:
-#             while True:
-#                 try:
-#                     data = self._stream_read_func()
-#                     if not data:
-#                         break
-#                 # Protection if _stream_read_func is an generator
-#                 except StopIteration:
-#                     break
-#                 finally:
-#                     self._finished = True
-#
-#     # The instance can be used as an context manager for automatic
-#     # draining the stream for re-use
-#     def __enter__(self):
-#         return self
-#
-#     def __exit__(self, exc_type, exc_value, exc_traceback):
-#         self.close()
-#
-#     def __iter__(self):
-#         if self._started:
-#             raise AlreadyIteratedException()
-#         self._started = True
-#         # This is for guarding against iterating before finishing to
-#         # iterate on the current part.
-#         _current_stream = None
-#         for typ, data in self._iterator():
-#             if _current_stream and not _current_stream._finished:
-#                 raise PreviousPartNotFinishedException()
-#             if typ == 'headers':
-#                 _current_stream = StreamPart(
-#                     data, self.encoding, self._iterator
-#                 )
-#                 yield _current_stream
-#             else:
-#                 raise ImproperBodyPartContentException()
-#
-#     def _iterator(self):
-#         while True:
-#             data = self._stream_read_func()
-#             # This persumes that if data returned empty once it won't return
-#             # anything again (EOS)
-#             if not self._found and not data:
-#                 self._finished = True
-#                 break
-#             # This part mimics the _fix_first_part logic from above
-#             if self._state == 0:
-#                 should_be_empty_or_crlf, self._found = self._splitter.stream(
-#                     data, self._boundary, True
-#                 )
-#                 if should_be_empty_or_crlf:
-#                     if should_be_empty_or_crlf != b'\r\n':
-#                         raise ImproperBodyPartContentException()
-#                     self._state = 1
-#                     continue
-#                 if self._found:
-#                     self._state = 1
-#                     continue
-#             # Parse the headers
-#             elif self._state == 1:
-#                 headers, self._found = self._splitter.stream(data, b'\r\n\r\n',
-#                                                              True)
-#                 if headers:
-#                     headers = _header_parser(headers.lstrip(), self.encoding)
-#                     headers = CaseInsensitiveDict(headers)
-#                     self._state = 2
-#                     yield 'headers', headers
-#                     continue
-#                 # No headers found
-#                 if self._found:
-#                     headers = CaseInsensitiveDict({})
-#                     self._state = 2
-#                     yield 'headers', headers
-#                     continue
-#                 # This is to protect against malformed input where a header
-#                 # does not exist in a limit for performence reasons
-#                 if self._header_size_limit:
-#                     if (self._splitter.leftover_length >
-#                             self._header_size_limit):
-#                         raise ImproperBodyPartContentException()
-#             # Stream the part
-#             elif self._state == 2:
-#                 stream, self._found = self._splitter.stream(
-#                     data, self._boundary_split
-#                 )
-#                 if stream:
-#                     yield 'stream', stream
-#                 # boundary_split found, end of part
-#                 if self._found:
-#                     self._state = 1
-#                     yield 'done', False
-#                     continue
-#
-#
-# class StreamSplitter(object):
-#     def __init__(self):
-#         self.leftover = b''
-#
-#     def stream(self, data, split_data, return_only_full=False):
-#         self.leftover += data
-#         index = self.leftover.find(split_data)
-#         if return_only_full:
-#             if index > -1:
-#                 ret = self.leftover[:index]
-#                 self.leftover = self.leftover[index + len(split_data):]
-#                 found = True
-#             else:
-#                 ret = b''
-#                 found = False
-#         else:
-#             if index > -1:
-#                 ret = self.leftover[:index]
-#                 self.leftover = self.leftover[index + len(split_data):]
-#                 found = True
-#             elif len(self.leftover) >= len(split_data):
-#                 ret = self.leftover[:-len(split_data)]
-#                 self.leftover = self.leftover[-len(split_data):]
-#                 found = False
-#             else:
-#                 ret = b''
-#                 found = False
-#         return ret, found
-#
-#     @property
-#     def leftover_length(self):
-#         return len(self.leftover)
-
-
-
-# remote storage download api
-# MultipartStreamDecoder has bug
-#     def _download_batch(self, paths, is_stream=True):
-#         def parse_name(headers):
-#             name = part.headers[b'Content-Disposition'].decode("utf-8").split('name="')[1].split('"')[0]
-#             return name
-#         response = self._api.post('remote-storage.bulk.download', paths, stream=is_stream)
-#         with MultipartStreamDecoder.from_response(response, chunk_size=1024 * 1024) as decoder:
-#             for part in decoder:
-#                 #print(part.headers)
-#                 remote_path = parse_name(part.headers)
-#                 for stream in part:
-#                     yield remote_path, stream
-#                 # print(part.content) # Read comment below
-#
-#     def download_paths(self, remote_paths, local_paths):
-#         path_map = {remote: local for remote, local in zip(remote_paths, local_paths)}
-#         last_file = ""
-#         w = None
-#         for current_path, resp_part in self._download_batch(remote_paths, is_stream=True):
-#             if last_file != current_path:
-#                 if w is not None:
-#                     w.close()
-#                 w = open(path_map[current_path], 'wb')
-#                 last_file = current_path
-#             w.write(resp_part)
-#         if w is not None:
-#             w.close()
\ No newline at end of file
+# coding: utf-8
+"""Incremental decoder for multipart responses (e.g. bulk downloads)."""
+
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_HEADER_SIZE_LIMIT = 64 * 1024
+
+_CRLF = b"\r\n"
+_HEADERS_END = b"\r\n\r\n"
+
+_EVENT_HEADERS = "headers"
+_EVENT_DATA = "data"
+_EVENT_END = "end"
+
+
+class ImproperMultipartContentException(Exception):
+    pass
+
+
+class NonMultipartContentTypeException(Exception):
+    pass
+
+
+class PartAlreadyConsumedException(Exception):
+    pass
+
+
+def get_boundary(content_type: str) -> bytes:
+    """
+    Extract multipart boundary from Content-Type header value.
+
+    :param content_type: Content-Type header value, e.g. 'multipart/form-data; boundary=xyz'.
+    :type content_type: str
+    :raises: :class:`NonMultipartContentTypeException` if content type is not multipart or has no boundary
+    :return: Boundary
+    :rtype: :class:`bytes`
+    """
+    if content_type is None:
+        raise NonMultipartContentTypeException("Content-Type header is missing")
+    mimetype, params = _parse_header_value(content_type)
+    if mimetype.split("/")[0].lower() != "multipart":
+        raise NonMultipartContentTypeException(
+            "Unexpected mimetype in content-type: {!r}".format(mimetype)
+        )
+    boundary = params.get("boundary")
+    if not boundary:
+        raise NonMultipartContentTypeException(
+            "Boundary is not defined in content-type: {!r}".format(content_type)
+        )
+    return boundary.encode("latin-1")
+
+
+def _parse_header_value(value: str):
+    """
+    Split header value like 'form-data; name="123"; filename="a.jpg"' into
+    main value and dict of lowercased parameters.
+    """
+    main_value, *params_parts = value.split(";")
+    params = {}
+    for item in params_parts:
+        key, sep, param_value = item.strip().partition("=")
+        if sep == "":
+            continue
+        param_value = param_value.strip()
+        if len(param_value) >= 2 and param_value[0] == param_value[-1] == '"':
+            param_value = param_value[1:-1]
+        params[key.strip().lower()] = param_value
+    return main_value.strip(), params
+
+
+def _parse_headers(raw: bytes, encoding: str) -> CaseInsensitiveDict:
+    headers = CaseInsensitiveDict()
+    for line in raw.split(_CRLF):
+        if line == b"":
+            continue
+        key, sep, value = line.decode(encoding).partition(":")
+        if sep == "":
+            raise ImproperMultipartContentException(
+                "Invalid header line in multipart part: {!r}".format(line)
+            )
+        headers[key.strip()] = value.strip()
+    return headers
+
+
+class StreamPart:
+    """
+    One part of a multipart response. Content is not stored in the object:
+    it is read from the underlying stream while iterating over the part,
+    so the part has to be consumed before the next one is requested from
+    :class:`MultipartStreamDecoder`.
+
+    :param headers: Part headers.
+    :type headers: CaseInsensitiveDict
+    :param encoding: Encoding used for :attr:`text`.
+    :type encoding: str
+    :param read_event: Function returning next decoder event.
+    :type read_event: Callable
+    """
+
+    def __init__(self, headers: CaseInsensitiveDict, encoding: str, read_event: Callable):
+        self.headers = headers
+        self.encoding = encoding
+        self._read_event = read_event
+        self._started = False
+        self._finished = False
+        self._content = None
+        disposition = headers.get("Content-Disposition")
+        self._disposition_params = {} if disposition is None else _parse_header_value(disposition)[1]
+
+    @property
+    def name(self) -> Optional[str]:
+        """Value of "name" parameter of Content-Disposition header."""
+        return self._disposition_params.get("name")
+
+    @property
+    def filename(self) -> Optional[str]:
+        """Value of "filename" parameter of Content-Disposition header."""
+        return self._disposition_params.get("filename")
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._started:
+            raise PartAlreadyConsumedException("Part content can be iterated only once")
+        self._started = True
+        while True:
+            event, data = self._read_event()
+            if event == _EVENT_DATA:
+                yield data
+            elif event == _EVENT_END:
+                self._finished = True
+                return
+            else:
+                raise ImproperMultipartContentException(
+                    "Unexpected event {!r} inside multipart part".format(event)
+                )
+
+    @property
+    def content(self) -> bytes:
+        """Whole part content. Reads the rest of the part into memory on first access."""
+        if self._content is None:
+            self._content = b"".join(self)
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding)
+
+    def write_to(self, file: BinaryIO) -> int:
+        """
+        Write part content to file-like object chunk by chunk without keeping it in memory.
+
+        :param file: Binary file-like object.
+        :type file: BinaryIO
+        :return: Number of written bytes
+        :rtype: :class:`int`
+        """
+        if self._content is not None:
+            file.write(self._content)
+            return len(self._content)
+        size = 0
+        for chunk in self:
+            file.write(chunk)
+            size += len(chunk)
+        return size
+
+    def save(self, path: str) -> int:
+        """
+        Write part content to file at given path.
+
+        :param path: Local path.
+        :type path: str
+        :return: Number of written bytes
+        :rtype: :class:`int`
+        """
+        with open(path, "wb") as fout:
+            return self.write_to(fout)
+
+    def drain(self) -> None:
+        """Skip the rest of the part content."""
+        if self._finished:
+            return
+        if self._started:
+            raise PartAlreadyConsumedException("Part is being iterated and can not be drained")
+        for _ in self:
+            pass
+
+
+class MultipartStreamDecoder:
+    """
+    Incremental decoder of multipart body. Works on top of any iterator of byte chunks
+    (e.g. :meth:`requests.Response.iter_content`) and yields :class:`StreamPart` objects
+    as soon as their headers are received. Peak memory usage is bounded by chunk size,
+    whole parts are never materialized unless :attr:`StreamPart.content` is requested.
+
+    If the previous part was not consumed when the next one is requested, its content is skipped.
+
+    :param chunks: Iterator of byte chunks of the multipart body.
+    :type chunks: Iterator[bytes]
+    :param content_type: Content-Type header value with boundary.
+    :type content_type: str
+    :param encoding: Encoding of part headers and text content.
+    :type encoding: str, optional
+    :param header_size_limit: Max size of part headers in bytes.
+    :type header_size_limit: int, optional
+    :param on_close: Function called when decoder is closed, e.g. to release connection.
+    :type on_close: Callable, optional
+    :Usage example:
+
+     .. code-block:: python
+
+        from supervisely.io.multipart_stream_decoder import MultipartStreamDecoder
+
+        response = api.post("images.bulk.download", {...}, stream=True)
+        with MultipartStreamDecoder.from_response(response) as decoder:
+            for part in decoder:
+                part.save(f"/tmp/{part.name}.jpg")
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        content_type: str,
+        encoding: Optional[str] = "utf-8",
+        header_size_limit: Optional[int] = DEFAULT_HEADER_SIZE_LIMIT,
+        on_close: Optional[Callable] = None,
+    ):
+        self.content_type = content_type
+        self.encoding = encoding
+        self._chunks = iter(chunks)
+        self._header_size_limit = header_size_limit
+        self._on_close = on_close
+        self._delimiter = _CRLF + b"--" + get_boundary(content_type)
+        # leading CRLF allows to search the first boundary the same way as the others
+        self._buffer = bytearray(_CRLF)
+        self._exhausted = False
+        self._events = self._iter_events()
+        self._started = False
+        self._closed = False
+
+    @classmethod
+    def from_response(
+        cls,
+        response,
+        chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE,
+        encoding: Optional[str] = "utf-8",
+    ) -> "MultipartStreamDecoder":
+        """
+        Create decoder for :class:`requests.Response`. Response should be requested
+        with ``stream=True``, otherwise the whole body is already in memory.
+
+        :param response: Response object.
+        :type response: requests.Response
+        :param chunk_size: Size of chunks read from the response.
+        :type chunk_size: int, optional
+        :param encoding: Encoding of part headers.
+        :type encoding: str, optional
+        :return: MultipartStreamDecoder object
+        :rtype: :class:`MultipartStreamDecoder`
+        """
+        return cls(
+            response.iter_content(chunk_size=chunk_size),
+            response.headers.get("content-type", None),
+            encoding=encoding,
+            on_close=response.close,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Release underlying stream. Unread content is discarded."""
+        if self._closed:
+            return
+        self._closed = True
+        self._events.close()
+        if self._on_close is not None:
+            self._on_close()
+
+    def __iter__(self) -> Iterator[StreamPart]:
+        if self._started:
+            raise PartAlreadyConsumedException("Decoder can be iterated only once")
+        self._started = True
+        part = None
+        while True:
+            if part is not None and not part.finished:
+                part.drain()
+            event, data = self._read_event()
+            if event is None:
+                return
+            if event != _EVENT_HEADERS:
+                raise ImproperMultipartContentException(
+                    "Unexpected event {!r} between multipart parts".format(event)
+                )
+            part = StreamPart(data, self.encoding, self._read_event)
+            yield part
+
+    def _read_event(self):
+        return next(self._events, (None, None))
+
+    def _fill(self) -> bool:
+        """Read next non-empty chunk into buffer. Returns False at the end of stream."""
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._exhausted = True
+        return False
+
+    def _find(self, pattern: bytes, start: int) -> int:
+        """Find pattern in buffer reading more data when needed. Returns -1 at the end of stream."""
+        while True:
+            index = self._buffer.find(pattern, start)
+            if index != -1:
+                return index
+            start = max(0, len(self._buffer) - len(pattern) + 1)
+            if not self._fill():
+                return -1
+
+    def _ensure(self, size: int) -> bool:
+        while len(self._buffer) < size:
+            if not self._fill():
+                return False
+        return True
+
+    def _iter_events(self):
+        delimiter = self._delimiter
+        # preamble before the first boundary is ignored
+        index = self._find(delimiter, 0)
+        if index == -1:
+            raise ImproperMultipartContentException("Multipart boundary not found")
+        del self._buffer[: index + len(delimiter)]
+
+        while True:
+            # boundary is followed either by "--" (end of body) or by CRLF
+            if not self._ensure(2):
+                raise ImproperMultipartContentException("Unexpected end of multipart body")
+            if self._buffer[:2] == b"--":
+                return
+            index = self._find(_CRLF, 0)
+            if index == -1:
+                raise ImproperMultipartContentException("Unexpected end of multipart body")
+            del self._buffer[: index + len(_CRLF)]
+
+            # part headers, empty when part starts with CRLF right away
+            if self._ensure(2) and self._buffer[:2] == _CRLF:
+                raw_headers = b""
+                del self._buffer[:2]
+            else:
+                index = self._buffer.find(_HEADERS_END)
+                while index == -1:
+                    if (
+                        self._header_size_limit is not None
+                        and len(self._buffer) > self._header_size_limit
+                    ):
+                        raise ImproperMultipartContentException(
+                            "Multipart part headers exceed {} bytes".format(self._header_size_limit)
+                        )
+                    start = max(0, len(self._buffer) - len(_HEADERS_END) + 1)
+                    if not self._fill():
+                        raise ImproperMultipartContentException("Unexpected end of multipart body")
+                    index = self._buffer.find(_HEADERS_END, start)
+                raw_headers = bytes(self._buffer[:index])
+                del self._buffer[: index + len(_HEADERS_END)]
+            yield _EVENT_HEADERS, _parse_headers(raw_headers, self.encoding)
+
+            # part content is emitted as soon as it is known not to contain delimiter
+            while True:
+                index = self._buffer.find(delimiter)
+                if index != -1:
+                    if index > 0:
+                        yield _EVENT_DATA, bytes(self._buffer[:index])
+                    del self._buffer[: index + len(delimiter)]
+                    break
+                safe_size = len(self._buffer) - len(delimiter) + 1
+                if safe_size > 0:
+                    yield _EVENT_DATA, bytes(self._buffer[:safe_size])
+                    del self._buffer[:safe_size]
+                if not self._fill():
+                    raise ImproperMultipartContentException("Unexpected end of multipart body")
+            yield _EVENT_END, None
@@ -9,11 +9,12 @@ from supervisely.metric.metric_base import MetricsBase
 
 class ConfusionMatrixMetric(MetricsBase):
 
-    def __init__(self, class_mapping, iou_threshold):
+    def __init__(self, class_mapping, iou_threshold, matching_method='greedy'):
         if len(class_mapping) < 1:
             raise RuntimeError('At least one classes pair should be defined!')
         self._class_mapping = class_mapping.copy()
         self._iou_threshold = iou_threshold
+        self._matching_method = matching_method
         self._confusion_matrix = {(cls_gt, cls_pred): 0
                                   for cls_gt in class_mapping.keys()
                                   for cls_pred in class_mapping.values()}
@@ -24,7 +25,7 @@ class ConfusionMatrixMetric(MetricsBase):
         labels_gt = filter_labels_by_name(ann_gt.labels, self._unmatched_gt)
         labels_pred = filter_labels_by_name(ann_pred.labels, self._unmatched_pred)
         match_result = match_labels_by_iou(labels_1=labels_gt, labels_2=labels_pred, img_size=ann_gt.img_size,
-                                           iou_threshold=self._iou_threshold)
+                                           iou_threshold=self._iou_threshold, method=self._matching_method)
         for match in match_result.matches:
             self._confusion_matrix[match.label_1.obj_class.name, match.label_2.obj_class.name] += 1
         for unmatched_gt_label in match_result.unmatched_labels_1:
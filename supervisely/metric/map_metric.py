@@ -17,7 +17,8 @@ MatchWithConfidence = namedtuple('MatchWithConfidence', ['is_correct', 'confiden
 
 class MAPMetric(MetricsBase):
 
-    def __init__(self, class_mapping, iou_threshold, confidence_tag_name='confidence', confidence_threshold=0.0):
+    def __init__(self, class_mapping, iou_threshold, confidence_tag_name='confidence', confidence_threshold=0.0,
+                 matching_method='greedy'):
         if len(class_mapping) < 1:
             raise RuntimeError('At least one classes pair should be defined!')
         self._gt_to_pred_class_mapping = class_mapping.copy()
@@ -29,6 +30,7 @@ class MAPMetric(MetricsBase):
                              'calculations.')
 
         self._iou_threshold = iou_threshold
+        self._matching_method = matching_method
         self._confidence_tag_name = confidence_tag_name
         self._confidence_threshold = confidence_threshold
         self._counters = {
@@ -50,7 +52,7 @@ class MAPMetric(MetricsBase):
             elif label_confidence >= self._confidence_threshold:
                 labels_pred.append(label)
         match_result = match_labels_by_iou(labels_1=labels_gt, labels_2=labels_pred, img_size=ann_gt.img_size,
-                                           iou_threshold=self._iou_threshold)
+                                           iou_threshold=self._iou_threshold, method=self._matching_method)
         for match in match_result.matches:
             gt_class = match.label_1.obj_class.name
             label_pred = match.label_2
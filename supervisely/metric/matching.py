@@ -5,6 +5,7 @@ from supervisely.annotation.label import Label
 from supervisely.geometry.rectangle import Rectangle
 from supervisely.geometry.geometry import Geometry
 from supervisely.metric.common import safe_ratio
+from supervisely.sly_logger import logger
 
 import numpy as np
 
@@ -19,13 +20,21 @@ def filter_labels_by_name(labels, names_whitelist):
     return [label for label in labels if label.obj_class.name in names_whitelist]
 
 
+def _render_in_bbox(geometry: Geometry, bbox: Rectangle) -> np.ndarray:
+    # all pieces are drawn, polygon may be split into several ones by cropping
+    mask = np.full(bbox.to_size(), False)
+    for g in geometry.relative_crop(bbox):
+        g.draw(mask, color=True)
+    return mask
+
+
 def get_iou_rect(rect: Rectangle, other: Geometry):
     maybe_other_cropped = other.crop(rect)
     if len(maybe_other_cropped) == 0:
         return 0.0
     else:
-        [other_cropped] = maybe_other_cropped
-        intersection_area = other_cropped.area
+        # polygon may be split into several pieces by the rectangle
+        intersection_area = sum(other_cropped.area for other_cropped in maybe_other_cropped)
         if intersection_area == 0:
             return 0.0
         union_area = rect.area + other.area - intersection_area
@@ -39,12 +48,8 @@ def get_geometries_iou(geometry_1: Geometry, geometry_2: Geometry):
         return get_iou_rect(geometry_2, geometry_1)
     else:
         common_bbox = Rectangle.from_geometries_list((geometry_1, geometry_2))
-        g1 = geometry_1.relative_crop(common_bbox)[0]
-        g2 = geometry_2.relative_crop(common_bbox)[0]
-        mask_1 = np.full(common_bbox.to_size(), False)
-        g1.draw(mask_1, color=True)
-        mask_2 = np.full(common_bbox.to_size(), False)
-        g2.draw(mask_2, color=True)
+        mask_1 = _render_in_bbox(geometry_1, common_bbox)
+        mask_2 = _render_in_bbox(geometry_2, common_bbox)
         return safe_ratio((mask_1 & mask_2).sum(), (mask_1 | mask_2).sum())
 
 
@@ -74,8 +79,137 @@ def match_indices_by_score(elems_1, elems_2, score_threshold, score_fn):
     return IndexMatchResult(matches=matches, unmatched_indices_1=unmatched_1, unmatched_indices_2=unmatched_2)
 
 
-def match_labels_by_iou(labels_1, labels_2, img_size, iou_threshold):
-    index_matches = match_indices_by_score(labels_1, labels_2, iou_threshold, score_fn=get_labels_iou)
+def _get_bboxes_np(geometries):
+    bboxes = [g.to_bbox() for g in geometries]
+    return np.array([[b.top, b.left, b.bottom, b.right] for b in bboxes], dtype=np.int64).reshape(-1, 4)
+
+
+def get_rectangles_iou_matrix(bboxes_1: np.ndarray, bboxes_2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized IoU of all pairs of rectangles. Coordinates are inclusive, the same way as in Rectangle.
+
+    :param bboxes_1: Array with shape (N, 4) of (top, left, bottom, right).
+    :param bboxes_2: Array with shape (M, 4) of (top, left, bottom, right).
+    :return: Array with shape (N, M).
+    """
+    bboxes_1 = bboxes_1[:, None, :]
+    bboxes_2 = bboxes_2[None, :, :]
+    inter_h = np.minimum(bboxes_1[..., 2], bboxes_2[..., 2]) - np.maximum(bboxes_1[..., 0], bboxes_2[..., 0]) + 1
+    inter_w = np.minimum(bboxes_1[..., 3], bboxes_2[..., 3]) - np.maximum(bboxes_1[..., 1], bboxes_2[..., 1]) + 1
+    inter_area = (np.clip(inter_h, 0, None) * np.clip(inter_w, 0, None)).astype(np.float64)
+    area_1 = ((bboxes_1[..., 2] - bboxes_1[..., 0] + 1) * (bboxes_1[..., 3] - bboxes_1[..., 1] + 1)).astype(np.float64)
+    area_2 = ((bboxes_2[..., 2] - bboxes_2[..., 0] + 1) * (bboxes_2[..., 3] - bboxes_2[..., 1] + 1)).astype(np.float64)
+    union_area = area_1 + area_2 - inter_area
+    return np.where(inter_area > 0, inter_area / np.where(union_area > 0, union_area, 1), 0.0)
+
+
+def get_geometries_iou_matrix(geometries_1, geometries_2) -> np.ndarray:
+    """
+    IoU of all pairs of geometries computed in batch. Rectangle pairs are computed in a vectorized way.
+    Other geometries are rendered to masks only once, within their own bounding boxes, and pairs
+    are compared only if their bounding boxes overlap. Values are the same as :func:`get_geometries_iou` returns.
+
+    :param geometries_1: List of geometries.
+    :param geometries_2: List of geometries.
+    :return: Array with shape (len(geometries_1), len(geometries_2)).
+    """
+    iou = np.zeros((len(geometries_1), len(geometries_2)), dtype=np.float64)
+    if iou.size == 0:
+        return iou
+    bboxes_1 = _get_bboxes_np(geometries_1)
+    bboxes_2 = _get_bboxes_np(geometries_2)
+    is_rect_1 = np.array([isinstance(g, Rectangle) for g in geometries_1])
+    is_rect_2 = np.array([isinstance(g, Rectangle) for g in geometries_2])
+
+    rect_pairs = is_rect_1[:, None] & is_rect_2[None, :]
+    if rect_pairs.any():
+        rect_iou = get_rectangles_iou_matrix(bboxes_1[is_rect_1], bboxes_2[is_rect_2])
+        iou[np.ix_(is_rect_1, is_rect_2)] = rect_iou
+
+    # Pairs with non overlapping bounding boxes have zero IoU.
+    overlap = (
+        (np.maximum(bboxes_1[:, None, 0], bboxes_2[None, :, 0]) <= np.minimum(bboxes_1[:, None, 2], bboxes_2[None, :, 2]))
+        & (np.maximum(bboxes_1[:, None, 1], bboxes_2[None, :, 1]) <= np.minimum(bboxes_1[:, None, 3], bboxes_2[None, :, 3]))
+    )
+    masks_1, masks_2 = {}, {}
+
+    def _get_mask(cache, geometries, bboxes, idx):
+        if idx not in cache:
+            bbox = Rectangle(*bboxes[idx].tolist())
+            mask = _render_in_bbox(geometries[idx], bbox)
+            cache[idx] = (mask, int(mask.sum()))
+        return cache[idx]
+
+    for idx_1, idx_2 in zip(*np.nonzero(overlap & ~rect_pairs)):
+        geometry_1, geometry_2 = geometries_1[idx_1], geometries_2[idx_2]
+        if is_rect_1[idx_1]:
+            iou[idx_1, idx_2] = get_iou_rect(geometry_1, geometry_2)
+        elif is_rect_2[idx_2]:
+            iou[idx_1, idx_2] = get_iou_rect(geometry_2, geometry_1)
+        else:
+            mask_1, area_1 = _get_mask(masks_1, geometries_1, bboxes_1, idx_1)
+            mask_2, area_2 = _get_mask(masks_2, geometries_2, bboxes_2, idx_2)
+            top_1, left_1 = bboxes_1[idx_1, :2]
+            top_2, left_2 = bboxes_2[idx_2, :2]
+            top, left = max(top_1, top_2), max(left_1, left_2)
+            bottom = min(bboxes_1[idx_1, 2], bboxes_2[idx_2, 2])
+            right = min(bboxes_1[idx_1, 3], bboxes_2[idx_2, 3])
+            window_1 = mask_1[top - top_1 : bottom - top_1 + 1, left - left_1 : right - left_1 + 1]
+            window_2 = mask_2[top - top_2 : bottom - top_2 + 1, left - left_2 : right - left_2 + 1]
+            intersection = int(np.count_nonzero(window_1 & window_2))
+            iou[idx_1, idx_2] = safe_ratio(intersection, area_1 + area_2 - intersection)
+    return iou
+
+
+def match_indices_by_iou_matrix(iou_matrix: np.ndarray, iou_threshold, method='greedy'):
+    """
+    Matches elements by precomputed IoU matrix, no element is matched to more than one counterpart.
+
+    :param iou_matrix: Array with shape (N, M).
+    :param iou_threshold: Pairs with IoU less than threshold are not matched.
+    :param method: 'greedy' matches pairs in descending order of IoU (the same way as :func:`match_indices_by_score`),
+        'hungarian' finds assignment with maximal total IoU, requires scipy.
+    :return: IndexMatchResult
+    """
+    n_1, n_2 = iou_matrix.shape
+    matches = []
+    if method == 'greedy':
+        candidates = np.flatnonzero(iou_matrix >= iou_threshold)
+        scores = iou_matrix.ravel()[candidates]
+        # stable sort keeps the order of pairs with equal scores
+        candidates = candidates[np.argsort(-scores, kind='stable')]
+        matched_1 = np.zeros(n_1, dtype=bool)
+        matched_2 = np.zeros(n_2, dtype=bool)
+        for idx_1, idx_2 in zip(*np.unravel_index(candidates, iou_matrix.shape)):
+            if not matched_1[idx_1] and not matched_2[idx_2]:
+                matches.append(IndexPairWithScore(idx_1=int(idx_1), idx_2=int(idx_2),
+                                                  score=iou_matrix[idx_1, idx_2].item()))
+                matched_1[idx_1] = True
+                matched_2[idx_2] = True
+    elif method == 'hungarian':
+        try:
+            from scipy.optimize import linear_sum_assignment
+        except ModuleNotFoundError as e:
+            logger.error(f'{e}. Try to install extra dependencies. Run "pip install supervisely[extras]"')
+            raise e
+        weights = np.where(iou_matrix >= iou_threshold, iou_matrix, 0.0)
+        rows, cols = linear_sum_assignment(weights, maximize=True)
+        for idx_1, idx_2 in zip(rows, cols):
+            if iou_matrix[idx_1, idx_2] >= iou_threshold:
+                matches.append(IndexPairWithScore(idx_1=int(idx_1), idx_2=int(idx_2),
+                                                  score=iou_matrix[idx_1, idx_2].item()))
+        matches.sort(key=lambda p: p.score, reverse=True)
+    else:
+        raise ValueError("Unknown matching method {!r}, expected 'greedy' or 'hungarian'".format(method))
+    unmatched_1 = set(range(n_1)) - {m.idx_1 for m in matches}
+    unmatched_2 = set(range(n_2)) - {m.idx_2 for m in matches}
+    return IndexMatchResult(matches=matches, unmatched_indices_1=unmatched_1, unmatched_indices_2=unmatched_2)
+
+
+def match_labels_by_iou(labels_1, labels_2, img_size, iou_threshold, method='greedy'):
+    iou_matrix = get_geometries_iou_matrix([label.geometry for label in labels_1],
+                                           [label.geometry for label in labels_2])
+    index_matches = match_indices_by_iou_matrix(iou_matrix, iou_threshold, method=method)
     return LabelsMatchResult(
         matches=[LabelsPairWithScore(label_1=labels_1[match.idx_1], label_2=labels_2[match.idx_2], score=match.score)
                  for match in index_matches.matches],
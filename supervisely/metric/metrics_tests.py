@@ -94,6 +94,28 @@ class PointTest(unittest.TestCase):
         expected_map = (4 * 0.0 + 3 * (2/10) + 4 * 1/2) / 11
         self.assertEqual(self._metric_calculator.get_total_metrics()[AP], expected_map)
 
+    def test_hungarian_matching(self):
+        # Greedy matching takes pred_1 - gt_1 pair with the highest IoU and leaves pred_2 and gt_2 unmatched,
+        # Hungarian matching finds pred_1 - gt_2 and pred_2 - gt_1 pairs.
+        gt_1 = Label(obj_class=self._obj_class_gt, geometry=Rectangle(0, 0, 9, 9))
+        gt_2 = Label(obj_class=self._obj_class_gt, geometry=Rectangle(0, 4, 9, 13))
+        pred_1 = Label(
+            obj_class=self._obj_class_pred,
+            geometry=Rectangle(0, 1, 9, 10),
+            tags=TagCollection([Tag(meta=self._confidence_tag_meta, value=0.9)]))
+        pred_2 = Label(
+            obj_class=self._obj_class_pred,
+            geometry=Rectangle(0, 0, 9, 7),
+            tags=TagCollection([Tag(meta=self._confidence_tag_meta, value=0.8)]))
+        ann = Annotation(img_size=[100, 100], labels=[gt_1, gt_2, pred_1, pred_2])
+
+        self._metric_calculator.add_pair(ann, ann)
+        self.assertEqual(self._metric_calculator.get_total_metrics()[AP], 6 / 11)
+
+        hungarian_calculator = MAPMetric(class_mapping={'a': 'b'}, iou_threshold=0.5, matching_method='hungarian')
+        hungarian_calculator.add_pair(ann, ann)
+        self.assertEqual(hungarian_calculator.get_total_metrics()[AP], 1)
+
 
 if __name__ == '__main__':
     unittest.main()
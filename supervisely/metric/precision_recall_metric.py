@@ -13,12 +13,13 @@ RAW_COUNTERS = [TRUE_POSITIVE, TOTAL_GROUND_TRUTH, TOTAL_PREDICTIONS]
 
 class PrecisionRecallMetric(MetricsBase):
 
-    def __init__(self, class_mapping, iou_threshold):
+    def __init__(self, class_mapping, iou_threshold, matching_method='greedy'):
         if len(class_mapping) < 1:
             raise RuntimeError('At least one classes pair should be defined!')
         self._gt_to_pred_class_mapping = class_mapping.copy()
         self._pred_to_gt_class_mapping = {v: k for k, v in class_mapping.items()}
         self._iou_threshold = iou_threshold
+        self._matching_method = matching_method
         self._counters = {gt_cls: {counter: 0 for counter in RAW_COUNTERS}
                           for gt_cls in self._gt_to_pred_class_mapping.keys()}
 
@@ -27,7 +28,7 @@ class PrecisionRecallMetric(MetricsBase):
             labels_gt = filter_labels_by_name(ann_gt.labels, [key])
             labels_pred = filter_labels_by_name(ann_pred.labels, [self._gt_to_pred_class_mapping[key]])
             match_result = match_labels_by_iou(labels_1=labels_gt, labels_2=labels_pred, img_size=ann_gt.img_size,
-                                               iou_threshold=self._iou_threshold)
+                                               iou_threshold=self._iou_threshold, method=self._matching_method)
             # TODO unify with confusion matrix ?
             for match in match_result.matches:
                 self._counters[match.label_1.obj_class.name][TRUE_POSITIVE] += 1
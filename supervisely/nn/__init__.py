@@ -1,2 +1,7 @@
 import supervisely.nn.inference as inference
 from supervisely.nn.prediction_dto import PredictionMask, PredictionBBox, Prediction, PredictionSegmentation, PredictionKeypoints
+from supervisely.nn.data_loader import ProjectDataLoader
+
+from supervisely._utils import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
@@ -0,0 +1,423 @@
+# coding: utf-8
+"""Multi-process loader of training batches from local Supervisely project"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from supervisely.annotation.annotation import Annotation
+from supervisely.aug import aug
+from supervisely.imaging import image as sly_image
+from supervisely.project.project import OpenMode, Project
+from supervisely.project.project_meta import ProjectMeta
+from supervisely.sly_logger import logger
+
+# seconds to wait for a batch before checking that workers are alive
+_WORKER_POLL_TIMEOUT_SEC = 5
+# attempts to replace corrupted sample with a random one, the number of failed samples is limited by loader
+_MAX_SAMPLE_RETRIES = 100
+
+
+def _get_seed(*values: int) -> int:
+    """Seed derived from the given numbers, it is the same in all processes (unlike hash of str)."""
+    return int(np.random.SeedSequence(list(values)).generate_state(1)[0])
+
+
+def _seed_sample(seed: int, epoch: int, index: int) -> None:
+    """
+    Seed random generators used by augmentations. Seed depends only on the sample and epoch,
+    so results are the same regardless of the worker which processes the sample.
+    """
+    sample_seed = _get_seed(seed, epoch, index)
+    random.seed(sample_seed)
+    np.random.seed(sample_seed)
+    if "imgaug" in sys.modules:
+        sys.modules["imgaug"].random.seed(sample_seed)
+
+
+@contextmanager
+def _keep_global_random_state():
+    """
+    Restores states of global random generators, so samples read in the main process
+    don't change random numbers of the training script.
+    """
+    python_state = random.getstate()
+    numpy_state = np.random.get_state()
+    imgaug = sys.modules.get("imgaug")
+    imgaug_rng = imgaug.random.get_global_rng().copy() if imgaug is not None else None
+    try:
+        yield
+    finally:
+        random.setstate(python_state)
+        np.random.set_state(numpy_state)
+        if imgaug_rng is not None:
+            imgaug.random.set_global_rng(imgaug_rng)
+
+
+class _SampleReader:
+    """
+    Reads image and annotation of a sample, applies transform and renders segmentation mask
+    of output size. Used in worker processes and in the main process when there are no workers.
+    """
+
+    def __init__(self, meta_json, class_mapping, out_size, bkg_color, transform, seed, samples):
+        self._meta = ProjectMeta.from_json(meta_json)
+        self._class_mapping = class_mapping
+        self._out_size = tuple(out_size)
+        self._bkg_color = bkg_color
+        self._transform = transform
+        self._seed = seed
+        self._samples = samples
+
+    def read(self, index, epoch):
+        img_path, ann_path = self._samples[index]
+        _seed_sample(self._seed, epoch, index)
+        img = sly_image.read(img_path)
+        ann = Annotation.load_json_file(ann_path, self._meta)
+        if self._transform is not None:
+            img, ann = self._transform(img, ann)
+        # annotation is resized instead of the rendered mask, so it is drawn only at output size
+        img, ann = aug.resize(img, ann, self._out_size)
+        mask = np.full(self._out_size, self._bkg_color, dtype=np.int32)
+        for label in ann.labels:
+            color = self._class_mapping.get(label.obj_class.name)
+            if color is not None:
+                label.geometry.draw(mask, color)
+        return img, mask
+
+    def read_batch(self, indexes, epoch, images, masks, failed):
+        """
+        Fill images and masks arrays with samples. Corrupted sample is replaced with another random
+        sample, the failed ones are appended to "failed" list as (index, image path, annotation path, error).
+        """
+        for batch_idx, index in enumerate(indexes):
+            rng = random.Random(_get_seed(self._seed, epoch, index))
+            for _ in range(_MAX_SAMPLE_RETRIES):
+                try:
+                    images[batch_idx], masks[batch_idx] = self.read(index, epoch)
+                    break
+                except Exception as e:
+                    failed.append((index, *self._samples[index], repr(e)))
+                    index = rng.randrange(len(self._samples))
+            else:
+                raise RuntimeError("Unable to load some correct sample.")
+
+
+def _worker_loop(reader_args, slots, out_size, batch_size, task_queue, result_queue):
+    """Process batches from task queue, write them to shared memory slots and notify main process."""
+    reader = _SampleReader(*reader_args)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+        batch_idx, slot_idx, epoch, indexes = task
+        images, masks = _slot_arrays(slots[slot_idx], out_size, batch_size)
+        failed, error = [], None
+        try:
+            reader.read_batch(indexes, epoch, images, masks, failed)
+        except Exception as e:
+            error = repr(e)
+        result_queue.put((batch_idx, slot_idx, failed, error))
+
+
+def _slot_arrays(slot, out_size, batch_size):
+    """Numpy views of shared memory slot: images (B, H, W, 3) uint8 and masks (B, H, W) int32."""
+    images_raw, masks_raw = slot
+    images = np.frombuffer(images_raw, dtype=np.uint8).reshape((batch_size, *out_size, 3))
+    masks = np.frombuffer(masks_raw, dtype=np.int32).reshape((batch_size, *out_size))
+    return images, masks
+
+
+class ProjectDataLoader:
+    """
+    Loads batches of images and segmentation masks from local Supervisely :class:`Project<supervisely.project.project.Project>`.
+    Images decoding, annotations parsing, transforms and masks rendering run in worker processes,
+    which write batches to shared memory, so batches are prepared while the previous ones are used for training.
+    Loader doesn't depend on deep learning framework: batches are numpy arrays.
+
+    :param project: Local project or path to its directory.
+    :type project: Project or str
+    :param class_mapping: Mask values of classes, e.g. {"person": 1, "car": 2}. Labels of other classes are not drawn.
+    :type class_mapping: Dict[str, int]
+    :param out_size: Size (height, width) of output images and masks.
+    :type out_size: Tuple[int, int]
+    :param batch_size: Number of samples in batch.
+    :type batch_size: int, optional
+    :param transform: Function which takes image and :class:`Annotation<supervisely.annotation.annotation.Annotation>` and returns transformed ones, e.g. functions from :mod:`supervisely.aug`. It must be picklable if processes are started with "spawn" method.
+    :type transform: Callable[[np.ndarray, Annotation], Tuple[np.ndarray, Annotation]], optional
+    :param bkg_color: Mask value of background.
+    :type bkg_color: int, optional
+    :param datasets: Names of datasets to load. All datasets are loaded by default.
+    :type datasets: List[str], optional
+    :param shuffle: Shuffle samples every epoch.
+    :type shuffle: bool, optional
+    :param drop_last: Skip last batch if it is incomplete.
+    :type drop_last: bool, optional
+    :param num_workers: Number of worker processes. With 0 samples are loaded in the main process, states of global random generators are restored after every batch.
+    :type num_workers: int, optional
+    :param prefetch_batches: Number of batches prepared ahead by every worker.
+    :type prefetch_batches: int, optional
+    :param seed: Seed of samples order and augmentations. Every sample is augmented with the seed depending on seed, epoch and sample index, so the results are reproducible with any number of workers.
+    :type seed: int, optional
+    :param allow_corrupted_cnt: Number of samples which can fail to load, they are replaced with random samples.
+    :type allow_corrupted_cnt: int, optional
+    :param mp_context: Start method of worker processes: "fork", "spawn" or "forkserver". Default method of the platform is used by default.
+    :type mp_context: str, optional
+    :Usage example:
+
+     .. code-block:: python
+
+        import functools
+        import supervisely as sly
+        from supervisely.nn.data_loader import ProjectDataLoader
+
+        project = sly.Project("/home/admin/work/lemons", sly.OpenMode.READ)
+        loader = ProjectDataLoader(
+            project,
+            class_mapping={"kiwi": 1, "lemon": 2},
+            out_size=(512, 512),
+            batch_size=16,
+            transform=functools.partial(sly.aug.random_crop_fraction, height_fraction_range=(0.7, 0.9), width_fraction_range=(0.7, 0.9)),
+            num_workers=4,
+        )
+        with loader:
+            for epoch in range(10):
+                for images, masks in loader:
+                    print(images.shape, masks.shape)
+                    # Output: (16, 512, 512, 3) (16, 512, 512)
+    """
+
+    def __init__(
+        self,
+        project: Union[Project, str],
+        class_mapping: Dict[str, int],
+        out_size: Tuple[int, int],
+        batch_size: Optional[int] = 8,
+        transform: Optional[Callable[[np.ndarray, Annotation], Tuple[np.ndarray, Annotation]]] = None,
+        bkg_color: Optional[int] = 0,
+        datasets: Optional[List[str]] = None,
+        shuffle: Optional[bool] = True,
+        drop_last: Optional[bool] = False,
+        num_workers: Optional[int] = 4,
+        prefetch_batches: Optional[int] = 2,
+        seed: Optional[int] = 0,
+        allow_corrupted_cnt: Optional[int] = 0,
+        mp_context: Optional[str] = None,
+    ):
+        if isinstance(project, str):
+            project = Project(project, OpenMode.READ)
+        self._samples: List[Tuple[str, str]] = []
+        for dataset in project.datasets:
+            if datasets is not None and dataset.name not in datasets:
+                continue
+            for item_name in dataset:
+                item_paths = dataset.get_item_paths(item_name)
+                self._samples.append((item_paths.img_path, item_paths.ann_path))
+        if len(self._samples) == 0:
+            raise ValueError("There are no items to load in project {!r}".format(project.name))
+
+        self._out_size = tuple(out_size)
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._drop_last = drop_last
+        self._num_workers = num_workers
+        self._prefetch_batches = max(prefetch_batches, 1)
+        self._seed = seed
+        self._allow_corrupted_cnt = allow_corrupted_cnt
+        self._failed_indexes = set()
+        self._epoch = 0
+        self._reader_args = (
+            project.meta.to_json(),
+            dict(class_mapping),
+            self._out_size,
+            bkg_color,
+            transform,
+            seed,
+            self._samples,
+        )
+        self._mp_context = multiprocessing.get_context(mp_context)
+        self._workers = []
+        self._slots = []
+        self._task_queue = None
+        self._result_queue = None
+
+    def __len__(self) -> int:
+        """Number of batches in epoch."""
+        if self._drop_last:
+            return len(self._samples) // self._batch_size
+        return -(-len(self._samples) // self._batch_size)
+
+    @property
+    def epoch(self) -> int:
+        """Epoch of the next iteration, it is increased after every full iteration over the loader."""
+        return self._epoch
+
+    def set_epoch(self, epoch: int) -> None:
+        """
+        Set epoch of the next iteration, e.g. to resume training with the same samples order and augmentations.
+
+        :param epoch: Epoch number.
+        :type epoch: int
+        """
+        self._epoch = epoch
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over batches of epoch.
+
+        :return: Pairs of images (B, H, W, 3) uint8 arrays in RGB format and masks (B, H, W) int32 arrays
+        :rtype: :class:`Iterator[Tuple[np.ndarray, np.ndarray]]`
+        """
+        epoch = self._epoch
+        batches = self._get_epoch_batches(epoch)
+        if self._num_workers <= 0:
+            yield from self._iter_in_main_process(batches, epoch)
+        else:
+            yield from self._iter_in_workers(batches, epoch)
+        self._epoch = epoch + 1
+
+    def close(self) -> None:
+        """Stop worker processes."""
+        for _ in self._workers:
+            self._task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=_WORKER_POLL_TIMEOUT_SEC)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+        self._slots = []
+
+    def __enter__(self) -> ProjectDataLoader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _get_epoch_batches(self, epoch):
+        indexes = list(range(len(self._samples)))
+        if self._shuffle:
+            random.Random(_get_seed(self._seed, epoch)).shuffle(indexes)
+        batches = []
+        for batch_start in range(0, len(indexes), self._batch_size):
+            batch = indexes[batch_start : batch_start + self._batch_size]
+            if len(batch) < self._batch_size and self._drop_last:
+                break
+            batches.append(batch)
+        return batches
+
+    def _register_failed(self, failed):
+        for index, img_path, ann_path, error in failed:
+            if index not in self._failed_indexes:
+                self._failed_indexes.add(index)
+                logger.warn(
+                    "Sample processing error.",
+                    extra={"img": img_path, "ann": ann_path, "exc_str": error},
+                )
+        if len(self._failed_indexes) > self._allow_corrupted_cnt:
+            raise RuntimeError(
+                "Too many errors occurred while processing samples. "
+                "Allowed: {}.".format(self._allow_corrupted_cnt)
+            )
+
+    def _iter_in_main_process(self, batches, epoch):
+        reader = _SampleReader(*self._reader_args)
+        for indexes in batches:
+            images = np.empty((len(indexes), *self._out_size, 3), dtype=np.uint8)
+            masks = np.empty((len(indexes), *self._out_size), dtype=np.int32)
+            failed = []
+            try:
+                with _keep_global_random_state():
+                    reader.read_batch(indexes, epoch, images, masks, failed)
+            finally:
+                self._register_failed(failed)
+            yield images, masks
+
+    def _start_workers(self):
+        if len(self._workers) > 0:
+            return
+        ctx = self._mp_context
+        images_size = self._batch_size * self._out_size[0] * self._out_size[1] * 3
+        masks_size = self._batch_size * self._out_size[0] * self._out_size[1]
+        num_slots = self._num_workers * self._prefetch_batches
+        self._slots = [
+            (ctx.RawArray("B", images_size), ctx.RawArray("i", masks_size))
+            for _ in range(num_slots)
+        ]
+        self._task_queue = ctx.Queue()
+        self._result_queue = ctx.Queue()
+        for _ in range(self._num_workers):
+            worker = ctx.Process(
+                target=_worker_loop,
+                args=(
+                    self._reader_args,
+                    self._slots,
+                    self._out_size,
+                    self._batch_size,
+                    self._task_queue,
+                    self._result_queue,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _get_result(self):
+        while True:
+            try:
+                return self._result_queue.get(timeout=_WORKER_POLL_TIMEOUT_SEC)
+            except queue.Empty:
+                dead = [w.pid for w in self._workers if not w.is_alive()]
+                if len(dead) > 0:
+                    raise RuntimeError(
+                        "Data loader worker processes exited unexpectedly: {}".format(dead)
+                    )
+
+    def _iter_in_workers(self, batches, epoch):
+        self._start_workers()
+        free_slots = list(range(len(self._slots)))
+        ready = {}  # batch index -> (slot index, error)
+        next_task = 0
+        in_flight = 0
+        try:
+            for batch_idx in range(len(batches)):
+                # every slot is a prefetched batch, workers wait for free slot when consumer is slow
+                while next_task < len(batches) and len(free_slots) > 0:
+                    task = (next_task, free_slots.pop(), epoch, batches[next_task])
+                    self._task_queue.put(task)
+                    next_task += 1
+                    in_flight += 1
+
+                while batch_idx not in ready:
+                    done_idx, slot_idx, failed, error = self._get_result()
+                    in_flight -= 1
+                    ready[done_idx] = (slot_idx, error)
+                    self._register_failed(failed)
+
+                slot_idx, error = ready.pop(batch_idx)
+                free_slots.append(slot_idx)
+                if error is not None:
+                    raise RuntimeError("Unable to load batch of samples: {}".format(error))
+                images, masks = _slot_arrays(
+                    self._slots[slot_idx], self._out_size, self._batch_size
+                )
+                # copy, because slot is filled with the next batches after it is released
+                cnt = len(batches[batch_idx])
+                yield images[:cnt].copy(), masks[:cnt].copy()
+        finally:
+            # slots must not be written by workers when the next iteration starts
+            while in_flight > 0:
+                self._get_result()
+                in_flight -= 1
@@ -595,12 +595,11 @@ class Inference:
             video_info=video_info,
             imgs_dir=video_images_path,
         )
-        inf_video_interface.download_frames()
 
         settings = self._get_inference_settings(state)
         logger.debug(f"Inference settings:", extra=settings)
 
-        n_frames = len(inf_video_interface.images_paths)
+        n_frames = len(inf_video_interface.frames_indexes)
         logger.debug(f"Total frames to infer: {n_frames}")
 
         if async_inference_request_uuid is not None:
@@ -617,8 +616,12 @@ class Inference:
             sly_progress: Progress = inference_request["progress"]
             sly_progress.total = n_frames
 
+        # frames are not stored on disk, every decoded frame is written to the same file
+        # right before inference, uncompressed BMP is used as the fastest lossless format
+        fs.mkdir(video_images_path)
+        image_path = os.path.join(video_images_path, "frame.bmp")
         results = []
-        for i, image_path in enumerate(inf_video_interface.images_paths):
+        for i, frame in enumerate(inf_video_interface.frames_generator()):
             if (
                 async_inference_request_uuid is not None
                 and inference_request["cancel_inference"] is True
@@ -630,6 +633,7 @@ class Inference:
                 results = []
                 break
             logger.debug(f"Inferring frame {i+1}/{n_frames}:", extra={"image_path": image_path})
+            sly_image.write(image_path, frame)
             data_to_return = {}
             ann = self._inference_image_path(
                 image_path=image_path,
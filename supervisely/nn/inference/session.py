@@ -321,7 +321,7 @@ class SessionJSON:
         method = url[len(self._base_url) :]
         for retry_idx in range(retries):
             try:
-                response = requests.post(*args, **kwargs)
+                response = self.api._session.post(*args, **kwargs)
                 if response.status_code != requests.codes.ok:
                     sly.Api._raise_for_status(response)
                 return response
@@ -0,0 +1,219 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+import numpy as np
+
+from supervisely._utils import batched
+from supervisely.imaging import image as sly_image
+from supervisely.sly_logger import logger
+
+# max size of decoded frames kept in memory by all tracking requests together
+DEFAULT_FRAMES_CACHE_SIZE_MB = int(os.environ.get("SUPERVISELY_TRACKING_FRAMES_CACHE_SIZE_MB", 1024))
+DEFAULT_PREFETCH_BATCH_SIZE = 16
+
+
+class FramesCache:
+    """
+    Thread-safe LRU cache of decoded video frames limited by the total size of frames in bytes.
+    Frames which are being downloaded are marked as pending, so other threads wait for them
+    instead of downloading the same frames again.
+
+    :param max_bytes: Max total size of cached frames in bytes.
+    :type max_bytes: int, optional
+    """
+
+    def __init__(self, max_bytes: Optional[int] = DEFAULT_FRAMES_CACHE_SIZE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._size = 0
+        self._pending = set()
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Total size of cached frames in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._cond:
+            return key in self._frames
+
+    def get(self, key: Hashable, wait: bool = True) -> Optional[np.ndarray]:
+        """
+        Returns cached frame or None. If wait is True and frame is being downloaded
+        by another thread, waits until download is finished.
+        """
+        with self._cond:
+            if wait:
+                self._cond.wait_for(lambda: key not in self._pending)
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+            return frame
+
+    def put(self, key: Hashable, frame: np.ndarray) -> None:
+        with self._cond:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self._size -= old.nbytes
+            self._frames[key] = frame
+            self._size += frame.nbytes
+            # the newest frame is never evicted, even if it doesn't fit into the limit alone
+            while self._size > self.max_bytes and len(self._frames) > 1:
+                _, evicted = self._frames.popitem(last=False)
+                self._size -= evicted.nbytes
+            self._pending.discard(key)
+            self._cond.notify_all()
+
+    def claim(self, keys: List[Hashable]) -> List[Hashable]:
+        """
+        Marks keys which are neither cached nor pending as pending and returns them.
+        Caller has to download these frames and :meth:`put` or :meth:`release` them.
+        """
+        with self._cond:
+            claimed = [k for k in keys if k not in self._frames and k not in self._pending]
+            self._pending.update(claimed)
+            return claimed
+
+    def release(self, keys: List[Hashable]) -> None:
+        """Removes pending mark from keys, e.g. when download failed."""
+        with self._cond:
+            self._pending.difference_update(keys)
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        with self._cond:
+            self._frames.clear()
+            self._size = 0
+
+
+# shared by all tracking requests, so requests on the same video reuse downloaded frames
+frames_cache = FramesCache()
+
+
+class FramesPrefetcher:
+    """
+    Downloads frames of the video in bulk in background thread and puts them into
+    :class:`FramesCache`. Prefetching goes at most ``prefetch_frames`` frames ahead
+    of the last requested frame.
+
+    :param api: Supervisely API object.
+    :type api: Api
+    :param video_id: Video ID in Supervisely.
+    :type video_id: int
+    :param frames_indexes: Indexes of frames in the order they will be requested.
+    :type frames_indexes: List[int]
+    :param cache: Cache for downloaded frames. Shared module cache is used by default.
+    :type cache: FramesCache, optional
+    :param batch_size: Number of frames downloaded in one request.
+    :type batch_size: int, optional
+    :param prefetch_frames: Max number of frames downloaded ahead of the current frame.
+    :type prefetch_frames: int, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        video_id: int,
+        frames_indexes: List[int],
+        cache: Optional[FramesCache] = None,
+        batch_size: Optional[int] = DEFAULT_PREFETCH_BATCH_SIZE,
+        prefetch_frames: Optional[int] = None,
+    ):
+        self.api = api
+        self.video_id = video_id
+        self.frames_indexes = list(frames_indexes)
+        self.cache = frames_cache if cache is None else cache
+        self.batch_size = batch_size
+        self.prefetch_frames = 2 * batch_size if prefetch_frames is None else prefetch_frames
+
+        self._position = 0
+        self._positions = {idx: pos for pos, idx in enumerate(self.frames_indexes)}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+
+    def _key(self, frame_index: int):
+        return (self.api.server_address, self.video_id, frame_index)
+
+    def start(self) -> "FramesPrefetcher":
+        """
+        Starts prefetching from the first frame. Stopped or finished prefetcher is started again,
+        e.g. when the same frames are requested for the next tracked object.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        with self._cond:
+            self._stopped = False
+            self._position = 0
+        self._thread = threading.Thread(target=self._prefetch, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def _prefetch(self):
+        for batch_start, batch in zip(
+            range(0, len(self.frames_indexes), self.batch_size),
+            batched(self.frames_indexes, self.batch_size),
+        ):
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopped or batch_start < self._position + self.prefetch_frames
+                )
+                if self._stopped:
+                    return
+            keys = self.cache.claim([self._key(idx) for idx in batch])
+            if len(keys) == 0:
+                continue
+            try:
+                for frame_index, part in self.api.video.frame._download_batch(
+                    self.video_id, [key[-1] for key in keys]
+                ):
+                    frame = sly_image.read_bytes(part.content)
+                    self.cache.put(self._key(frame_index), frame)
+            except Exception as e:
+                # frames will be downloaded one by one on request
+                logger.warn(f"Failed to prefetch frames of video {self.video_id}: {repr(e)}")
+                return
+            finally:
+                self.cache.release(keys)
+
+    def get(self, frame_index: int) -> np.ndarray:
+        """
+        Returns frame from the cache. Waits for the frame if it is being prefetched and
+        downloads it if it is not in the cache.
+
+        :param frame_index: Index of frame.
+        :type frame_index: int
+        :return: Frame in RGB numpy matrix format
+        :rtype: :class:`np.ndarray`
+        """
+        with self._cond:
+            position = self._positions.get(frame_index)
+            if position is not None and position > self._position:
+                self._position = position
+                self._cond.notify_all()
+
+        key = self._key(frame_index)
+        frame = self.cache.get(key)
+        if frame is None:
+            frame = self.api.video.frame.download_np(self.video_id, frame_index)
+            self.cache.put(key, frame)
+        return frame
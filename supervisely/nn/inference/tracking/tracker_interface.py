@@ -1,14 +1,26 @@
+import time
 import numpy as np
 from typing import Generator, Optional, List, Tuple, OrderedDict, Dict
 from collections import OrderedDict
 
 import supervisely as sly
+from supervisely.api.module_api import ApiField
 from supervisely.geometry.geometry import Geometry
+from supervisely.nn.inference.tracking.frames_cache import FramesCache, FramesPrefetcher
 from logging import Logger
 
 
 class TrackerInterface:
-    def __init__(self, context, api, load_all_frames=False):
+    def __init__(
+        self,
+        context,
+        api,
+        load_all_frames=False,
+        frames_cache: Optional[FramesCache] = None,
+        prefetch_batch_size: int = 16,
+        upload_batch_size: int = 100,
+        upload_interval: float = 1.0,
+    ):
         self.api: sly.Api = api
         self.logger: Logger = api.logger
         self.frame_index = context["frameIndex"]
@@ -38,7 +50,21 @@ class TrackerInterface:
         # increase self.stop by num of points
         self._add_geometries()
 
-        self._cache: Dict[int, np.ndarray] = {}
+        # frames are downloaded in bulk ahead of tracking and shared with other requests on the same video
+        self._prefetcher = FramesPrefetcher(
+            self.api,
+            self.video_id,
+            self.frames_indexes,
+            cache=frames_cache,
+            batch_size=prefetch_batch_size,
+        )
+
+        # predicted geometries are uploaded in bulk when batch is full or interval is passed
+        self.upload_batch_size = upload_batch_size
+        self.upload_interval = upload_interval
+        self._figures_buffer: List[Dict] = []
+        self._figures_frames: List[int] = []
+        self._last_upload_time = time.monotonic()
 
         if self.load_all_frames:
             self._load_frames()
@@ -56,38 +82,70 @@ class TrackerInterface:
     def frames_loader_generator(self) -> Generator[None, None, None]:
         if self.load_all_frames:
             self._cur_frames_indexes = self.frames_indexes
-            yield
+            try:
+                yield
+            finally:
+                self.upload_geometries()
             return
 
-        ind = self.frames_indexes[0]
-        frame = self._load_frame(ind)
-        for next_ind in self.frames_indexes[1:]:
-            next_frame = self._load_frame(next_ind)
-            self._frames = np.array([frame, next_frame])
-            self.frames_count = 1
-            self._cur_frames_indexes = [ind, next_ind]
-            yield
-            frame = next_frame
-            ind = next_ind
-
-            if self.global_stop_indicatior:
-                self.clear_cache()
-                return
+        self._prefetcher.start()
+        try:
+            ind = self.frames_indexes[0]
+            frame = self._load_frame(ind)
+            for next_ind in self.frames_indexes[1:]:
+                next_frame = self._load_frame(next_ind)
+                self._frames = np.array([frame, next_frame])
+                self.frames_count = 1
+                self._cur_frames_indexes = [ind, next_ind]
+                yield
+                frame = next_frame
+                ind = next_ind
+
+                if self.global_stop_indicatior:
+                    return
+        finally:
+            self.upload_geometries()
+            self.clear_cache()
 
     def add_object_geometry_on_frame(self, geometry: Geometry, object_id: int, frame_ind: int):
-        self.api.video.figure.create(
-            self.video_id,
-            object_id,
-            frame_ind,
-            geometry.to_json(),
-            geometry.geometry_name(),
-            self.track_id,
+        self._figures_buffer.append(
+            {
+                ApiField.META: {ApiField.FRAME: frame_ind},
+                ApiField.OBJECT_ID: object_id,
+                ApiField.GEOMETRY_TYPE: geometry.geometry_name(),
+                ApiField.GEOMETRY: geometry.to_json(),
+                ApiField.TRACK_ID: self.track_id,
+            }
         )
+        self._figures_frames.append(frame_ind)
         self.logger.debug(f"Added {geometry.geometry_name()} to frame #{frame_ind}")
-        self._notify(fstart=frame_ind, fend=frame_ind + 1, task="add geometry on frame")
+
+        if (
+            len(self._figures_buffer) >= self.upload_batch_size
+            or time.monotonic() - self._last_upload_time >= self.upload_interval
+        ):
+            self.upload_geometries()
+
+    def upload_geometries(self):
+        """Uploads buffered geometries and notifies about the progress of uploaded frames."""
+        self._last_upload_time = time.monotonic()
+        if len(self._figures_buffer) == 0:
+            return
+        figures, frames = self._figures_buffer, self._figures_frames
+        self._figures_buffer, self._figures_frames = [], []
+
+        self.api.video.figure.create_bulk(self.video_id, figures, batch_size=self.upload_batch_size)
+        self.logger.debug(f"Uploaded {len(figures)} geometries")
+        self._notify(
+            fstart=min(frames),
+            fend=max(frames) + 1,
+            task="add geometries on frames",
+            pos_increment=len(figures),
+        )
 
     def clear_cache(self):
-        self._cache.clear()
+        # frames stay in the shared cache for other requests, only prefetching is stopped
+        self._prefetcher.stop()
 
     def _add_geometries(self):
         self.logger.info("Adding geometries.")
@@ -129,20 +187,17 @@ class TrackerInterface:
             self.stop += len(self.frames_indexes)
 
     def _load_frame(self, frame_index):
-        if frame_index in self._cache:
-            return self._cache[frame_index]
-        frame = self.api.video.frame.download_np(self.video_id, frame_index)
-        self._cache[frame_index] = frame
-        return frame
+        return self._prefetcher.get(frame_index)
 
     def _load_frames(self):
         rgbs = []
         self.logger.info(f"Loading {len(self.frames_indexes)} frames.")
 
-        for frame_index in self.frames_indexes:
-            img_rgb = self._load_frame(frame_index)
-            rgbs.append(img_rgb)
-            self._notify(task="load frame")
+        with self._prefetcher:
+            for frame_index in self.frames_indexes:
+                img_rgb = self._load_frame(frame_index)
+                rgbs.append(img_rgb)
+                self._notify(task="load frame")
         self._frames = rgbs
         self.logger.info("Frames loaded.")
 
@@ -152,8 +207,9 @@ class TrackerInterface:
         fstart: Optional[int] = None,
         fend: Optional[int] = None,
         task: str = "not defined",
+        pos_increment: int = 1,
     ):
-        self.global_pos += 1
+        self.global_pos += pos_increment
 
         if stop:
             pos = self.stop
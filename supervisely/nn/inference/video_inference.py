@@ -1,15 +1,19 @@
 import os
 import shutil
 import time
+from typing import Iterator
 
-import cv2
-import ffmpeg
+import numpy as np
 
 import supervisely as sly
+from supervisely._utils import batched, prefetch_iterator
 from tqdm import tqdm
 
 
 class InferenceVideoInterface:
+    # frames are downloaded from the server in batches when only a small part of the video is requested
+    FRAMES_BATCH_SIZE = 16
+
     def __init__(
         self, api, start_frame_index, frames_count, frames_direction, video_info, imgs_dir
     ):
@@ -36,7 +40,9 @@ class InferenceVideoInterface:
 
         self._local_video_path = None
 
-        os.makedirs(self._frames_path, exist_ok=True)
+    @property
+    def frames_indexes(self):
+        return self._frames_indexes.copy()
 
     def _add_frames_indexes(self):
         total_frames = self.video_info.frames_count
@@ -58,66 +64,57 @@ class InferenceVideoInterface:
             ]
             self._frames_indexes = []
 
-    def _download_video_by_frames(self):
-        for index, frame_index in tqdm(
-            enumerate(self._frames_indexes),
-            desc="Downloading frames",
-            total=len(self._frames_indexes),
-        ):
-            frame_path = os.path.join(f"{self._frames_path}", f"frame{index:06d}.png")
-            self.images_paths.append(frame_path)
-
-            if os.path.isfile(frame_path):
-                continue
-
-            img_rgb = self.api.video.frame.download_np(self.video_info.id, frame_index)
-            # save frame as PNG file
-            sly.image.write(os.path.join(f"{self._frames_path}", f"frame{index:06d}.png"), img_rgb)
-
-    def _download_entire_video(self):
-        def videos_to_frames(video_path, frames_range=None):
-            vidcap = cv2.VideoCapture(video_path)
-            vidcap.set(cv2.CAP_PROP_ORIENTATION_AUTO, 1)
-
-            success, image = vidcap.read()
-            count = 0
-
-            while success:
-                output_image_path = os.path.join(f"{self._frames_path}", f"frame{count:06d}.png")
-                if frames_range:
-                    if frames_range[0] <= count <= frames_range[1]:
-                        cv2.imwrite(output_image_path, image)  # save frame as PNG file
-                        self.images_paths.append(output_image_path)
-                else:
-                    cv2.imwrite(output_image_path, image)  # save frame as PNG file
-                    self.images_paths.append(output_image_path)
-                success, image = vidcap.read()
-                count += 1
-
-            fps = vidcap.get(cv2.CAP_PROP_FPS)
+    def _download_frames_by_batches(self) -> Iterator[np.ndarray]:
+        for batch in batched(self._frames_indexes, batch_size=self.FRAMES_BATCH_SIZE):
+            for frame in self.api.video.frame.download_nps(self.video_info.id, batch):
+                yield frame
 
-            return {"frames_path": self._frames_path, "fps": fps, "video_path": video_path}
-
-        self._local_video_path = os.path.join(
-            self._imgs_dir, f"{time.time_ns()}_{self.video_info.name}"
-        )
-        self.api.video.download_path(self.video_info.id, self._local_video_path)
-        return videos_to_frames(
+    def _decode_entire_video(self) -> Iterator[np.ndarray]:
+        if self._local_video_path is None:
+            os.makedirs(self._imgs_dir, exist_ok=True)
+            local_video_path = os.path.join(
+                self._imgs_dir, f"{time.time_ns()}_{self.video_info.name}"
+            )
+            self.api.video.download_path(self.video_info.id, local_video_path)
+            self._local_video_path = local_video_path
+        # frames are decoded in place, prefetching is done by the caller
+        return sly.video.read_frames(
             self._local_video_path,
-            [self.start_frame_index, self.start_frame_index + self.frames_count - 1],
+            start_frame=self._frames_indexes[0],
+            frames_count=len(self._frames_indexes),
+            buffer_size=0,
         )
 
-    def download_frames(self):
+    def frames_generator(self, buffer_size: int = 8) -> Iterator[np.ndarray]:
+        """
+        Yields RGB frames in the order of requested frames indexes without saving them to disk.
+        Next frames are downloaded or decoded in background while the current one is processed,
+        at most buffer_size frames are kept in memory.
+        """
+        if len(self._frames_indexes) == 0:
+            return iter([])
         if self.frames_count > (self.video_info.frames_count * 0.3):
-            sly.logger.debug("Downloading entire video")
-            self._download_entire_video()
+            sly.logger.debug("Decoding entire video")
+            frames = self._decode_entire_video()
         else:
             sly.logger.debug("Downloading video frame by frame")
-            self._download_video_by_frames()
+            frames = self._download_frames_by_batches()
+        return prefetch_iterator(frames, buffer_size)
+
+    def download_frames(self):
+        os.makedirs(self._frames_path, exist_ok=True)
+        for index, frame in tqdm(
+            enumerate(self.frames_generator()),
+            desc="Downloading frames",
+            total=len(self._frames_indexes),
+        ):
+            frame_path = os.path.join(f"{self._frames_path}", f"frame{index:06d}.png")
+            sly.image.write(frame_path, frame)
+            self.images_paths.append(frame_path)
 
     def __del__(self):
         if os.path.isdir(self._frames_path):
             shutil.rmtree(os.path.dirname(self._frames_path), ignore_errors=True)
 
-            if self._local_video_path is not None and os.path.isfile(self._local_video_path):
-                os.remove(self._local_video_path)
+        if self._local_video_path is not None and os.path.isfile(self._local_video_path):
+            os.remove(self._local_video_path)
@@ -0,0 +1,419 @@
+# coding: utf-8
+"""Reading and writing PCD files with NumPy, without open3d"""
+
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib import recfunctions as rfn
+
+from supervisely.io.fs import ensure_base_path
+
+PCD_DATA_ASCII = "ascii"
+PCD_DATA_BINARY = "binary"
+PCD_DATA_BINARY_COMPRESSED = "binary_compressed"
+PCD_DATA_FORMATS = [PCD_DATA_ASCII, PCD_DATA_BINARY, PCD_DATA_BINARY_COMPRESSED]
+
+_DEFAULT_VIEWPOINT = [0, 0, 0, 1, 0, 0, 0]
+
+# (pcd type, size) <-> numpy dtype
+_PCD_TO_NUMPY = {
+    ("I", 1): np.int8,
+    ("I", 2): np.int16,
+    ("I", 4): np.int32,
+    ("I", 8): np.int64,
+    ("U", 1): np.uint8,
+    ("U", 2): np.uint16,
+    ("U", 4): np.uint32,
+    ("U", 8): np.uint64,
+    ("F", 4): np.float32,
+    ("F", 8): np.float64,
+}
+_NUMPY_TO_PCD = {np.dtype(v): k for k, v in _PCD_TO_NUMPY.items()}
+
+
+class PcdReadException(Exception):
+    pass
+
+
+def read_pcd_header(path: str) -> Tuple[Dict, int]:
+    """
+    Reads header of PCD file.
+
+    :param path: Path to PCD file.
+    :type path: str
+    :return: Header dict with lowercase keys ("fields", "size", "type", "count", "width",
+        "height", "viewpoint", "points", "data") and offset of the data in the file in bytes.
+    :rtype: :class:`Tuple[dict, int]`
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+
+        header, offset = sly.pointcloud.read_pcd_header('/home/admin/work/pointclouds/ptc0.pcd')
+        print(header["fields"])
+        # Output: ['x', 'y', 'z', 'intensity']
+    """
+    header = {}
+    with open(path, "rb") as f:
+        while True:
+            line = f.readline()
+            if line == b"":
+                raise PcdReadException(f"PCD header of file {path} has no DATA line")
+            line = line.decode("ascii", errors="replace").strip()
+            if line == "" or line.startswith("#"):
+                continue
+            key, _, value = line.partition(" ")
+            key = key.upper()
+            values = value.split()
+            if key == "DATA":
+                header["data"] = value.strip().lower()
+                break
+            if key in ("VERSION",):
+                header["version"] = value.strip()
+            elif key in ("FIELDS", "TYPE"):
+                header[key.lower()] = values
+            elif key in ("SIZE", "COUNT", "WIDTH", "HEIGHT", "POINTS"):
+                header[key.lower()] = [int(v) for v in values]
+            elif key == "VIEWPOINT":
+                header["viewpoint"] = [float(v) for v in values]
+        offset = f.tell()
+
+    if "fields" not in header or "size" not in header or "type" not in header:
+        raise PcdReadException(f"PCD header of file {path} has no FIELDS, SIZE or TYPE")
+    if header["data"] not in PCD_DATA_FORMATS:
+        raise PcdReadException(f"Unsupported PCD data format {header['data']!r} in file {path}")
+    header.setdefault("count", [1] * len(header["fields"]))
+    for key in ("width", "height", "points"):
+        if key in header:
+            header[key] = header[key][0]
+    header.setdefault("height", 1)
+    header.setdefault("width", header.get("points", 0))
+    header.setdefault("points", header["width"] * header["height"])
+    header.setdefault("viewpoint", list(_DEFAULT_VIEWPOINT))
+    return header, offset
+
+
+def _build_dtype(header: Dict) -> np.dtype:
+    names, formats = [], []
+    for i, (name, size, pcd_type, count) in enumerate(
+        zip(header["fields"], header["size"], header["type"], header["count"])
+    ):
+        np_type = _PCD_TO_NUMPY.get((pcd_type.upper(), size))
+        if np_type is None:
+            raise PcdReadException(f"Unsupported PCD field type {pcd_type}{size} of field {name!r}")
+        # "_" fields are used for padding and can be repeated
+        names.append(f"_{i}" if name == "_" else name)
+        # PCD binary data is little-endian
+        np_type = np.dtype(np_type).newbyteorder("<")
+        formats.append(np_type if count == 1 else (np_type, (count,)))
+    return np.dtype({"names": names, "formats": formats})
+
+
+def _select_fields(data: np.ndarray, fields: Optional[List[str]]) -> np.ndarray:
+    if fields is None:
+        fields = [name for name in data.dtype.names if not name.startswith("_")]
+        if len(fields) == len(data.dtype.names):
+            return data
+    missing = [name for name in fields if name not in data.dtype.names]
+    if len(missing) > 0:
+        raise KeyError(f"Fields {missing} are not found in point cloud. Available fields: {data.dtype.names}")
+    # view on the same memory without copying
+    return data[fields]
+
+
+def read_pcd(path: str, fields: Optional[List[str]] = None, mmap: bool = True) -> np.ndarray:
+    """
+    Reads PCD file in ascii, binary or binary_compressed format into NumPy structured array
+    with all fields of the file (e.g. x, y, z, intensity, ring). Binary files are memory-mapped,
+    so only the fields which are actually used are read from disk.
+
+    :param path: Path to PCD file.
+    :type path: str
+    :param fields: Names of fields to read. All fields are read by default.
+    :type fields: List[str], optional
+    :param mmap: Memory-map binary files instead of reading them into memory.
+    :type mmap: bool, optional
+    :return: Structured array of shape (points,)
+    :rtype: :class:`np.ndarray`
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+
+        points = sly.pointcloud.read_pcd('/home/admin/work/pointclouds/ptc0.pcd')
+        print(points.dtype.names)
+        # Output: ('x', 'y', 'z', 'intensity')
+
+        xyz = sly.pointcloud.read_pcd(path, fields=["x", "y", "z"])
+        xyz_np = sly.pointcloud.structured_to_np(xyz)
+    """
+    header, offset = read_pcd_header(path)
+    dtype = _build_dtype(header)
+    points = header["points"]
+    data_format = header["data"]
+
+    if data_format == PCD_DATA_ASCII:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = np.loadtxt(f, dtype=dtype, ndmin=1)
+        if len(data) != points:
+            raise PcdReadException(f"Expected {points} points in file {path}, got {len(data)}")
+    elif data_format == PCD_DATA_BINARY:
+        expected_size = offset + points * dtype.itemsize
+        if os.path.getsize(path) < expected_size:
+            raise PcdReadException(f"PCD file {path} is truncated")
+        if mmap and points > 0:
+            data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(points,))
+        else:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = np.fromfile(f, dtype=dtype, count=points)
+    else:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            compressed_size, uncompressed_size = struct.unpack("<II", f.read(8))
+            compressed = f.read(compressed_size)
+        if len(compressed) != compressed_size:
+            raise PcdReadException(f"PCD file {path} is truncated")
+        buffer = lzf_decompress(compressed, uncompressed_size)
+        if len(buffer) != points * dtype.itemsize:
+            raise PcdReadException(f"Wrong size of decompressed data in PCD file {path}")
+        # data is stored field by field: all values of the first field, then of the second, ...
+        data = np.empty(points, dtype=dtype)
+        start = 0
+        for name in dtype.names:
+            field_dtype = dtype.fields[name][0]
+            size = points * field_dtype.itemsize
+            values = np.frombuffer(
+                buffer,
+                dtype=field_dtype.base,
+                count=size // field_dtype.base.itemsize,
+                offset=start,
+            )
+            data[name] = values.reshape(data[name].shape)
+            start += size
+    return _select_fields(data, fields)
+
+
+def structured_to_np(data: np.ndarray, dtype: Optional[np.dtype] = np.float64) -> np.ndarray:
+    """
+    Converts structured array returned by :func:`read_pcd` to 2D array of shape (points, fields).
+
+    :param data: Structured array.
+    :type data: np.ndarray
+    :param dtype: Type of result array.
+    :type dtype: np.dtype, optional
+    :return: Array of shape (points, fields)
+    :rtype: :class:`np.ndarray`
+    """
+    result = np.empty((len(data), len(data.dtype.names)), dtype=dtype)
+    for i, name in enumerate(data.dtype.names):
+        result[:, i] = data[name]
+    return result
+
+
+def write_pcd(
+    path: str,
+    data: np.ndarray,
+    fields: Optional[List[str]] = None,
+    data_format: Optional[str] = PCD_DATA_BINARY,
+    viewpoint: Optional[List[float]] = None,
+) -> None:
+    """
+    Writes point cloud to PCD file in ascii, binary or binary_compressed format.
+    It creates directory from path if the directory for this path does not exist.
+
+    :param path: Path to PCD file.
+    :type path: str
+    :param data: Structured array with point fields or 2D array of shape (points, fields).
+    :type data: np.ndarray
+    :param fields: Names of columns of 2D array. Default (if None): x, y, z.
+    :type fields: List[str], optional
+    :param data_format: One of "ascii", "binary", "binary_compressed".
+    :type data_format: str, optional
+    :param viewpoint: Viewpoint of the point cloud (tx ty tz qw qx qy qz).
+    :type viewpoint: List[float], optional
+    :return: None
+    :rtype: :class:`NoneType`
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+        import numpy as np
+
+        points = np.random.randn(100, 4).astype(np.float32)
+        sly.pointcloud.write_pcd('/home/admin/work/pointclouds/ptc0.pcd', points, fields=["x", "y", "z", "intensity"])
+    """
+    if data_format not in PCD_DATA_FORMATS:
+        raise ValueError(f"Unsupported PCD data format {data_format!r}, one of {PCD_DATA_FORMATS} expected")
+    if data.dtype.names is None:
+        if data.ndim != 2:
+            raise ValueError("Point cloud has to be structured array or 2D array of shape (points, fields)")
+        if fields is None:
+            fields = ["x", "y", "z"]
+        if len(fields) != data.shape[1]:
+            raise ValueError(f"Point cloud has {data.shape[1]} columns, but {len(fields)} fields are given")
+        structured = np.empty(len(data), dtype=[(name, data.dtype) for name in fields])
+        for i, name in enumerate(fields):
+            structured[name] = data[:, i]
+        data = structured
+    elif fields is not None:
+        data = data[fields]
+    # continuous array without gaps between fields
+    data = rfn.repack_fields(np.ascontiguousarray(data))
+
+    sizes, types, counts = [], [], []
+    for name in data.dtype.names:
+        field_dtype = data.dtype.fields[name][0]
+        base = field_dtype.base.newbyteorder("<") if field_dtype.base.itemsize > 1 else field_dtype.base
+        pcd_type = _NUMPY_TO_PCD.get(np.dtype(base.type))
+        if pcd_type is None:
+            raise ValueError(f"Unsupported type {field_dtype} of field {name!r}")
+        types.append(pcd_type[0])
+        sizes.append(str(pcd_type[1]))
+        counts.append(str(int(np.prod(field_dtype.shape)) if field_dtype.shape else 1))
+    points = len(data)
+    viewpoint = _DEFAULT_VIEWPOINT if viewpoint is None else viewpoint
+
+    header = "\n".join(
+        [
+            "# .PCD v0.7 - Point Cloud Data file format",
+            "VERSION 0.7",
+            "FIELDS " + " ".join(data.dtype.names),
+            "SIZE " + " ".join(sizes),
+            "TYPE " + " ".join(types),
+            "COUNT " + " ".join(counts),
+            f"WIDTH {points}",
+            "HEIGHT 1",
+            "VIEWPOINT " + " ".join(str(v) for v in viewpoint),
+            f"POINTS {points}",
+            f"DATA {data_format}",
+            "",
+        ]
+    )
+
+    ensure_base_path(path)
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        if data_format == PCD_DATA_ASCII:
+            columns = []
+            for name in data.dtype.names:
+                column = data[name].reshape(points, -1)
+                columns.append(column)
+            formats = []
+            for name, column in zip(data.dtype.names, columns):
+                if np.issubdtype(column.dtype, np.floating):
+                    # enough digits to restore the same value
+                    fmt = "%.9g" if column.dtype.itemsize == 4 else "%.17g"
+                else:
+                    fmt = "%d"
+                formats.extend([fmt] * column.shape[1])
+            if points > 0:
+                table = np.empty((points, len(formats)), dtype=object)
+                start = 0
+                for column in columns:
+                    table[:, start : start + column.shape[1]] = column
+                    start += column.shape[1]
+                np.savetxt(f, table, fmt=formats, delimiter=" ")
+        elif data_format == PCD_DATA_BINARY:
+            f.write(data.astype(data.dtype.newbyteorder("<"), copy=False).tobytes())
+        else:
+            buffer = b"".join(
+                np.ascontiguousarray(data[name]).astype(
+                    data.dtype.fields[name][0].base.newbyteorder("<"), copy=False
+                ).tobytes()
+                for name in data.dtype.names
+            )
+            compressed = lzf_compress(buffer)
+            f.write(struct.pack("<II", len(compressed), len(buffer)))
+            f.write(compressed)
+
+
+def lzf_decompress(data: bytes, uncompressed_size: int) -> bytes:
+    """
+    Decompresses LZF data used by binary_compressed PCD files.
+    Uses python-lzf package if it is installed, pure python implementation otherwise.
+    """
+    try:
+        import lzf
+
+        result = lzf.decompress(data, uncompressed_size)
+        if result is None:
+            raise PcdReadException("Failed to decompress LZF data")
+        return result
+    except ImportError:
+        pass
+
+    out = bytearray(uncompressed_size)
+    in_len = len(data)
+    ip = op = 0
+    try:
+        while ip < in_len:
+            ctrl = data[ip]
+            ip += 1
+            if ctrl < 32:
+                # literal run of ctrl + 1 bytes
+                length = ctrl + 1
+                out[op : op + length] = data[ip : ip + length]
+                ip += length
+                op += length
+            else:
+                # back reference
+                length = ctrl >> 5
+                if length == 7:
+                    length += data[ip]
+                    ip += 1
+                ref = op - ((ctrl & 0x1F) << 8) - data[ip] - 1
+                ip += 1
+                length += 2
+                if ref < 0:
+                    raise PcdReadException("Invalid LZF data")
+                if ref + length <= op:
+                    out[op : op + length] = out[ref : ref + length]
+                else:
+                    # overlapping reference repeats the last (op - ref) bytes
+                    pattern = out[ref:op]
+                    repeated = pattern * (length // len(pattern) + 1)
+                    out[op : op + length] = repeated[:length]
+                op += length
+    except IndexError:
+        raise PcdReadException("Invalid LZF data")
+    if op != uncompressed_size:
+        raise PcdReadException("Invalid LZF data")
+    return bytes(out)
+
+
+def lzf_compress(data: bytes) -> bytes:
+    """
+    Compresses data in LZF format used by binary_compressed PCD files.
+    Uses python-lzf package if it is installed. Otherwise data is stored as LZF literal runs,
+    which is readable by any LZF decoder, but is not smaller than the input.
+    """
+    try:
+        import lzf
+
+        # lzf returns None if data can not be compressed into the given size
+        result = lzf.compress(data, len(data) + len(data) // 32 + 1)
+        if result is not None:
+            return result
+    except ImportError:
+        pass
+
+    if len(data) == 0:
+        return b""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    full_runs = len(raw) // 32
+    tail = len(raw) - full_runs * 32
+    out = np.empty(len(raw) + full_runs + (1 if tail else 0), dtype=np.uint8)
+    runs = out[: full_runs * 33].reshape(full_runs, 33)
+    runs[:, 0] = 31
+    runs[:, 1:] = raw[: full_runs * 32].reshape(full_runs, 32)
+    if tail:
+        out[full_runs * 33] = tail - 1
+        out[full_runs * 33 + 1 :] = raw[full_runs * 32 :]
+    return out.tobytes()
@@ -6,6 +6,13 @@ import numpy as np
 from typing import List, Optional
 from supervisely._utils import is_development, abs_url
 from supervisely.io.fs import ensure_base_path
+from supervisely.pointcloud.pcd import (
+    PcdReadException,
+    read_pcd,
+    read_pcd_header,
+    structured_to_np,
+    write_pcd,
+)
 
 # Do NOT use directly for extension validation. Use is_valid_ext() /  has_valid_ext() below instead.
 ALLOWED_POINTCLOUD_EXTENSIONS = [".pcd"]
@@ -214,9 +221,12 @@ def get_labeling_tool_link(url, name="open in labeling tool"):
 def read(path: str, coords_dims: Optional[List[int]] = None) -> np.ndarray:
     """
     Loads a pointcloud from the specified file and returns it in XYZ format.
+    Use :func:`read_pcd` to read all fields of the file, e.g. intensity.
 
     :param path: Path to file.
     :type path: str
+    :param coords_dims: List of indexes for (X, Y, Z) coords. Default (if None): [0, 1, 2].
+    :type coords_dims: Optional[List[int]]
     :return: Numpy array
     :rtype: :class:`np.ndarray`
     :Usage example:
@@ -228,19 +238,14 @@ def read(path: str, coords_dims: Optional[List[int]] = None) -> np.ndarray:
         pcd_np = sly.pointcloud.read('/home/admin/work/pointclouds/ptc0.pcd')
     """
 
-    try:
-        import open3d as o3d
-    except ImportError:
-        raise ImportError(
-            "No module named open3d. Please make sure that module is installed from pip and try again."
-        )
     validate_format(path)
     if coords_dims is None:
         coords_dims = [0, 1, 2]
-    pcd_data = o3d.io.read_point_cloud(path)
-    if pcd_data is None:
-        raise IOError(f"open3d can not open the file {path}")
-    pointcloud_np = np.asarray(pcd_data.points)
+    try:
+        pcd_data = read_pcd(path, fields=["x", "y", "z"])
+    except (PcdReadException, ValueError, KeyError) as e:
+        raise IOError(f"Can not open the file {path}: {e}")
+    pointcloud_np = structured_to_np(pcd_data)
     pointcloud_np = pointcloud_np[:, coords_dims]
     return pointcloud_np
 
@@ -269,17 +274,10 @@ def write(path: str, pointcloud_np: np.ndarray, coords_dims: Optional[List[int]]
         ptc = sly.pointcloud.write('/home/admin/work/pointclouds/ptc0.pcd', pointcloud)
     """
 
-    try:
-        import open3d as o3d
-    except ImportError:
-        raise ImportError(
-            "No module named open3d. Please make sure that module is installed from pip and try again."
-        )
     ensure_base_path(path)
     validate_format(path)
     if coords_dims is None:
         coords_dims = [0, 1, 2]
     pointcloud_np = pointcloud_np[:, coords_dims]
-    pcd_data = o3d.geometry.PointCloud()
-    pcd_data.points = o3d.utility.Vector3dVector(pointcloud_np)
-    return o3d.io.write_point_cloud(path, pcd_data)
+    write_pcd(path, pointcloud_np.astype(np.float32), fields=["x", "y", "z"])
+    return True
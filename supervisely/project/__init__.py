@@ -1 +1,8 @@
-from supervisely.project import download
\ No newline at end of file
+import importlib
+
+
+def __getattr__(name: str):
+    # download module imports Api and all project types, so it is imported on first access
+    if name == "download":
+        return importlib.import_module("supervisely.project.download")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
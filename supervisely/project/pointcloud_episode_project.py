@@ -18,7 +18,12 @@ from supervisely.io.json import dump_json_file, load_json_file
 from supervisely.pointcloud_annotation.pointcloud_episode_annotation import (
     PointcloudEpisodeAnnotation,
 )
-from supervisely.project.pointcloud_project import PointcloudProject, PointcloudDataset
+from supervisely.io.fs_cache import FileCache
+from supervisely.project.pointcloud_project import (
+    PointcloudProject,
+    PointcloudDataset,
+    _download_pointclouds_files,
+)
 from supervisely.project.project import OpenMode
 from supervisely.project.project import read_single_project as read_project_wrapper
 from supervisely.project.project_meta import ProjectMeta
@@ -484,6 +489,7 @@ class PointcloudEpisodeProject(PointcloudProject):
         batch_size: Optional[int] = 10,
         log_progress: Optional[bool] = False,
         progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ) -> None:
         """
         Download pointcloud episodes project from Supervisely to the given directory.
@@ -508,6 +514,8 @@ class PointcloudEpisodeProject(PointcloudProject):
         :type log_progress: :class:`bool`, optional
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: :class:`tqdm` or callable, optional
+        :param num_workers: Number of threads downloading point clouds and related images.
+        :type num_workers: :class:`int`, optional
         :return: None
         :rtype: NoneType
         :Usage example:
@@ -544,6 +552,7 @@ class PointcloudEpisodeProject(PointcloudProject):
             batch_size=batch_size,
             log_progress=log_progress,
             progress_cb=progress_cb,
+            num_workers=num_workers,
         )
 
     @staticmethod
@@ -619,6 +628,8 @@ def download_pointcloud_episode_project(
     batch_size: Optional[int] = 10,
     log_progress: Optional[bool] = False,
     progress_cb: Optional[Union[tqdm, Callable]] = None,
+    num_workers: Optional[int] = 1,
+    cache: Optional[FileCache] = None,
 ) -> None:
     """
     Download pointcloud episode project to the local directory.
@@ -645,6 +656,10 @@ def download_pointcloud_episode_project(
     :type log_progress: bool, optional
     :param progress_cb: Function for tracking download progress.
     :type progress_cb: tqdm or callable, optional
+    :param num_workers: Number of threads downloading point clouds and related images of a batch.
+    :type num_workers: int, optional
+    :param cache: Cache of downloaded files. Point clouds and related images found in the cache by hash are copied instead of downloading.
+    :type cache: FileCache, optional
 
     :return: None.
     :rtype: NoneType
@@ -724,81 +739,21 @@ def download_pointcloud_episode_project(
             pc_to_frame = {v: k for k, v in frame_to_pc_map.items()}
             item_to_ann = {name: pc_to_frame[name] for name in pointcloud_names}
 
-            for pointcloud_id, pointcloud_name, pointcloud_info in zip(
-                pointcloud_ids, pointcloud_names, batch
-            ):
-                pointcloud_file_path = dataset_fs.generate_item_path(pointcloud_name)
-                if download_pcd:
-                    try:
-                        api.pointcloud_episode.download_path(pointcloud_id, pointcloud_file_path)
-                    except Exception as e:
-                        logger.info(
-                            "INFO FOR DEBUGGING",
-                            extra={
-                                "project_id": project_id,
-                                "dataset_id": dataset.id,
-                                "pointcloud_id": pointcloud_id,
-                                "pointcloud_name": pointcloud_name,
-                                "pointcloud_file_path": pointcloud_file_path,
-                            },
-                        )
-                        raise e
-                else:
-                    touch(pointcloud_file_path)
-
-                if download_related_images:
-                    related_images_path = dataset_fs.get_related_images_path(pointcloud_name)
-                    try:
-                        related_images = api.pointcloud_episode.get_list_related_images(
-                            pointcloud_id
-                        )
-                    except Exception as e:
-                        logger.info(
-                            "INFO FOR DEBUGGING",
-                            extra={
-                                "project_id": project_id,
-                                "dataset_id": dataset.id,
-                                "pointcloud_id": pointcloud_id,
-                                "pointcloud_name": pointcloud_name,
-                            },
-                        )
-                        raise e
-
-                    for rimage_info in related_images:
-                        name = rimage_info[ApiField.NAME]
-                        if not sly_image.has_valid_ext(name):
-                            new_name = get_file_name(name)  # to fix cases like .png.json
-                            if sly_image.has_valid_ext(new_name):
-                                name = new_name
-                                rimage_info[ApiField.NAME] = name
-                            else:
-                                raise RuntimeError(
-                                    "Something wrong with photo context filenames.\
-                                                    Please, contact support"
-                                )
-                        rimage_id = rimage_info[ApiField.ID]
-
-                        path_img = os.path.join(related_images_path, name)
-                        path_json = os.path.join(related_images_path, name + ".json")
-
-                        try:
-                            api.pointcloud_episode.download_related_image(rimage_id, path_img)
-                        except Exception as e:
-                            logger.info(
-                                "INFO FOR DEBUGGING",
-                                extra={
-                                    "project_id": project_id,
-                                    "dataset_id": dataset.id,
-                                    "pointcloud_id": pointcloud_id,
-                                    "pointcloud_name": pointcloud_name,
-                                    "rimage_id": rimage_id,
-                                    "path_img": path_img,
-                                },
-                            )
-                            raise e
-
-                        dump_json_file(rimage_info, path_json)
+            pointcloud_paths = _download_pointclouds_files(
+                api.pointcloud_episode,
+                dataset_fs,
+                dataset.id,
+                batch,
+                download_items=download_pcd,
+                download_related_images=download_related_images,
+                num_workers=num_workers,
+                cache=cache,
+                debug_info={"project_id": project_id, "dataset_id": dataset.id},
+            )
 
+            for pointcloud_id, pointcloud_name, pointcloud_info, pointcloud_file_path in zip(
+                pointcloud_ids, pointcloud_names, batch, pointcloud_paths
+            ):
                 pointcloud_info = pointcloud_info._asdict() if download_pointclouds_info else None
                 try:
                     dataset_fs.add_item_file(
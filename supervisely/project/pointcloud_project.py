@@ -12,6 +12,7 @@ import shutil
 from tqdm import tqdm
 
 from supervisely.io.fs import (
+    get_file_ext,
     file_exists,
     touch,
     dir_exists,
@@ -27,7 +28,8 @@ import supervisely.imaging.image as sly_image
 from supervisely.io.json import dump_json_file, load_json_file
 from supervisely.project.project_meta import ProjectMeta
 from supervisely.task.progress import Progress
-from supervisely._utils import batched
+from supervisely._utils import batched, concurrent_map
+from supervisely.io.fs_cache import FileCache
 from supervisely.video_annotation.key_id_map import KeyIdMap
 
 from supervisely.api.module_api import ApiField
@@ -42,7 +44,7 @@ from supervisely.project.project import (
 
 
 from supervisely.pointcloud_annotation.pointcloud_annotation import PointcloudAnnotation
-import supervisely.pointcloud.pointcloud as sly_pointcloud
+from supervisely.pointcloud import pointcloud as sly_pointcloud
 from supervisely.project.video_project import VideoDataset, VideoProject
 from supervisely.io.json import dump_json_file
 from supervisely.project.project_type import ProjectType
@@ -727,6 +729,7 @@ class PointcloudProject(VideoProject):
         batch_size: Optional[int] = 10,
         log_progress: Optional[bool] = False,
         progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ) -> PointcloudProject:
         """
         Download pointcloud project from Supervisely to the given directory.
@@ -751,6 +754,8 @@ class PointcloudProject(VideoProject):
         :type log_progress: :class:`bool`, optional
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: :class:`tqdm` or callable, optional
+        :param num_workers: Number of threads downloading point clouds and related images.
+        :type num_workers: :class:`int`, optional
         :return: None
         :rtype: NoneType
         :Usage example:
@@ -786,6 +791,7 @@ class PointcloudProject(VideoProject):
             batch_size=batch_size,
             log_progress=log_progress,
             progress_cb=progress_cb,
+            num_workers=num_workers,
         )
 
     @staticmethod
@@ -849,6 +855,127 @@ class PointcloudProject(VideoProject):
         )
 
 
+def _fix_related_image_name(rimage_info: Dict) -> str:
+    name = rimage_info[ApiField.NAME]
+    if not sly_image.has_valid_ext(name):
+        new_name = get_file_name(name)  # to fix cases like .png.json
+        if sly_image.has_valid_ext(new_name):
+            name = new_name
+            rimage_info[ApiField.NAME] = name
+        else:
+            raise RuntimeError(
+                "Something wrong with photo context filenames.\
+                                Please, contact support"
+            )
+    return name
+
+
+def _download_file_cached(
+    download_fn: Callable,
+    item_id: int,
+    path: str,
+    item_hash: Optional[str] = None,
+    cache: Optional[FileCache] = None,
+    debug_info: Optional[Dict] = None,
+):
+    # files with known hash are copied from cache instead of downloading
+    use_cache = cache is not None and item_hash is not None and get_file_ext(path) != ""
+    if use_cache and cache.read_object(item_hash, path) is not None:
+        return
+    try:
+        download_fn(item_id, path)
+    except Exception as e:
+        logger.info("INFO FOR DEBUGGING", extra=debug_info)
+        raise e
+    if use_cache:
+        cache.write_object(path, item_hash)
+
+
+def _download_pointclouds_files(
+    module_api,
+    dataset_fs: PointcloudDataset,
+    dataset_id: int,
+    pointclouds: List[PointcloudInfo],
+    download_items: bool = True,
+    download_related_images: bool = True,
+    num_workers: int = 1,
+    cache: Optional[FileCache] = None,
+    debug_info: Optional[Dict] = None,
+) -> List[str]:
+    """
+    Downloads point clouds and their related images of one batch. Related images of all point clouds
+    are listed with one request, files are downloaded by num_workers threads.
+    Returns paths of downloaded point clouds.
+    """
+    debug_info = {} if debug_info is None else debug_info
+    pointcloud_paths = [dataset_fs.generate_item_path(info.name) for info in pointclouds]
+
+    # (download function, id, path, hash, debug info)
+    tasks = []
+    for pointcloud_info, pointcloud_file_path in zip(pointclouds, pointcloud_paths):
+        if download_items:
+            tasks.append(
+                (
+                    module_api.download_path,
+                    pointcloud_info.id,
+                    pointcloud_file_path,
+                    pointcloud_info.hash,
+                    {
+                        **debug_info,
+                        "pointcloud_id": pointcloud_info.id,
+                        "pointcloud_name": pointcloud_info.name,
+                        "pointcloud_file_path": pointcloud_file_path,
+                    },
+                )
+            )
+        else:
+            touch(pointcloud_file_path)
+
+    related_jsons = []
+    if download_related_images and len(pointclouds) > 0:
+        pointcloud_ids = [pointcloud_info.id for pointcloud_info in pointclouds]
+        try:
+            related_images = module_api.get_list_related_images_batch(dataset_id, pointcloud_ids)
+        except Exception as e:
+            logger.info(
+                "INFO FOR DEBUGGING", extra={**debug_info, "pointcloud_ids": pointcloud_ids}
+            )
+            raise e
+        for pointcloud_info, rimage_infos in zip(pointclouds, related_images):
+            related_images_path = dataset_fs.get_related_images_path(pointcloud_info.name)
+            for rimage_info in rimage_infos:
+                name = _fix_related_image_name(rimage_info)
+                rimage_id = rimage_info[ApiField.ID]
+                path_img = os.path.join(related_images_path, name)
+                path_json = os.path.join(related_images_path, name + ".json")
+                tasks.append(
+                    (
+                        module_api.download_related_image,
+                        rimage_id,
+                        path_img,
+                        rimage_info.get(ApiField.HASH),
+                        {
+                            **debug_info,
+                            "pointcloud_id": pointcloud_info.id,
+                            "pointcloud_name": pointcloud_info.name,
+                            "rimage_id": rimage_id,
+                            "path_img": path_img,
+                        },
+                    )
+                )
+                related_jsons.append((rimage_info, path_json))
+
+    for _ in concurrent_map(
+        lambda task: _download_file_cached(*task[:4], cache=cache, debug_info=task[4]),
+        tasks,
+        num_workers,
+    ):
+        pass
+    for rimage_info, path_json in related_jsons:
+        dump_json_file(rimage_info, path_json)
+    return pointcloud_paths
+
+
 def download_pointcloud_project(
     api: Api,
     project_id: int,
@@ -860,6 +987,8 @@ def download_pointcloud_project(
     batch_size: Optional[int] = 10,
     log_progress: Optional[bool] = False,
     progress_cb: Optional[Union[tqdm, Callable]] = None,
+    num_workers: Optional[int] = 1,
+    cache: Optional[FileCache] = None,
 ) -> None:
     """
     Download pointcloud project to the local directory.
@@ -884,6 +1013,10 @@ def download_pointcloud_project(
     :type log_progress: bool, optional
     :param progress_cb: Function for tracking download progress.
     :type progress_cb: tqdm or callable, optional
+    :param num_workers: Number of threads downloading point clouds and related images of a batch.
+    :type num_workers: int, optional
+    :param cache: Cache of downloaded files. Point clouds and related images found in the cache by hash are copied instead of downloading.
+    :type cache: FileCache, optional
 
     :return: None.
     :rtype: NoneType
@@ -952,82 +1085,28 @@ def download_pointcloud_project(
 
             ann_jsons = api.pointcloud.annotation.download_bulk(dataset.id, pointcloud_ids)
 
-            for pointcloud_id, pointcloud_name, ann_json, pointcloud_info in zip(
-                pointcloud_ids, pointcloud_names, ann_jsons, batch
-            ):
+            pointcloud_paths = _download_pointclouds_files(
+                api.pointcloud,
+                dataset_fs,
+                dataset.id,
+                batch,
+                download_items=download_items,
+                download_related_images=download_related_images,
+                num_workers=num_workers,
+                cache=cache,
+                debug_info={"project_id": project_id, "dataset_id": dataset.id},
+            )
+
+            for (
+                pointcloud_id,
+                pointcloud_name,
+                ann_json,
+                pointcloud_info,
+                pointcloud_file_path,
+            ) in zip(pointcloud_ids, pointcloud_names, ann_jsons, batch, pointcloud_paths):
                 if pointcloud_name != ann_json[ApiField.NAME]:
                     raise RuntimeError("Error in api.video.annotation.download_batch: broken order")
 
-                pointcloud_file_path = dataset_fs.generate_item_path(pointcloud_name)
-                if download_items:
-                    try:
-                        api.pointcloud.download_path(pointcloud_id, pointcloud_file_path)
-                    except Exception as e:
-                        logger.info(
-                            "INFO FOR DEBUGGING",
-                            extra={
-                                "project_id": project_id,
-                                "dataset_id": dataset.id,
-                                "pointcloud_id": pointcloud_id,
-                                "pointcloud_name": pointcloud_name,
-                                "pointcloud_file_path": pointcloud_file_path,
-                            },
-                        )
-                        raise e
-                else:
-                    touch(pointcloud_file_path)
-
-                if download_related_images:
-                    related_images_path = dataset_fs.get_related_images_path(pointcloud_name)
-                    try:
-                        related_images = api.pointcloud.get_list_related_images(pointcloud_id)
-                    except Exception as e:
-                        logger.info(
-                            "INFO FOR DEBUGGING",
-                            extra={
-                                "project_id": project_id,
-                                "dataset_id": dataset.id,
-                                "pointcloud_id": pointcloud_id,
-                                "pointcloud_name": pointcloud_name,
-                            },
-                        )
-                        raise e
-                    for rimage_info in related_images:
-                        name = rimage_info[ApiField.NAME]
-
-                        if not sly_image.has_valid_ext(name):
-                            new_name = get_file_name(name)  # to fix cases like .png.json
-                            if sly_image.has_valid_ext(new_name):
-                                name = new_name
-                                rimage_info[ApiField.NAME] = name
-                            else:
-                                raise RuntimeError(
-                                    "Something wrong with photo context filenames.\
-                                                    Please, contact support"
-                                )
-
-                        rimage_id = rimage_info[ApiField.ID]
-
-                        path_img = os.path.join(related_images_path, name)
-                        path_json = os.path.join(related_images_path, name + ".json")
-
-                        try:
-                            api.pointcloud.download_related_image(rimage_id, path_img)
-                        except Exception as e:
-                            logger.info(
-                                "INFO FOR DEBUGGING",
-                                extra={
-                                    "project_id": project_id,
-                                    "dataset_id": dataset.id,
-                                    "pointcloud_id": pointcloud_id,
-                                    "pointcloud_name": pointcloud_name,
-                                    "rimage_id": rimage_id,
-                                    "path_img": path_img,
-                                },
-                            )
-                            raise e
-                        dump_json_file(rimage_info, path_json)
-
                 pointcloud_file_path = pointcloud_file_path if download_items else None
                 pointcloud_info = pointcloud_info._asdict() if download_pointclouds_info else None
                 try:
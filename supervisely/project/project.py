@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 import shutil
+import threading
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import os
 from enum import Enum
 from typing import List, Dict, Optional, NamedTuple, Tuple, Union, Callable, Generator
@@ -27,12 +29,14 @@ from supervisely.io.fs import (
     get_subdirs,
     dir_exists,
     dir_empty,
+    file_exists,
+    remove_dir,
     silent_remove,
 )
 from supervisely.io.json import dump_json_file, load_json_file
 from supervisely.project.project_meta import ProjectMeta
 from supervisely.task.progress import Progress
-from supervisely._utils import batched, is_development, abs_url
+from supervisely._utils import batched, concurrent_map, is_development, abs_url
 from supervisely.io.fs import ensure_base_path
 from supervisely.api.api import Api
 from supervisely.sly_logger import logger
@@ -2235,6 +2239,7 @@ class Project:
         only_image_tags: Optional[bool] = False,
         save_image_info: Optional[bool] = False,
         save_images: bool = True,
+        num_workers: Optional[int] = 1,
     ) -> None:
         """
         Download project from Supervisely to the given directory.
@@ -2261,6 +2266,8 @@ class Project:
         :type save_image_info: :class:`bool`, optional
         :param save_images: Download images or not.
         :type save_images: :class:`bool`, optional
+        :param num_workers: Number of worker threads. Datasets are downloaded in parallel, images and annotations of a batch are requested concurrently. With 1 worker all requests are made sequentially.
+        :type num_workers: :class:`int`, optional
         :return: None
         :rtype: NoneType
         :Usage example:
@@ -2297,6 +2304,7 @@ class Project:
             only_image_tags=only_image_tags,
             save_image_info=save_image_info,
             save_images=save_images,
+            num_workers=num_workers,
         )
 
     @staticmethod
@@ -2307,6 +2315,7 @@ class Project:
         project_name: Optional[str] = None,
         log_progress: Optional[bool] = True,
         progress_cb: Optional[Union[tqdm, Callable]] = None,
+        num_workers: Optional[int] = 1,
     ) -> Tuple[int, str]:
         """
         Uploads project to Supervisely from the given directory.
@@ -2323,6 +2332,8 @@ class Project:
         :type log_progress: :class:`bool`, optional
         :param progress_cb: Function for tracking download progress.
         :type progress_cb: tqdm or callable, optional
+        :param num_workers: Number of datasets uploaded in parallel.
+        :type num_workers: :class:`int`, optional
         :return: Project ID and name. It is recommended to check that returned project name coincides with provided project name.
         :rtype: :class:`int`, :class:`str`
         :Usage example:
@@ -2357,6 +2368,7 @@ class Project:
             project_name=project_name,
             log_progress=log_progress,
             progress_cb=progress_cb,
+            num_workers=num_workers,
         )
 
 
@@ -2402,6 +2414,21 @@ def read_single_project(dir: str, project_class: Optional[Project] = Project) ->
     return project_fs
 
 
+def _synchronized_progress_cb(progress_cb):
+    """
+    Wrap progress callback with a lock, so it can be shared between worker threads.
+    """
+    if progress_cb is None:
+        return None
+    lock = threading.Lock()
+
+    def _progress_cb(count):
+        with lock:
+            progress_cb(count)
+
+    return _progress_cb
+
+
 def _download_project(
     api,
     project_id,
@@ -2413,6 +2440,7 @@ def _download_project(
     save_image_info=False,
     save_images=True,
     progress_cb=None,
+    num_workers=1,
 ):
     dataset_ids = set(dataset_ids) if (dataset_ids is not None) else None
     project_fs = Project(dest_dir, OpenMode.CREATE)
@@ -2422,13 +2450,48 @@ def _download_project(
     if only_image_tags is True:
         id_to_tagmeta = meta.tag_metas.get_id_mapping()
 
+    datasets = []
     for dataset_info in api.dataset.get_list(project_id):
-        dataset_id = dataset_info.id
-        if dataset_ids is not None and dataset_id not in dataset_ids:
+        if dataset_ids is not None and dataset_info.id not in dataset_ids:
             continue
+        datasets.append((dataset_info, project_fs.create_dataset(dataset_info.name)))
+
+    if num_workers > 1:
+        progress_cb = _synchronized_progress_cb(progress_cb)
+
+    def _download_batch_data(dataset_id, batch):
+        image_ids = [image_info.id for image_info in batch]
+
+        # with several workers image bytes are downloaded while annotations are requested
+        # in the current thread, with one worker requests are made one by one
+        imgs_future = None
+        if save_images and num_workers > 1:
+            imgs_future = executor.submit(api.image.download_bytes, dataset_id, image_ids)
+
+        # download annotations in json format
+        if only_image_tags is False:
+            ann_infos = api.annotation.download_batch(dataset_id, image_ids)
+            ann_jsons = [ann_info.annotation for ann_info in ann_infos]
+        else:
+            ann_jsons = []
+            for image_info in batch:
+                tags = TagCollection.from_api_response(
+                    image_info.tags, meta.tag_metas, id_to_tagmeta
+                )
+                tmp_ann = Annotation(img_size=(image_info.height, image_info.width), img_tags=tags)
+                ann_jsons.append(tmp_ann.to_json())
 
-        dataset_fs = project_fs.create_dataset(dataset_info.name)
-        images = api.image.get_list(dataset_id)
+        if imgs_future is not None:
+            batch_imgs_bytes = imgs_future.result()
+        elif save_images:
+            batch_imgs_bytes = api.image.download_bytes(dataset_id, image_ids)
+        else:
+            batch_imgs_bytes = [None] * len(image_ids)
+        return batch_imgs_bytes, ann_jsons
+
+    def _download_dataset_items(dataset):
+        dataset_info, dataset_fs = dataset
+        images = api.image.get_list(dataset_info.id)
 
         ds_progress = None
         if log_progress:
@@ -2437,36 +2500,17 @@ def _download_project(
                 total_cnt=len(images),
             )
 
-        for batch in batched(images, batch_size):
-            image_ids = [image_info.id for image_info in batch]
-            image_names = [image_info.name for image_info in batch]
-
-            # download images in numpy format
-            if save_images:
-                batch_imgs_bytes = api.image.download_bytes(dataset_id, image_ids)
-            else:
-                batch_imgs_bytes = [None] * len(image_ids)
-
-            # download annotations in json format
-            if only_image_tags is False:
-                ann_infos = api.annotation.download_batch(dataset_id, image_ids)
-                ann_jsons = [ann_info.annotation for ann_info in ann_infos]
-            else:
-                ann_jsons = []
-                for image_info in batch:
-                    tags = TagCollection.from_api_response(
-                        image_info.tags, meta.tag_metas, id_to_tagmeta
-                    )
-                    tmp_ann = Annotation(
-                        img_size=(image_info.height, image_info.width), img_tags=tags
-                    )
-                    ann_jsons.append(tmp_ann.to_json())
-
-            for img_info, name, img_bytes, ann in zip(
-                batch, image_names, batch_imgs_bytes, ann_jsons
-            ):
+        # next batch is downloaded while the current one is written to disk
+        batches = list(batched(images, batch_size))
+        batches_data = concurrent_map(
+            lambda batch: _download_batch_data(dataset_info.id, batch),
+            batches,
+            num_workers=min(num_workers, 2),
+        )
+        for batch, (batch_imgs_bytes, ann_jsons) in zip(batches, batches_data):
+            for img_info, img_bytes, ann in zip(batch, batch_imgs_bytes, ann_jsons):
                 dataset_fs.add_item_raw_bytes(
-                    item_name=name,
+                    item_name=img_info.name,
                     item_raw_bytes=img_bytes if save_images is True else None,
                     ann=ann,
                     img_info=img_info if save_image_info is True else None,
@@ -2477,6 +2521,10 @@ def _download_project(
             if progress_cb is not None:
                 progress_cb(len(batch))
 
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for _ in concurrent_map(_download_dataset_items, datasets, num_workers):
+            pass
+
 
 def upload_project(
     dir: str,
@@ -2485,114 +2533,123 @@ def upload_project(
     project_name: Optional[str] = None,
     log_progress: Optional[bool] = True,
     progress_cb: Optional[Union[tqdm, Callable]] = None,
+    num_workers: Optional[int] = 1,
 ) -> Tuple[int, str]:
     project_fs = read_single_project(dir)
     if project_name is None:
         project_name = project_fs.name
 
-    external_progress_cb = True
-    if progress_cb is None:
-        external_progress_cb = False
-
     if api.project.exists(workspace_id, project_name):
         project_name = api.project.get_free_name(workspace_id, project_name)
 
     project = api.project.create(workspace_id, project_name, change_name_if_conflict=True)
     api.project.update_meta(project.id, project_fs.meta.to_json())
 
-    for dataset_fs in project_fs.datasets:
-        dataset = api.dataset.create(project.id, dataset_fs.name)
-
-        dataset_fs: Dataset
-
-        names, img_paths, ann_paths, img_infos = [], [], [], []
-        for item_name in dataset_fs:
-            img_path, ann_path = dataset_fs.get_item_paths(item_name)
-            img_info_path = dataset_fs.get_img_info_path(item_name)
-
-            names.append(item_name)
-            img_paths.append(img_path)
-            ann_paths.append(ann_path)
-
-            if os.path.isfile(img_info_path):
-                img_infos.append(dataset_fs.get_image_info(item_name=item_name))
+    # datasets are created in the order of the local project, their items are uploaded in parallel
+    datasets = [
+        (dataset_fs, api.dataset.create(project.id, dataset_fs.name))
+        for dataset_fs in project_fs.datasets
+    ]
+    if num_workers > 1:
+        progress_cb = _synchronized_progress_cb(progress_cb)
+
+    for _ in concurrent_map(
+        lambda dataset: _upload_dataset_items(api, *dataset, log_progress, progress_cb),
+        datasets,
+        num_workers,
+    ):
+        pass
 
-        img_paths = list(filter(lambda x: os.path.isfile(x), img_paths))
-        ann_paths = list(filter(lambda x: os.path.isfile(x), ann_paths))
+    return project.id, project.name
 
-        if external_progress_cb is False:
-            progress_cb = None
 
-        if log_progress and progress_cb is None:
-            ds_progress = Progress(
-                "Uploading images to dataset {!r}".format(dataset.name),
-                total_cnt=len(names),
+def _upload_dataset_items(
+    api: Api,
+    dataset_fs: Dataset,
+    dataset,
+    log_progress: bool = True,
+    progress_cb: Optional[Union[tqdm, Callable]] = None,
+):
+    names, img_paths, ann_paths, img_infos = [], [], [], []
+    for item_name in dataset_fs:
+        img_path, ann_path = dataset_fs.get_item_paths(item_name)
+        img_info_path = dataset_fs.get_img_info_path(item_name)
+
+        names.append(item_name)
+        img_paths.append(img_path)
+        ann_paths.append(ann_path)
+
+        if os.path.isfile(img_info_path):
+            img_infos.append(dataset_fs.get_image_info(item_name=item_name))
+
+    img_paths = list(filter(lambda x: os.path.isfile(x), img_paths))
+    ann_paths = list(filter(lambda x: os.path.isfile(x), ann_paths))
+
+    img_progress_cb = progress_cb
+    if log_progress and progress_cb is None:
+        ds_progress = Progress(
+            "Uploading images to dataset {!r}".format(dataset.name),
+            total_cnt=len(names),
+        )
+        img_progress_cb = ds_progress.iters_done_report
+
+    if len(img_paths) != 0:
+        uploaded_img_infos = api.image.upload_paths(dataset.id, names, img_paths, img_progress_cb)
+    elif len(img_paths) == 0 and len(img_infos) != 0:
+        # uploading links and hashes (the code from api.image.upload_ids)
+        img_metas = [{}] * len(names)
+        links, links_names, links_order, links_metas = [], [], [], []
+        hashes, hashes_names, hashes_order, hashes_metas = [], [], [], []
+        dataset_id = dataset.id
+        for idx, (name, info, meta) in enumerate(zip(names, img_infos, img_metas)):
+            if info.link is not None:
+                links.append(info.link)
+                links_names.append(name)
+                links_order.append(idx)
+                links_metas.append(meta)
+            else:
+                hashes.append(info.hash)
+                hashes_names.append(name)
+                hashes_order.append(idx)
+                hashes_metas.append(meta)
+
+        result = [None] * len(names)
+        if len(links) > 0:
+            res_infos_links = api.image.upload_links(
+                dataset_id,
+                links_names,
+                links,
+                img_progress_cb,
+                metas=links_metas,
             )
-            progress_cb = ds_progress.iters_done_report
-
-        if len(img_paths) != 0:
-            uploaded_img_infos = api.image.upload_paths(dataset.id, names, img_paths, progress_cb)
-        elif len(img_paths) == 0 and len(img_infos) != 0:
-            # uploading links and hashes (the code from api.image.upload_ids)
-            img_metas = [{}] * len(names)
-            links, links_names, links_order, links_metas = [], [], [], []
-            hashes, hashes_names, hashes_order, hashes_metas = [], [], [], []
-            dataset_id = dataset.id
-            for idx, (name, info, meta) in enumerate(zip(names, img_infos, img_metas)):
-                if info.link is not None:
-                    links.append(info.link)
-                    links_names.append(name)
-                    links_order.append(idx)
-                    links_metas.append(meta)
-                else:
-                    hashes.append(info.hash)
-                    hashes_names.append(name)
-                    hashes_order.append(idx)
-                    hashes_metas.append(meta)
-
-            result = [None] * len(names)
-            if len(links) > 0:
-                res_infos_links = api.image.upload_links(
-                    dataset_id,
-                    links_names,
-                    links,
-                    progress_cb,
-                    metas=links_metas,
-                )
-                for info, pos in zip(res_infos_links, links_order):
-                    result[pos] = info
-
-            if len(hashes) > 0:
-                res_infos_hashes = api.image.upload_hashes(
-                    dataset_id,
-                    hashes_names,
-                    hashes,
-                    progress_cb,
-                    metas=hashes_metas,
-                )
-                for info, pos in zip(res_infos_hashes, hashes_order):
-                    result[pos] = info
+            for info, pos in zip(res_infos_links, links_order):
+                result[pos] = info
 
-            uploaded_img_infos = result
-        else:
-            raise ValueError(
-                "Cannot upload Project: img_paths is empty and img_infos_paths is empty"
+        if len(hashes) > 0:
+            res_infos_hashes = api.image.upload_hashes(
+                dataset_id,
+                hashes_names,
+                hashes,
+                img_progress_cb,
+                metas=hashes_metas,
             )
+            for info, pos in zip(res_infos_hashes, hashes_order):
+                result[pos] = info
 
-        image_ids = [img_info.id for img_info in uploaded_img_infos]
+        uploaded_img_infos = result
+    else:
+        raise ValueError("Cannot upload Project: img_paths is empty and img_infos_paths is empty")
 
-        if external_progress_cb is False:
-            progress_cb = None
+    image_ids = [img_info.id for img_info in uploaded_img_infos]
 
-        if log_progress and progress_cb is None:
-            ds_progress = Progress(
-                "Uploading annotations to dataset {!r}".format(dataset.name),
-                total_cnt=len(img_paths),
-            )
-            progress_cb = ds_progress.iters_done_report
-        api.annotation.upload_paths(image_ids, ann_paths, progress_cb)
-
-    return project.id, project.name
+    ann_progress_cb = progress_cb
+    if log_progress and progress_cb is None:
+        ds_progress = Progress(
+            "Uploading annotations to dataset {!r}".format(dataset.name),
+            total_cnt=len(img_paths),
+        )
+        ann_progress_cb = ds_progress.iters_done_report
+    api.annotation.upload_paths(image_ids, ann_paths, ann_progress_cb, dataset_id=dataset.id)
 
 
 def download_project(
@@ -2607,6 +2664,7 @@ def download_project(
     only_image_tags: Optional[bool] = False,
     save_image_info: Optional[bool] = False,
     save_images: bool = True,
+    num_workers: Optional[int] = 1,
 ) -> None:
     """
     Download image project to the local directory.
@@ -2633,6 +2691,8 @@ def download_project(
     :type save_image_info, bool, optional
     :param save_images: Include images in the download.
     :type save_images, bool, optional
+    :param num_workers: Number of worker threads. Datasets are downloaded in parallel, images and annotations of a batch are requested concurrently and written to disk while the next batch is downloading. With 1 worker all requests are made sequentially.
+    :type num_workers: int, optional
 
     :return: None.
     :rtype: NoneType
@@ -2682,6 +2742,7 @@ def download_project(
             save_image_info=save_image_info,
             save_images=save_images,
             progress_cb=progress_cb,
+            num_workers=num_workers,
         )
     else:
         _download_project_optimized(
@@ -2694,6 +2755,7 @@ def download_project(
             only_image_tags=only_image_tags,
             save_image_info=save_image_info,
             save_images=save_images,
+            num_workers=num_workers,
         )
 
 
@@ -2707,6 +2769,8 @@ def _download_project_optimized(
     only_image_tags=False,
     save_image_info=False,
     save_images=True,
+    validate_images=False,
+    num_workers=1,
 ):
     project_info = api.project.get_info_by_id(project_id)
     project_id = project_info.id
@@ -2714,25 +2778,37 @@ def _download_project_optimized(
     project_fs = Project(project_dir, OpenMode.CREATE)
     meta = ProjectMeta.from_json(api.project.get_meta(project_id))
     project_fs.set_meta(meta)
+
+    datasets = []
     for dataset_info in api.dataset.get_list(project_id):
-        dataset_name = dataset_info.name
-        dataset_id = dataset_info.id
-        need_download = True
-        if datasets_whitelist is not None and dataset_id not in datasets_whitelist:
-            need_download = False
-        if need_download is True:
-            dataset = project_fs.create_dataset(dataset_name)
-            _download_dataset(
-                api,
-                dataset,
-                dataset_id,
-                cache=cache,
-                progress_cb=progress_cb,
-                project_meta=meta,
-                only_image_tags=only_image_tags,
-                save_image_info=save_image_info,
-                save_images=save_images,
-            )
+        if datasets_whitelist is not None and dataset_info.id not in datasets_whitelist:
+            continue
+        datasets.append((project_fs.create_dataset(dataset_info.name), dataset_info.id))
+
+    if num_workers > 1:
+        progress_cb = _synchronized_progress_cb(progress_cb)
+
+    # workers are shared by datasets downloaded in parallel, so the total number of
+    # requests in flight is limited by num_workers
+    datasets_workers = max(min(num_workers, len(datasets)), 1)
+    images_workers = max(num_workers // datasets_workers, 1)
+    for _ in concurrent_map(
+        lambda dataset: _download_dataset(
+            api,
+            *dataset,
+            cache=cache,
+            progress_cb=progress_cb,
+            project_meta=meta,
+            only_image_tags=only_image_tags,
+            save_image_info=save_image_info,
+            save_images=save_images,
+            validate_images=validate_images,
+            num_workers=images_workers,
+        ),
+        datasets,
+        datasets_workers,
+    ):
+        pass
 
 
 def _split_images_by_cache(images, cache):
@@ -2774,6 +2850,8 @@ def _download_dataset(
     only_image_tags=False,
     save_image_info=False,
     save_images=True,
+    validate_images=False,
+    num_workers=1,
 ):
     images = api.image.get_list(dataset_id)
     images_to_download = images
@@ -2851,43 +2929,312 @@ def _download_dataset(
                 )
             )
 
-        # download annotations
-        if only_image_tags is False:
-            ann_info_list = api.annotation.download_batch(dataset_id, img_ids, progress_cb)
-            img_name_to_ann = {ann.image_id: ann.annotation for ann in ann_info_list}
-        else:
-            img_name_to_ann = {}
-            for image_info in images_to_download:
-                tags = TagCollection.from_api_response(
-                    image_info.tags, project_meta.tag_metas, id_to_tagmeta
-                )
-                tmp_ann = Annotation(img_size=(image_info.height, image_info.width), img_tags=tags)
-                img_name_to_ann[image_info.id] = tmp_ann.to_json()
-            if progress_cb is not None:
-                progress_cb(len(images_to_download))
-
-        # download images and write to dataset
-        for img_info_batch in batched(images_to_download):
-            if save_images:
-                images_ids_batch = [image_info.id for image_info in img_info_batch]
-                images_nps = api.image.download_nps(
-                    dataset_id, images_ids_batch, progress_cb=progress_cb
+        # download annotations, images are downloaded at the same time in a separate thread
+        imgs_executor = None
+        if save_images and num_workers > 1:
+            imgs_executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            if imgs_executor is not None:
+                imgs_future = imgs_executor.submit(
+                    api.image.download_paths,
+                    dataset_id,
+                    img_ids,
+                    img_paths,
+                    progress_cb=progress_cb,
+                    num_workers=num_workers,
                 )
+            if only_image_tags is False:
+                ann_info_list = api.annotation.download_batch(dataset_id, img_ids, progress_cb)
+                img_name_to_ann = {ann.image_id: ann.annotation for ann in ann_info_list}
             else:
-                images_nps = [None] * len(img_info_batch)
-            for index, image_np in enumerate(images_nps):
-                img_info = img_info_batch[index]
-                image_name = _maybe_append_image_extension(img_info.name, img_info.ext)
-
-                dataset.add_item_np(
-                    item_name=image_name,
-                    img=image_np if save_images is True else None,
-                    ann=img_name_to_ann[img_info.id],
-                    img_info=img_info if save_image_info is True else None,
-                )
+                img_name_to_ann = {}
+                for image_info in images_to_download:
+                    tags = TagCollection.from_api_response(
+                        image_info.tags, project_meta.tag_metas, id_to_tagmeta
+                    )
+                    tmp_ann = Annotation(
+                        img_size=(image_info.height, image_info.width), img_tags=tags
+                    )
+                    img_name_to_ann[image_info.id] = tmp_ann.to_json()
+                if progress_cb is not None:
+                    progress_cb(len(images_to_download))
+
+            # download original image bytes straight to the dataset items directory,
+            # images are not decoded unless validation is requested
+            if imgs_executor is not None:
+                imgs_future.result()
+            elif save_images:
+                api.image.download_paths(dataset_id, img_ids, img_paths, progress_cb=progress_cb)
+        finally:
+            # images are never written to the dataset after an error is raised
+            if imgs_executor is not None:
+                imgs_executor.shutdown(wait=True)
+        for img_info, img_path in zip(images_to_download, img_paths):
+            if save_images and validate_images:
+                dataset._validate_added_item_or_die(img_path)
+            dataset.add_item_file(
+                item_name=_maybe_append_image_extension(img_info.name, img_info.ext),
+                item_path=img_path if save_images is True else None,
+                ann=img_name_to_ann[img_info.id],
+                _validate_item=False,
+                item_info=img_info if save_image_info is True else None,
+            )
         if cache is not None and save_images is True:
             img_hashes = [img_info.hash for img_info in images_to_download]
             cache.write_objects(img_paths, img_hashes)
 
 
+SYNC_MANIFEST_FILE_NAME = "sync_manifest.json"
+
+
+def sync_project(
+    api: Api,
+    project_id: int,
+    dest_dir: str,
+    dataset_ids: Optional[List[int]] = None,
+    log_progress: Optional[bool] = False,
+    batch_size: Optional[int] = 50,
+    progress_cb: Optional[Union[tqdm, Callable]] = None,
+    save_image_info: Optional[bool] = False,
+    num_workers: Optional[int] = 1,
+) -> None:
+    """
+    Incrementally synchronize local copy of image project with Supervisely.
+    Every dataset directory keeps a manifest with image ID, hash, image ``updated_at``
+    and annotation ``updated_at`` of every synchronized item. Only new or changed images
+    are downloaded, items removed from the server are deleted locally. Annotation infos
+    of the other items are requested in batches to compare their ``updated_at``, and only
+    changed annotations are saved.
+    Manifest is saved after every batch, so an interrupted sync continues from the last
+    finished batch. The first sync into an empty directory downloads the whole project.
+
+    :param api: Supervisely API address and token.
+    :type api: Api
+    :param project_id: Project ID to synchronize.
+    :type project_id: int
+    :param dest_dir: Local project directory. Created if it does not exist.
+    :type dest_dir: str
+    :param dataset_ids: Specified list of Dataset IDs which will be synchronized. Other local datasets are not changed.
+    :type dataset_ids: list(int), optional
+    :param log_progress: Show synchronization logs in the output.
+    :type log_progress: bool, optional
+    :param batch_size: Number of items downloaded between manifest checkpoints.
+    :type batch_size: int, optional
+    :param progress_cb: Function for tracking synchronization progress (in items).
+    :type progress_cb: tqdm or callable, optional
+    :param save_image_info: Save images infos.
+    :type save_image_info: bool, optional
+    :param num_workers: Number of datasets synchronized in parallel.
+    :type num_workers: int, optional
+    :return: None
+    :rtype: NoneType
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+
+        api = sly.Api.from_env()
+
+        # the first call downloads the whole project, next ones download only changes
+        sly.sync_project(api, 17732, "/data/lemons", log_progress=True)
+        project_fs = sly.Project("/data/lemons", sly.OpenMode.READ)
+    """
+    meta = ProjectMeta.from_json(api.project.get_meta(project_id))
+    if not dir_exists(dest_dir) or dir_empty(dest_dir):
+        project_fs = Project(dest_dir, OpenMode.CREATE)
+        project_fs.set_meta(meta)
+    else:
+        dump_json_file(meta.to_json(), os.path.join(dest_dir, "meta.json"), indent=4)
+
+    datasets = api.dataset.get_list(project_id)
+    if dataset_ids is not None:
+        dataset_ids = set(dataset_ids)
+        datasets = [dataset_info for dataset_info in datasets if dataset_info.id in dataset_ids]
+    else:
+        # remove local datasets created by previous syncs and removed from the server
+        remote_names = set(dataset_info.name for dataset_info in datasets)
+        for ds_name in get_subdirs(dest_dir):
+            ds_dir = os.path.join(dest_dir, ds_name)
+            if ds_name not in remote_names and file_exists(
+                os.path.join(ds_dir, SYNC_MANIFEST_FILE_NAME)
+            ):
+                logger.info(f"Dataset {ds_name!r} was removed from the server, removing local copy")
+                remove_dir(ds_dir)
+
+    if num_workers > 1:
+        progress_cb = _synchronized_progress_cb(progress_cb)
+
+    for _ in concurrent_map(
+        lambda dataset_info: _sync_dataset(
+            api,
+            dataset_info,
+            Dataset(os.path.join(dest_dir, dataset_info.name), OpenMode.CREATE),
+            log_progress=log_progress,
+            batch_size=batch_size,
+            progress_cb=progress_cb,
+            save_image_info=save_image_info,
+        ),
+        datasets,
+        num_workers,
+    ):
+        pass
+
+
+def _load_sync_manifest(manifest_path, dataset_id):
+    if not file_exists(manifest_path):
+        return {}
+    try:
+        manifest = load_json_file(manifest_path)
+    except ValueError:
+        logger.warn(f"Sync manifest {manifest_path!r} is corrupted and will be ignored")
+        return {}
+    if manifest.get("dataset_id") != dataset_id:
+        return {}
+    return manifest.get("items", {})
+
+
+def _dump_sync_manifest(manifest_path, dataset_id, items):
+    # write to temporary file first, so interrupted write never leaves corrupted manifest
+    tmp_path = manifest_path + ".tmp"
+    dump_json_file({"dataset_id": dataset_id, "items": items}, tmp_path)
+    os.replace(tmp_path, manifest_path)
+
+
+def _sync_dataset(
+    api: Api,
+    dataset_info,
+    dataset_fs: Dataset,
+    log_progress=False,
+    batch_size=50,
+    progress_cb=None,
+    save_image_info=False,
+):
+    dataset_id = dataset_info.id
+    manifest_path = os.path.join(dataset_fs.directory, SYNC_MANIFEST_FILE_NAME)
+    manifest = _load_sync_manifest(manifest_path, dataset_id)
+
+    images = api.image.get_list(dataset_id)
+    name_to_image = {
+        _maybe_append_image_extension(img_info.name, img_info.ext): img_info for img_info in images
+    }
+
+    def _item_paths(item_name):
+        return (
+            os.path.join(dataset_fs.item_dir, item_name),
+            os.path.join(dataset_fs.ann_dir, item_name + ANN_EXT),
+            os.path.join(dataset_fs.item_info_dir, item_name + ANN_EXT),
+        )
+
+    # remove items which are not on the server anymore (including leftovers of interrupted syncs)
+    local_names = set(os.path.basename(path) for path in list_files(dataset_fs.item_dir))
+    local_names.update(
+        os.path.basename(path)[: -len(ANN_EXT)] for path in list_files(dataset_fs.ann_dir, [ANN_EXT])
+    )
+    local_names.update(manifest.keys())
+    removed_names = [name for name in local_names if name not in name_to_image]
+    for item_name in removed_names:
+        for path in _item_paths(item_name):
+            silent_remove(path)
+        manifest.pop(item_name, None)
+
+    # compare remote items with manifest, annotations of items with unchanged images are
+    # compared by their updated_at and saved from the same response if they were changed
+    images_to_download, items_to_check = [], []
+    for item_name, img_info in name_to_image.items():
+        img_path = _item_paths(item_name)[0]
+        entry = manifest.get(item_name)
+        if (
+            entry is None
+            or entry["id"] != img_info.id
+            or entry["hash"] != img_info.hash
+            or not file_exists(img_path)
+        ):
+            images_to_download.append(item_name)
+        else:
+            items_to_check.append(item_name)
+
+    logger.info(
+        f"Sync dataset: {dataset_info.name}",
+        extra={
+            "total": len(name_to_image),
+            "to download": len(images_to_download),
+            "annotations to check": len(items_to_check),
+            "removed": len(removed_names),
+        },
+    )
+    _dump_sync_manifest(manifest_path, dataset_id, manifest)
+
+    ds_progress = None
+    if log_progress:
+        ds_progress = Progress(
+            "Syncing dataset: {!r}".format(dataset_info.name),
+            total_cnt=len(name_to_image),
+        )
+
+    def _save_items(items, ann_infos):
+        for (item_name, with_image), ann_info in zip(items, ann_infos):
+            img_info = name_to_image[item_name]
+            dataset_fs.add_item_file(
+                item_name,
+                item_path=_item_paths(item_name)[0] if with_image else None,
+                ann=ann_info.annotation,
+                _validate_item=False,
+                item_info=img_info if save_image_info is True else None,
+            )
+            manifest[item_name] = {
+                "id": img_info.id,
+                "hash": img_info.hash,
+                "updated_at": img_info.updated_at,
+                "ann_updated_at": ann_info.updated_at,
+            }
+
+    def _report_progress(count):
+        if log_progress:
+            ds_progress.iters_done_report(count)
+        if progress_cb is not None:
+            progress_cb(count)
+
+    changed_anns_cnt = 0
+    for batch in batched(items_to_check, batch_size):
+        ann_infos = api.annotation.download_batch(
+            dataset_id, [name_to_image[item_name].id for item_name in batch]
+        )
+        changed_items, changed_infos = [], []
+        for item_name, ann_info in zip(batch, ann_infos):
+            entry = manifest[item_name]
+            _, ann_path, info_path = _item_paths(item_name)
+            if (
+                entry.get("ann_updated_at") != ann_info.updated_at
+                or entry["updated_at"] != name_to_image[item_name].updated_at
+                or not file_exists(ann_path)
+                or (save_image_info and not file_exists(info_path))
+            ):
+                changed_items.append((item_name, False))
+                changed_infos.append(ann_info)
+        if len(changed_items) > 0:
+            _save_items(changed_items, changed_infos)
+            _dump_sync_manifest(manifest_path, dataset_id, manifest)
+            changed_anns_cnt += len(changed_items)
+        _report_progress(len(batch))
+
+    for batch in batched(images_to_download, batch_size):
+        img_ids = [name_to_image[item_name].id for item_name in batch]
+        api.image.download_paths(
+            dataset_id, img_ids, [_item_paths(item_name)[0] for item_name in batch]
+        )
+        ann_infos = api.annotation.download_batch(dataset_id, img_ids)
+        _save_items([(item_name, True) for item_name in batch], ann_infos)
+        _dump_sync_manifest(manifest_path, dataset_id, manifest)
+        _report_progress(len(batch))
+
+    logger.info(
+        f"Dataset {dataset_info.name!r} is synchronized",
+        extra={
+            "downloaded": len(images_to_download),
+            "updated annotations": changed_anns_cnt,
+            "unchanged": len(items_to_check) - changed_anns_cnt,
+        },
+    )
+
 DatasetDict = Project.DatasetDict
@@ -2,12 +2,14 @@
 """Functions for processing videos"""
 
 from __future__ import annotations
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Optional, Iterator
 
 import os
+import cv2
+import numpy as np
 from supervisely import logger as default_logger
 from supervisely.io.fs import get_file_name, get_file_ext
-from supervisely._utils import rand_str, is_development, abs_url
+from supervisely._utils import rand_str, is_development, abs_url, prefetch_iterator
 
 
 # Do NOT use directly for video extension validation. Use is_valid_ext() /  has_valid_ext() below instead.
@@ -128,6 +130,65 @@ def get_image_size_and_frames_count(path: str) -> Tuple[Tuple[int, int], int]:
     return img_size, vlength
 
 
+def _decode_frames(path: str, start_frame: int, frames_count: Optional[int]) -> Iterator[np.ndarray]:
+    vidcap = cv2.VideoCapture(path)
+    try:
+        if not vidcap.isOpened():
+            raise VideoReadException(f"Can not open video file: {path}")
+        vidcap.set(cv2.CAP_PROP_ORIENTATION_AUTO, 1)
+        if start_frame > 0:
+            # decoder seeks to the closest preceding key frame and decodes up to the requested one,
+            # frames before it are skipped without color conversion if seeking is not supported
+            if not vidcap.set(cv2.CAP_PROP_POS_FRAMES, start_frame):
+                for _ in range(start_frame):
+                    if not vidcap.grab():
+                        return
+        count = 0
+        while frames_count is None or count < frames_count:
+            success, frame = vidcap.read()
+            if not success:
+                break
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            count += 1
+    finally:
+        vidcap.release()
+
+
+def read_frames(
+    path: str,
+    start_frame: Optional[int] = 0,
+    frames_count: Optional[int] = None,
+    buffer_size: Optional[int] = 8,
+) -> Iterator[np.ndarray]:
+    """
+    Decodes frames of the Video file one by one without writing them to disk.
+    Frames are decoded in a background thread, at most ``buffer_size`` decoded frames are kept in memory.
+
+    :param path: Path to Video file.
+    :type path: str
+    :param start_frame: Index of the first frame.
+    :type start_frame: int, optional
+    :param frames_count: Number of frames to read. All frames till the end of the video are read by default.
+    :type frames_count: int, optional
+    :param buffer_size: Number of frames decoded ahead.
+    :type buffer_size: int, optional
+    :raises: :class:`VideoReadException` if video file can not be opened
+    :return: Generator of frames in RGB format
+    :rtype: :class:`Iterator[np.ndarray]`
+    :Usage example:
+
+     .. code-block:: python
+
+        import supervisely as sly
+
+        video_path = "/home/admin/work/videos/Cars/ds0/video/6x.mp4"
+        for frame in sly.video.read_frames(video_path, start_frame=10, frames_count=5):
+            print(frame.shape)
+            # Output: (720, 1280, 3)
+    """
+    return prefetch_iterator(_decode_frames(path, start_frame, frames_count), buffer_size)
+
+
 def validate_format(path: str) -> None:
     """
     Raise error if Video file from given path couldn't be read or file extension is not supported.
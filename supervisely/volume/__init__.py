@@ -16,3 +16,7 @@ from .volume import (
     read_nrrd_serie_volume,
     read_nrrd_serie_volume_np,
 )
+
+from supervisely._utils import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
@@ -0,0 +1,107 @@
+# Cold start benchmark: time of "import supervisely" and of the first access
+# to public names in fresh interpreters. Also checks that lazy imports keep every
+# public name and submodule (e.g. sly.collection.key_indexed_collection) accessible.
+# Usage: python tests/import_time.py [number of runs]
+import statistics
+import subprocess
+import sys
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+SCENARIOS = {
+    "import supervisely": "import supervisely as sly",
+    "sly.Annotation": "import supervisely as sly; sly.Annotation",
+    "sly.Api": "import supervisely as sly; sly.Api",
+    "sly.Application": "import supervisely as sly; sly.Application",
+    "all public names": "from supervisely import *",
+}
+
+# modules which should not be loaded by "import supervisely"
+HEAVY_MODULES = ["fastapi", "pandas", "SimpleITK", "imgaug", "grpc", "pkg_resources", "requests"]
+
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(code):
+    times, loaded = [], ""
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        loaded = out[1] if len(out) > 1 else ""
+    return statistics.median(times), loaded
+
+
+for name, code in SCENARIOS.items():
+    elapsed, loaded = measure(code)
+    print(f"{name:<20} {elapsed:7.3f} sec   heavy modules: {loaded or '-'}")
+
+
+# every subpackage is checked in a fresh interpreter, so its submodules are not imported
+# by other names before; submodules may fail to import because of missing optional
+# dependencies, but they must never be missing as attributes
+PACKAGES_LIST = """
+import pkgutil
+import supervisely as sly
+
+names = set(dir(sly)) | {m.name for m in pkgutil.iter_modules(sly.__path__) if not m.name.startswith("_")}
+print(" ".join(sorted(name for name in names if not name.startswith("__"))))
+"""
+
+ATTRIBUTES_CHECK = """
+import pkgutil, types
+import supervisely as sly
+
+try:
+    value = getattr(sly, {name!r})
+except ImportError:
+    value = None
+except AttributeError as e:
+    print(e)
+    value = None
+if (
+    isinstance(value, types.ModuleType)
+    and hasattr(value, "__path__")
+    and value.__name__.startswith("supervisely.")
+):
+    for submodule in pkgutil.iter_modules(value.__path__):
+        if submodule.name.startswith("_"):
+            continue
+        try:
+            getattr(value, submodule.name)
+        except AttributeError as e:
+            print(e)
+        except Exception:
+            pass
+"""
+
+
+def check_attributes():
+    names = subprocess.run(
+        [sys.executable, "-c", PACKAGES_LIST], check=True, capture_output=True, text=True
+    ).stdout.split()
+    missing = []
+    for name in names:
+        out = subprocess.run(
+            [sys.executable, "-c", ATTRIBUTES_CHECK.format(name=name)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        if out:
+            missing.append(out)
+    assert len(missing) == 0, "Not accessible names:\n" + "\n".join(missing)
+    print(f"{len(names)} public names and their submodules are accessible")
+
+
+check_attributes()